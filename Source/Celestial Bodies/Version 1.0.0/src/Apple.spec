@@ -1,12 +1,17 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import subprocess
+import sys
 
+# Build the NBodyKernels extension module so the compiled solver kernels ship with the program
+subprocess.run([sys.executable, os.path.join(SPECPATH, 'BuildKernels.py')], cwd=SPECPATH, check=True)
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=['NBodyKernels'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
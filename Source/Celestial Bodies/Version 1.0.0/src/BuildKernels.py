@@ -0,0 +1,42 @@
+# Imports
+from numba.pycc import CC
+from Models import *
+
+""" BuildKernels - Ahead Of Time Build Of The Compiled Solver Kernels
+    Run once from this directory before launching or packaging the program:
+        python BuildKernels.py
+    This writes the NBodyKernels extension module next to RK4.py. When it is present RK4.py loads the
+    solvers from it instead of compiling them on the first plot, when it is missing the njit versions are used.
+"""
+
+# Extension module
+cc = CC('NBodyKernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+""" RK4ProjectileMotionAOT - RK4Kernel specialized on ProjectileMotionModel """
+@cc.export('RK4ProjectileMotionAOT', 'f8[:, ::1](f8[::1], f8[::1], f8, f8, i8)')
+def RK4ProjectileMotionAOT(params, state0, t0, h, n):
+    return RK4Kernel(ProjectileMotionModel, params, state0, t0, h, n)
+
+""" RK4TwoBodyAOT - RK4Kernel specialized on TwoCoupledBodiesModel """
+@cc.export('RK4TwoBodyAOT', 'f8[:, ::1](f8[::1], f8[::1], f8, f8, i8)')
+def RK4TwoBodyAOT(params, state0, t0, h, n):
+    return RK4Kernel(TwoCoupledBodiesModel, params, state0, t0, h, n)
+
+""" RK4ThreeBodyAOT - RK4Kernel specialized on ThreeCoupledBodiesModel """
+@cc.export('RK4ThreeBodyAOT', 'f8[:, ::1](f8[::1], f8[::1], f8, f8, i8)')
+def RK4ThreeBodyAOT(params, state0, t0, h, n):
+    return RK4Kernel(ThreeCoupledBodiesModel, params, state0, t0, h, n)
+
+""" CashKarpTwoBodyAOT - CashKarpKernel specialized on TwoCoupledBodiesModel """
+@cc.export('CashKarpTwoBodyAOT', 'Tuple((f8[::1], f8[:, :]))(f8[::1], f8[::1], f8, f8, f8, f8, f8, f8, i8)')
+def CashKarpTwoBodyAOT(params, state0, t0, tn, h, hmax, atol, rtol, maxSteps):
+    return CashKarpKernel(TwoCoupledBodiesModel, params, state0, t0, tn, h, hmax, atol, rtol, maxSteps)
+
+""" CashKarpThreeBodyAOT - CashKarpKernel specialized on ThreeCoupledBodiesModel """
+@cc.export('CashKarpThreeBodyAOT', 'Tuple((f8[::1], f8[:, :]))(f8[::1], f8[::1], f8, f8, f8, f8, f8, f8, i8)')
+def CashKarpThreeBodyAOT(params, state0, t0, tn, h, hmax, atol, rtol, maxSteps):
+    return CashKarpKernel(ThreeCoupledBodiesModel, params, state0, t0, tn, h, hmax, atol, rtol, maxSteps)
+
+if __name__ == '__main__':
+    cc.compile()
@@ -11,174 +11,261 @@ from RK4 import *
         obj - Array of parameters for object where projectile motion is occurring:
             obj[0] - Mass of object
             obj[1] - Distance from center of mass of object
-        y - Height of object above object's surface
-        v - Velocity of object
+        y - Current state of the projectile:
+            y[0] - Height of object above object's surface
+            y[1] - Velocity of object
+        dydt - Array the derivatives are written into
     Algorithm:
         * Calculate the distance of the object from the center of the mass
-        * Create differential equations
-        * Return differential equations
+        * Write the differential equations into dydt
     Output:
-        dydt - Velocity of object
-        dzdt - Acceleration of object
+        dydt[0] - Velocity of object
+        dydt[1] - Acceleration of object
 """
-def ProjectileMotionModel(t, obj, y, v):
+@njit('void(f8, f8[::1], f8[::1], f8[::1])', cache = True, error_model = 'numpy', fastmath = True)
+def ProjectileMotionModel(t, obj, y, dydt):
     # Height of object
-    height = obj[1] + y
+    height = obj[1] + y[0]
     # Differential equations
-    dydt = v
-    dzdt = - (G * obj[0] / pow(height, 2))
-    return dydt, dzdt
+    dydt[0] = y[1]
+    dydt[1] = - (G * obj[0] / (height * height))
 
 """ TwoCoupledBodiesModel - Model for two bodies interacting in space
     Input:
         t - Time variable, not used directly in this model
         massList - Array of masses in system
-        m1x - Position of mass 1 in x
-        m1y - Position of mass 1 in y
-        m1z - Position of mass 1 in z
-        m2x - Position of mass 2 in x
-        m2y - Position of mass 2 in y
-        m2z - Position of mass 2 in z
-        m1vx - Velocity of mass 1 in x
-        m1vy - Velocity of mass 1 in y
-        m1vz - Velocity of mass 1 in z
-        m2vx - Velocity of mass 2 in x
-        m2vy - Velocity of mass 2 in y
-        m2vz - Velocity of mass 2 in z
+        y - Current state of the system:
+            y[0:3] - Position of mass 1 in x, y, z
+            y[3:6] - Position of mass 2 in x, y, z
+            y[6:9] - Velocity of mass 1 in x, y, z
+            y[9:12] - Velocity of mass 2 in x, y, z
+        dydt - Array the derivatives are written into
     Algorithm:
         * Calculate the distances from mass 1 to mass 2
-        * Calculate the distances from mass 2 to mass 1
+        * Calculate 1 / r^3 from a single square root, the distances from mass 2 to mass 1 are the same with the sign flipped
         * Calculate the accelerations of mass 1
         * Calculate the accelerations of mass 2
-        * Return the updated values of each parameter
+        * Write the updated values of each parameter into dydt
     Output:
-        m1vx - Velocity of mass 1 in x
-        m1vy - Velocity of mass 1 in y
-        m1vz - Velocity of mass 1 in z
-        m2vx - Velocity of mass 2 in x
-        m2vy - Velocity of mass 2 in y
-        m2vz - Velocity of mass 2 in z
-        m1ax - Acceleration of mass 1 in x
-        m1ay - Acceleration of mass 1 in y
-        m1az - Acceleration of mass 1 in z
-        m2ax - Acceleration of mass 2 in x
-        m2ay - Acceleration of mass 2 in y
-        m2az - Acceleration of mass 2 in z
+        dydt[0:3] - Velocity of mass 1 in x, y, z
+        dydt[3:6] - Velocity of mass 2 in x, y, z
+        dydt[6:9] - Acceleration of mass 1 in x, y, z
+        dydt[9:12] - Acceleration of mass 2 in x, y, z
 """
-def TwoCoupledBodiesModel(t, massList, m1x, m1y, m1z, m2x, m2y, m2z, m1vx, m1vy, m1vz, m2vx, m2vy, m2vz):
+@njit('void(f8, f8[::1], f8[::1], f8[::1])', cache = True, error_model = 'numpy', fastmath = True)
+def TwoCoupledBodiesModel(t, massList, y, dydt):
     # Distances from mass 1 to mass 2
-    r12x = m1x - m2x
-    r12y = m1y - m2y
-    r12z = m1z - m2z
-    R12 = pow(pow(r12x, 2) + pow(r12y, 2) + pow(r12z, 2), 1.5)
-    # Distances from mass 2 to mass 1
-    r21x = m2x - m1x
-    r21y = m2y - m1y
-    r21z = m2z - m1z
-    R21 = pow(pow(r21x, 2) + pow(r21y, 2) + pow(r21z, 2), 1.5)
+    r12x = y[3] - y[0]
+    r12y = y[4] - y[1]
+    r12z = y[5] - y[2]
+    invR = 1.0 / np.sqrt(r12x * r12x + r12y * r12y + r12z * r12z)
+    invR3 = invR * invR * invR
+    # Velocities
+    for j in range(6):
+        dydt[j] = y[j + 6]
     # Accelerations of mass 1
-    m1ax = (G * massList[1] * r21x) / R21
-    m1ay = (G * massList[1] * r21y) / R21
-    m1az = (G * massList[1] * r21z) / R21
+    g2 = G * massList[1] * invR3
+    dydt[6] = g2 * r12x
+    dydt[7] = g2 * r12y
+    dydt[8] = g2 * r12z
     # Accelerations of mass 2
-    m2ax = (G * massList[0] * r12x) / R12
-    m2ay = (G * massList[0] * r12y) / R12
-    m2az = (G * massList[0] * r12z) / R12
-    return m1vx, m1vy, m1vz, m2vx, m2vy, m2vz, m1ax, m1ay, m1az, m2ax, m2ay, m2az
+    g1 = G * massList[0] * invR3
+    dydt[9] = - g1 * r12x
+    dydt[10] = - g1 * r12y
+    dydt[11] = - g1 * r12z
 
 """ ThreeCoupledBodiesModel - Model for three bodies interacting in space
     Input:
         t - Time variable, not used directly in this model
         massList - Array of masses in system
-        m1x - Position of mass 1 in x
-        m1y - Position of mass 1 in y
-        m1z - Position of mass 1 in z
-        m2x - Position of mass 2 in x
-        m2y - Position of mass 2 in y
-        m2z - Position of mass 2 in z
-        m3x - Position of mass 3 in x
-        m3y - Position of mass 3 in y
-        m3z - Position of mass 3 in z
-        m1vx - Velocity of mass 1 in x
-        m1vy - Velocity of mass 1 in y
-        m1vz - Velocity of mass 1 in z
-        m2vx - Velocity of mass 2 in x
-        m2vy - Velocity of mass 2 in y
-        m2vz - Velocity of mass 2 in z
-        m3vx - Velocity of mass 3 in x
-        m3vy - Velocity of mass 3 in y
-        m3vz - Velocity of mass 3 in z
+        y - Current state of the system:
+            y[0:3] - Position of mass 1 in x, y, z
+            y[3:6] - Position of mass 2 in x, y, z
+            y[6:9] - Position of mass 3 in x, y, z
+            y[9:12] - Velocity of mass 1 in x, y, z
+            y[12:15] - Velocity of mass 2 in x, y, z
+            y[15:18] - Velocity of mass 3 in x, y, z
+        dydt - Array the derivatives are written into
     Algorithm:
         * Calculate the distances from mass 1 to mass 2
         * Calculate the distances from mass 1 to mass 3
-        * Calculate the distances from mass 2 to mass 1
         * Calculate the distances from mass 2 to mass 3
-        * Calculate the distances from mass 3 to mass 1
+        * Calculate 1 / r^3 for each pair from a single square root, the reversed pairs are the same with the sign flipped
         * Calculate the accelerations of mass 1
         * Calculate the accelerations of mass 2
         * Calculate the accelerations of mass 3
-        * Return the updated values of each parameter
+        * Write the updated values of each parameter into dydt
     Output:
-        m1vx - Velocity of mass 1 in x
-        m1vy - Velocity of mass 1 in y
-        m1vz - Velocity of mass 1 in z
-        m2vx - Velocity of mass 2 in x
-        m2vy - Velocity of mass 2 in y
-        m2vz - Velocity of mass 2 in z
-        m3vx - Velocity of mass 3 in x
-        m3vy - Velocity of mass 3 in y
-        m3vz - Velocity of mass 3 in z
-        m1ax - Acceleration of mass 1 in x
-        m1ay - Acceleration of mass 1 in y
-        m1az - Acceleration of mass 1 in z
-        m2ax - Acceleration of mass 2 in x
-        m2ay - Acceleration of mass 2 in y
-        m2az - Acceleration of mass 2 in z
-        m3ax - Acceleration of mass 3 in x
-        m3ay - Acceleration of mass 3 in y
-        m3az - Acceleration of mass 3 in z
+        dydt[0:3] - Velocity of mass 1 in x, y, z
+        dydt[3:6] - Velocity of mass 2 in x, y, z
+        dydt[6:9] - Velocity of mass 3 in x, y, z
+        dydt[9:12] - Acceleration of mass 1 in x, y, z
+        dydt[12:15] - Acceleration of mass 2 in x, y, z
+        dydt[15:18] - Acceleration of mass 3 in x, y, z
 """
-def ThreeCoupledBodiesModel(t, massList, m1x, m1y, m1z, m2x, m2y, m2z, m3x, m3y, m3z, m1vx, m1vy, m1vz, m2vx, m2vy, m2vz, m3vx, m3vy, m3vz):
+@njit('void(f8, f8[::1], f8[::1], f8[::1])', cache = True, error_model = 'numpy', fastmath = True)
+def ThreeCoupledBodiesModel(t, massList, y, dydt):
     # Distances from mass 1 to mass 2
-    r12x = m2x - m1x
-    r12y = m2y - m1y
-    r12z = m2z - m1z
-    r123 = pow(pow(r12x, 2) + pow(r12y, 2) + pow(r12z, 2), 1.5)
+    r12x = y[3] - y[0]
+    r12y = y[4] - y[1]
+    r12z = y[5] - y[2]
+    invR = 1.0 / np.sqrt(r12x * r12x + r12y * r12y + r12z * r12z)
+    invR12 = invR * invR * invR
     # Distances from mass 1 to mass 3
-    r13x = m3x - m1x
-    r13y = m3y - m1y
-    r13z = m3z - m1z
-    r133 = pow(pow(r13x, 2) + pow(r13y, 2) + pow(r13z, 2), 1.5)
-    # Distances from mass 2 to mass 1
-    r21x = m1x - m2x
-    r21y = m1y - m2y
-    r21z = m1z - m2z
-    r213 = pow(pow(r21x, 2) + pow(r21y, 2) + pow(r21z, 2), 1.5)
+    r13x = y[6] - y[0]
+    r13y = y[7] - y[1]
+    r13z = y[8] - y[2]
+    invR = 1.0 / np.sqrt(r13x * r13x + r13y * r13y + r13z * r13z)
+    invR13 = invR * invR * invR
     # Distances from mass 2 to mass 3
-    r23x = m3x - m2x
-    r23y = m3y - m2y
-    r23z = m3z - m2z
-    r233 = pow(pow(r23x, 2) + pow(r23y, 2) + pow(r23z, 2), 1.5)
-    # Distances from mass 3 to mass 1
-    r31x = m1x - m3x
-    r31y = m1y - m3y
-    r31z = m1z - m3z
-    r313 = pow(pow(r31x, 2) + pow(r31y, 2) + pow(r31z, 2), 1.5)
-    # Distances from mass 3 to mass 2
-    r32x = m2x - m3x
-    r32y = m2y - m3y
-    r32z = m2z - m3z
-    r323 = pow(pow(r32x, 2) + pow(r32y, 2) + pow(r32z, 2), 1.5)
+    r23x = y[6] - y[3]
+    r23y = y[7] - y[4]
+    r23z = y[8] - y[5]
+    invR = 1.0 / np.sqrt(r23x * r23x + r23y * r23y + r23z * r23z)
+    invR23 = invR * invR * invR
+    # Velocities
+    for j in range(9):
+        dydt[j] = y[j + 9]
+    # Pair strengths
+    g1 = G * massList[0]
+    g2 = G * massList[1]
+    g3 = G * massList[2]
     # Accelerations of mass 1
-    m1ax = (G * massList[1] * r12x) / r123 + (G * massList[2] * r13x) / r133
-    m1ay = (G * massList[1] * r12y) / r123 + (G * massList[2] * r13y) / r133
-    m1az = (G * massList[1] * r12z) / r123 + (G * massList[2] * r13z) / r133
+    dydt[9] = g2 * r12x * invR12 + g3 * r13x * invR13
+    dydt[10] = g2 * r12y * invR12 + g3 * r13y * invR13
+    dydt[11] = g2 * r12z * invR12 + g3 * r13z * invR13
     # Accelerations of mass 2
-    m2ax = (G * massList[0] * r21x) / r213 + (G * massList[2] * r23x) / r233
-    m2ay = (G * massList[0] * r21y) / r213 + (G * massList[2] * r23y) / r233
-    m2az = (G * massList[0] * r21z) / r213 + (G * massList[2] * r23z) / r233
+    dydt[12] = - g1 * r12x * invR12 + g3 * r23x * invR23
+    dydt[13] = - g1 * r12y * invR12 + g3 * r23y * invR23
+    dydt[14] = - g1 * r12z * invR12 + g3 * r23z * invR23
     # Accelerations of mass 3
-    m3ax = (G * massList[0] * r31x) / r313 + (G * massList[1] * r32x) / r323
-    m3ay = (G * massList[0] * r31y) / r313 + (G * massList[1] * r32y) / r323
-    m3az = (G * massList[0] * r31z) / r313 + (G * massList[1] * r32z) / r323
-    return m1vx, m1vy, m1vz, m2vx, m2vy, m2vz, m3vx, m3vy, m3vz, m1ax, m1ay, m1az, m2ax, m2ay, m2az, m3ax, m3ay, m3az
\ No newline at end of file
+    dydt[15] = - g1 * r13x * invR13 - g2 * r23x * invR23
+    dydt[16] = - g1 * r13y * invR13 - g2 * r23y * invR23
+    dydt[17] = - g1 * r13z * invR13 - g2 * r23z * invR23
+
+""" ParallelCoupledBodiesModel - Model for any number of bodies interacting in space, parallel over the bodies
+    Input:
+        t - Time variable, not used directly in this model
+        massList - Array of masses in system
+        y - Current state of the system, all positions followed by all velocities
+        dydt - Array the derivatives are written into
+    Algorithm:
+        * Iterate over the bodies in parallel with prange
+            * Sum the pulls of every other body into local accelerations
+            * Write the velocity and acceleration of the body into its own entries of dydt, so no two threads share an entry
+    Output:
+        dydt - All velocities followed by all accelerations
+"""
+@njit('void(f8, f8[::1], f8[::1], f8[::1])', cache = True, error_model = 'numpy', fastmath = True, parallel = True)
+def ParallelCoupledBodiesModel(t, massList, y, dydt):
+    # Number of bodies and offset of the velocities
+    N = massList.shape[0]
+    v = 3 * N
+    # Iterate over bodies
+    for a in prange(N):
+        ax = 0.0
+        ay = 0.0
+        az = 0.0
+        for b in range(N):
+            if (b != a):
+                rx = y[3 * b] - y[3 * a]
+                ry = y[3 * b + 1] - y[3 * a + 1]
+                rz = y[3 * b + 2] - y[3 * a + 2]
+                invR = 1.0 / np.sqrt(rx * rx + ry * ry + rz * rz)
+                g = G * massList[b] * invR * invR * invR
+                ax += g * rx
+                ay += g * ry
+                az += g * rz
+        # Velocities and accelerations
+        dydt[3 * a] = y[v + 3 * a]
+        dydt[3 * a + 1] = y[v + 3 * a + 1]
+        dydt[3 * a + 2] = y[v + 3 * a + 2]
+        dydt[v + 3 * a] = ax
+        dydt[v + 3 * a + 1] = ay
+        dydt[v + 3 * a + 2] = az
+
+# Coupled bodies models, one per number of bodies, the disk cached hand written models serve two and three bodies
+coupledBodiesModels = {2: TwoCoupledBodiesModel, 3: ThreeCoupledBodiesModel}
+
+""" CoupledBodiesModel - Generates A Compiled, Fully Unrolled Model For N Bodies Interacting In Space
+    Input:
+        N - Number of bodies in the system
+    Algorithm:
+        * If a model for N bodies was already stored return it, two and three bodies return the hand written models so only other N are generated
+        * From NBODYPARALLEL bodies on store and return ParallelCoupledBodiesModel, the O(N^2) pair loop then outweighs the thread overhead
+        * Write the source of a model with the same layout as the two and three body models:
+            * One line per velocity component
+            * For each pair of bodies the separation and 1 / r^3 from a single square root
+            * One line per acceleration component summing the pulls of the other bodies
+        * Execute the source and compile it eagerly with the same signature and flags as the hand written models
+        * The generated model is not cached to disk, numba can only cache functions defined in a source file, so each process compiles it once for each N
+        * Store and return the compiled model
+    Output:
+        model - Compiled model of the form model(t, massList, y, dydt), y holds all positions followed by all velocities
+"""
+def CoupledBodiesModel(N):
+    if (N in coupledBodiesModels):
+        return coupledBodiesModels[N]
+    if (N >= NBODYPARALLEL):
+        coupledBodiesModels[N] = ParallelCoupledBodiesModel
+        return ParallelCoupledBodiesModel
+    # Offset of the velocities
+    v = 3 * N
+    axes = "xyz"
+    src = ["def model(t, massList, y, dydt):"]
+    # Velocities
+    for j in range(v):
+        src.append(f"    dydt[{j}] = y[{j + v}]")
+    # Pair distances
+    for a in range(N):
+        for b in range(a + 1, N):
+            for p in range(3):
+                src.append(f"    r{a}{b}{axes[p]} = y[{3 * b + p}] - y[{3 * a + p}]")
+            src.append(f"    invR = 1.0 / np.sqrt(r{a}{b}x * r{a}{b}x + r{a}{b}y * r{a}{b}y + r{a}{b}z * r{a}{b}z)")
+            src.append(f"    invR{a}{b} = invR * invR * invR")
+    # Pair strengths
+    for a in range(N):
+        src.append(f"    g{a} = G * massList[{a}]")
+    # Accelerations
+    for a in range(N):
+        for p in range(3):
+            terms = []
+            for b in range(N):
+                if (b > a):
+                    terms.append(f"g{b} * r{a}{b}{axes[p]} * invR{a}{b}")
+                elif (b < a):
+                    terms.append(f"- g{b} * r{b}{a}{axes[p]} * invR{b}{a}")
+            if (len(terms) == 0):
+                terms.append("0.0")
+            src.append(f"    dydt[{v + 3 * a + p}] = " + " + ".join(terms).replace("+ -", "-"))
+    # Compile
+    namespace = {"np": np, "G": G}
+    exec("\n".join(src), namespace)
+    model = njit('void(f8, f8[::1], f8[::1], f8[::1])', error_model = 'numpy', fastmath = True)(namespace["model"])
+    coupledBodiesModels[N] = model
+    return model
+
+""" WarmUp - Compiles The Two And Three Body Solvers Before The First Plot
+    Input:
+        This function does not have any unique input parameters
+    Algorithm:
+        * Build small separated two and three body systems
+        * Run the fixed step and adaptive solvers over a short span so every kernel they dispatch to is compiled or loaded from the cache
+    Output:
+        This function does not return a value
+"""
+def WarmUp():
+    # Two bodies
+    masses = [1.0, 1.0]
+    ic = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+    RK4TwoBody(TwoCoupledBodiesModel, masses, ic, 0.0, 1.0)
+    RK4TwoBodyAdaptive(TwoCoupledBodiesModel, masses, ic, 0.0, 1.0)
+    # Three bodies
+    masses = [1.0, 1.0, 1.0]
+    ic = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]]
+    RK4ThreeBody(ThreeCoupledBodiesModel, masses, ic, 0.0, 1.0)
+    RK4ThreeBodyAdaptive(ThreeCoupledBodiesModel, masses, ic, 0.0, 1.0)
+
+# Opt in warm up at import, for sessions that would rather wait at launch than on the first plot
+if (os.environ.get("WARMUP") == "1"):
+    WarmUp()
@@ -1,17 +1,17 @@
 # Modules
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import FFMpegWriter, FuncAnimation
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from matplotlib.ticker import ScalarFormatter
 from mpl_toolkits.mplot3d import Axes3D
+import math
+from numba import cuda, njit, prange
 import numpy as np
 import os
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer, pyqtSignal
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
-import random
+from scipy.integrate import solve_ivp
 import sys
 
 # Plot Constants
@@ -24,11 +24,29 @@ THREEDPLOTTILE = 10
 THREEDPLOTLABELS = 6
 THREEDANIMTILE = 10
 THREEDANIMLABELS = 6
+ANIMTRAIL = 1000 # Number of most recent points drawn in an animation trail
+ANIMFPS = 30 # Frames per second of an animation, on the canvas and written to a video file
+ANIMDURATION = 10 # Seconds one pass of an animation lasts
+ANIMINTERVAL = 1000 / ANIMFPS # Milliseconds between animation frames
+ANIMFRAMES = ANIMFPS * ANIMDURATION # Largest number of frames rendered in an animation
+ANIMDPI = 120 # Resolution of an animation written to a video file
+ANIMSAMPLES = 10001 # Number of uniform times an adaptive solution is resampled to before it is animated
+ADAPTIVE = False # Solve the two and three body windows with the adaptive Cash Karp RK4(5) solvers instead of the fixed step RK4 solvers
+ADAPTIVEATOL = 1e-9 # Absolute error tolerance of the adaptive solvers in the two and three body windows
+ADAPTIVERTOL = 1e-12 # Relative error tolerance of the adaptive solvers in the two and three body windows, matches the error of the fixed step RK4 solvers on multi year orbits
+NBODYPARALLEL = 16 # Number of bodies from which the N body model runs in parallel over the bodies
+POSDIRECTIONS = ("$x$", "$y$", "$z$", "Time") # Axis names of the position plots, indexed by data type
+VELDIRECTIONS = ("$v_{x}$", "$v_{y}$", "$v_{z}$", "Time") # Axis names of the velocity plots, indexed by data type
+
+# Window Constants
+SIGNALNAMES = {QComboBox: "currentIndexChanged", QLineEdit: "textChanged", QCheckBox: "stateChanged"} # Value changed signal of each input widget type
+SIGNALDELAY = 50 # Milliseconds of quiet typing before the window updates
 
 # Global Constants
 G = 6.67408e-11 # Gravitational constant
 AU = 1.5e11 # Astronomical unit
 DS = 24*60*60 # Number of seconds in one earth day
+DY = 365.25 * DS # Number of seconds in one earth year
 
 # Solar System Constants
 # Masses in Kg
@@ -83,7 +101,7 @@ Z0EARTH = 0
 VXEARTH = 0
 VYEARTH = 2.97848e4
 VZEARTH = 0
-EARTHPERIOD = 365.25 * DS
+EARTHPERIOD = DY
 EARTHPOS = [X0EARTH, Y0EARTH, Z0EARTH]
 EARTHVEL = [VXEARTH, VYEARTH, VZEARTH]
 
@@ -45,8 +45,12 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
             tn - Final time of model in seconds
             objName - Name of object
             projectileName - Name of projectile
+            nframes - Largest number of frames rendered in an animation, the trajectory is strided to fit
+            savePath - Optional video file the animation is written to with ffmpeg instead of being played on the canvas
         Algorithm:
-            * Call the solver function for projectile motion
+            * Call the solver function for projectile motion through the solver cache
+            * Stride the animation frames so at most nframes are rendered
+            * For animations, play them on the canvas or, when savePath is given, write every frame to the video file
             * If the plotType is 0, plot the Position versus time 2D plot
                 * Create the plot
                 * Set the title, labels, and legend
@@ -57,10 +61,9 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
                 * Set the minimum and maximum for the axes in the plot
                 * Create the initialize inner function
                 * Create the animate inner function
-                * Call the animation for the canvas
                 * Set the title, labels, and legend
                 * Add the notes to the bottom of the plot
-                * Draw the animation on the canvas
+                * Play the animation on the canvas, or write it to savePath
             * If the plotType is 2, plot the Velocity versus time 2D plot
                 * Create the plot
                 * Set the title, labels, and legend
@@ -71,16 +74,29 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
                 * Set the minimum and maximum for the axes in the plot
                 * Create the initialize inner function
                 * Create the animate inner function
-                * Call the animation for the canvas
                 * Set the title, labels, and legend
                 * Add the notes to the bottom of the plot
-                * Draw the animation on the canvas
+                * Play the animation on the canvas, or write it to savePath
         Output:
             This function does not return a value
     """
-    def Plot(self, plotType, obj, ic, t0, tn, objName, projectileName):
+    def Plot(self, plotType, obj, ic, t0, tn, objName, projectileName, nframes = ANIMFRAMES, savePath = None):
         # Call solver
-        position, velocity, time = RK4ProjectileMotion(ProjectileMotionModel, obj, ic, t0, tn)
+        position, velocity, time = CachedSolve(RK4ProjectileMotion, ProjectileMotionModel, obj, ic, t0, tn)
+        # Animation frames
+        frames = range(0, len(time), max(1, len(time) // nframes))
+        # Run an animation live on the canvas, or stream its frames to savePath without the GUI event loop
+        def RunAnimation(self, init, animate):
+            if (savePath):
+                writer = FFMpegWriter(fps = ANIMFPS, codec = 'libx264', bitrate = -1)
+                init()
+                with writer.saving(self.figure, savePath, ANIMDPI):
+                    for q in frames:
+                        animate(q)
+                        writer.grab_frame()
+            else:
+                self.ani = FuncAnimation(self.figure, animate, init_func = init, frames = frames, interval = ANIMINTERVAL, blit = True, repeat = True, cache_frame_data = False)
+            self.draw()
         # Position Plot
         if (plotType == 0):
             # Clear axes
@@ -109,9 +125,9 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
             projectile, = self.axes.plot([], [], 'o', color='green', markersize=2, label=projectileName)
             projectileTrail, = self.axes.plot([], [], '-', color='green', linewidth=1, alpha=0.5)
             # Max and min of axes
-            minPos = min(position)
-            maxPos = max(position)
-            self.axes.set_xlim(-0.05 * max(time), 1.05 * max(time))
+            minPos = position.min()
+            maxPos = position.max()
+            self.axes.set_xlim(-0.05 * time.max(), 1.05 * time.max())
             if (minPos < 0):
                 self.axes.set_ylim(1.05 * minPos, 1.05 * maxPos)
             elif (minPos == 0):
@@ -125,11 +141,10 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
                 return projectile, projectileTrail
             # Animation function
             def animate(k):
-                projectile.set_data([time[k], position[k]])
-                projectileTrail.set_data(time[:k+1], position[:k+1])
+                p = max(0, k - ANIMTRAIL)
+                projectile.set_data(time[k:k+1], position[k:k+1])
+                projectileTrail.set_data(time[p:k+1], position[p:k+1])
                 return projectile, projectileTrail
-            # Animation
-            self.ani = FuncAnimation(self.figure, animate, init_func=init, frames=len(time), interval=1e-5, blit=True, repeat=True)
             # Title, labels, legend
             self.axes.set_title(f"Projectile Motion Animation Of Position Under The Influence Of {objName}", fontsize = TWODANIMTITLE)
             self.axes.set_xlabel(f"Time In Seconds (s)", fontsize = TWODANIMLABELS)
@@ -142,8 +157,8 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
             finalNotes = f"Final Conditions: {projectileName}, Final Vertical Position = {round(position[-1],2)} $(m)$, Final Vertical Velocity = {round(velocity[-1],2)} $(m/s)$"
             timeNotes = f"Simulation From {t0} $(s)$ to {tn} $(s)$"
             self.figure.text(0.1, 0.05, objNotes + "\n" + initNotes + "\n" + finalNotes + "\n" + timeNotes, ha='left', va='bottom', fontsize=TWODNOTES)
-            # Draw animation on canvas
-            self.draw()
+            # Animation
+            RunAnimation(self, init, animate)
         # Velocity plot
         if (plotType == 2):
             # Clear axes
@@ -173,9 +188,9 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
             projectileTrail, = self.axes.plot([], [], '-', color='green', linewidth=1, alpha=0.5)
             # Max and min of axes
             # Max and min of axes
-            minVel = min(velocity)
-            maxVel = max(velocity)
-            self.axes.set_xlim(-0.05 * max(time), 1.05 * max(time))
+            minVel = velocity.min()
+            maxVel = velocity.max()
+            self.axes.set_xlim(-0.05 * time.max(), 1.05 * time.max())
             if (minVel < 0):
                 self.axes.set_ylim(1.05 * minVel, 1.05 * maxVel)
             elif (minVel == 0):
@@ -189,11 +204,10 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
                 return projectile, projectileTrail
             # Animation function
             def animate(k):
-                projectile.set_data([time[k], velocity[k]])
-                projectileTrail.set_data(time[:k+1], velocity[:k+1])
+                p = max(0, k - ANIMTRAIL)
+                projectile.set_data(time[k:k+1], velocity[k:k+1])
+                projectileTrail.set_data(time[p:k+1], velocity[p:k+1])
                 return projectile, projectileTrail
-            # Animation
-            self.ani = FuncAnimation(self.figure, animate, init_func=init, frames=len(time), interval=1e-5, blit=True, repeat=True)
             # Title, labels, legend
             self.axes.set_title(f"Projectile Motion Animation Of Velocity Under The Influence Of {objName}", fontsize = TWODANIMTITLE)
             self.axes.set_xlabel(f"Time In Seconds (s)", fontsize = TWODANIMLABELS)
@@ -206,8 +220,8 @@ class ProjectileMotionCanvas(FigureCanvasQTAgg):
             finalNotes = f"Final Conditions: {projectileName}, Final Vertical Position = {round(position[-1],2)} $(m)$, Final Vertical Velocity = {round(velocity[-1],2)} $(m/s)$"
             timeNotes = f"Simulation From {t0} $(s)$ to {tn} $(s)$"
             self.figure.text(0.1, 0.05, objNotes + "\n" + initNotes + "\n" + finalNotes + "\n" + timeNotes, ha='left', va='bottom', fontsize=TWODNOTES)
-            # Draw animation on canvas
-            self.draw()
+            # Animation
+            RunAnimation(self, init, animate)
 
 """ ProjectileMotionPlotWindow - Class for projectile motion plot windows
     Member Functions:
@@ -250,8 +264,7 @@ class ProjectileMotionPlotWindow(QWidget):
         self.setWindowTitle(windowTitle)
         # Window sizes
         self.resize(800,500)
-        self.setMinimumWidth(800)
-        self.setMinimumHeight(500)
+        self.setMinimumSize(800, 500)
         # Layout
         self.layout = QVBoxLayout()
         # Canvas for plot
@@ -296,7 +309,6 @@ class ProjectileMotionPlotWindow(QWidget):
         GrabChildren - Grabs the children from the window
         InitUI - Initializes UI with layouts and widgets
         IsNum - Checks to see if an input is able to be converted to a number
-        IsPositive - Checks if a number is positive
         ObjectOnChange - Modifies input parameters based upon field values
         RandomAll - Randomize all input fields
         RandomCB - Randomizes checkboxes to be selected
@@ -330,6 +342,18 @@ clearBtnName = "Clear"
 randomBtnName = "Random"
 homeBtnName = "Home"
 
+# Object names of the children in each field, in the order GrabChildren returns them
+childNames = (
+    # Object selection children
+    (objSelCBName, objSelMassLEName, objSelRadLEName, objSelName, objSelClearBtnName, objSelRandBtnName),
+    # Initial condition children
+    (icInitPosName, icInitVelName, icTimeSpanName, icProjName, icClearBtnName, icRandBtnName),
+    # Plot selection children
+    (plotSelPosPlotCBName, plotSelPosAniCBName, plotSelVelPlotCBName, plotSelVelAniCBName, plotSelSelAllBtnName, plotSelRandBtnName, plotSelUnselAllBtnName),
+    # Main button children
+    (calcBtnName, clearBtnName, randomBtnName, homeBtnName),
+)
+
 class ProjectileMotionWindow(QWidget):
     """ Constructor - Constructs window with widgets and layouts of widgets
         Input:
@@ -342,6 +366,8 @@ class ProjectileMotionWindow(QWidget):
     def __init__(self, mainWindow):
         super().__init__()
         self.mainWindow = mainWindow
+        self.childWidgets = None
+        self.rng = np.random.default_rng()
         self.InitUI()
 
     """ Calculate - Generates the plots for projectile motion
@@ -365,7 +391,7 @@ class ProjectileMotionWindow(QWidget):
         for widget in children[0][1:3]:
             widVal1 = self.IsNum(widget.text())
             if (widVal1 == True):
-                widVal2 = self.IsPositive(float(str(widget.text())))
+                widVal2 = float(str(widget.text())) > 0
                 objSel.append(widVal2)
             else:
                 objSel.append(widVal)
@@ -374,7 +400,7 @@ class ProjectileMotionWindow(QWidget):
             widVal1 = self.IsNum(widget.text())
             if (widVal1 == True):
                 if (widget == children[1][2]):
-                    widVal2 = self.IsPositive(float(str(widget.text())))
+                    widVal2 = float(str(widget.text())) > 0
                     icSel.append(widVal2)
                 else:
                     continue
@@ -471,9 +497,9 @@ class ProjectileMotionWindow(QWidget):
         children = self.GrabChildren()
         # Valid inputs
         comboBoxValid = children[0][0].currentIndex() != 0
-        objectSelValid = all(isinstance(widget, QLineEdit) and widget.text() != "" for widget in children[0][1:4])
-        initConValid = all(isinstance(widget, QLineEdit) and widget.text() != "" for widget in children[1][0:4])
-        checkBoxValid = any(isinstance(widget, QCheckBox) and widget.isChecked() == True for widget in children[2][0:5])
+        objectSelValid = all(widget.text() != "" for widget in children[0][1:4])
+        initConValid = all(widget.text() != "" for widget in children[1][0:4])
+        checkBoxValid = any(widget.isChecked() for widget in children[2][0:4])
         # Combo box invalid
         if (comboBoxValid == False):
             self.ClearObj()
@@ -541,17 +567,23 @@ class ProjectileMotionWindow(QWidget):
         Algorithm:
             * Grab the children from the fields
             * Iterate over the widgets in the initial conditions fields
-                * Clear the line edits
+                * Clear the line edits with their signals blocked
+            * If any line edit was cleared, check the inputs once
         Output:
             This function does not return a value
     """
     def ClearIC(self):
         # Grab children
         children = self.GrabChildren()
-        # Iterate over widgets
+        # Clear the line edits with their signals blocked, then check the inputs once
+        cleared = False
         for widget in children[1]:
             if isinstance(widget, QLineEdit):
-                widget.setText("")
+                cleared = cleared or widget.text() != ""
+                with QSignalBlocker(widget):
+                    widget.clear()
+        if (cleared == True):
+            self.CheckAllInputs()
 
     """ ClearObj - Clear object field parameters
         Input:
@@ -560,28 +592,38 @@ class ProjectileMotionWindow(QWidget):
             * Grab the children from the fields
             * Iterate over the widgets in the object selection fields
                 * Set the combo box index to 0
-                * Clear the line edits
+                * Clear the line edits with their signals blocked
+            * If any line edit was cleared, check the inputs once
         Output:
             This function does not return a value
     """
     def ClearObj(self):
         # Grab children
         children = self.GrabChildren()
-        # Iterate over widgets
+        # Iterate over widgets, the line edits are cleared with their signals blocked
+        cleared = False
         for widget in children[0]:
             if isinstance(widget, QComboBox):
                 widget.setCurrentIndex(0)
             elif isinstance(widget, QLineEdit):
-                widget.setText("")
+                cleared = cleared or widget.text() != ""
+                with QSignalBlocker(widget):
+                    widget.clear()
+        # Check the inputs once
+        if (cleared == True):
+            self.CheckAllInputs()
         
     """ GrabChildren - Grabs the children from the window
         Input:
             There are no unique input parameters for this function
         Algorithm:
+            * If the children were grabbed before, return the stored arrays
+            * Find every child widget in one sweep and index them by object name
             * Grab object selection children, add them to an array
             * Grab initial condition children, add them to an array
             * Grab plot selection children, add them to an array
             * Grab main button children, add them to an array
+            * Store the arrays so later calls skip the search
         Output:
             objArr - Array of object selection fields / buttons
                 objArr[0] - Object selection combo box
@@ -612,38 +654,14 @@ class ProjectileMotionWindow(QWidget):
                 mainButtons[3] - Main buttons home button
     """
     def GrabChildren(self):
-        # Object selection children
-        objCB = self.findChild(QComboBox, objSelCBName)
-        objMass = self.findChild(QLineEdit, objSelMassLEName)
-        objRad = self.findChild(QLineEdit, objSelRadLEName)
-        objName = self.findChild(QLineEdit, objSelName)
-        objClear = self.findChild(QPushButton, objSelClearBtnName)
-        objRand = self.findChild(QPushButton, objSelRandBtnName)
-        objArr = [objCB, objMass, objRad, objName, objClear, objRand]
-        # Initial condition children
-        icInitPos = self.findChild(QLineEdit, icInitPosName)
-        icInitVel = self.findChild(QLineEdit, icInitVelName)
-        icTimeSpan = self.findChild(QLineEdit, icTimeSpanName)
-        projName = self.findChild(QLineEdit, icProjName)
-        icClear = self.findChild(QPushButton, icClearBtnName)
-        icRand = self.findChild(QPushButton, icRandBtnName)
-        icArr = [icInitPos, icInitVel, icTimeSpan, projName, icClear, icRand]
-        # Plot selection children
-        posPlot = self.findChild(QCheckBox, plotSelPosPlotCBName)
-        posAni = self.findChild(QCheckBox, plotSelPosAniCBName)
-        velPlot = self.findChild(QCheckBox, plotSelVelPlotCBName)
-        velAni = self.findChild(QCheckBox, plotSelVelAniCBName)
-        selAll = self.findChild(QPushButton, plotSelSelAllBtnName)
-        randAll = self.findChild(QPushButton, plotSelRandBtnName)
-        unSelAll = self.findChild(QPushButton, plotSelUnselAllBtnName)
-        plotSelection = [posPlot, posAni, velPlot, velAni, selAll, randAll, unSelAll]
-        # Main button children
-        calc = self.findChild(QPushButton, calcBtnName)
-        clear = self.findChild(QPushButton, clearBtnName)
-        rand = self.findChild(QPushButton, randomBtnName)
-        home = self.findChild(QPushButton, homeBtnName)
-        mainButtons = [calc, clear, rand, home]
-        return objArr, icArr, plotSelection, mainButtons
+        # The widgets never change after InitUI, find them only on the first call
+        if (self.childWidgets is None):
+            # Every named widget from a single sweep of the window
+            byName = {widget.objectName(): widget for widget in self.findChildren(QWidget) if widget.objectName() != ""}
+            # Children of each field, in the order of their object names
+            self.childWidgets = tuple([byName[name] for name in names] for names in childNames)
+        # Return arrays
+        return self.childWidgets
         
     """ InitUI - Initializes UI with layouts and widgets
         Input:
@@ -655,6 +673,7 @@ class ProjectileMotionWindow(QWidget):
             * Add widgets to layouts
             * Add layouts to main layout
             * Set the main layout
+            * Grab the children once so later calls reuse them
         Output:
             This function does not return a value
     """
@@ -686,8 +705,7 @@ class ProjectileMotionWindow(QWidget):
         self.setWindowTitle("Projectile Motion Simulation")
         # Height and Width of Window
         self.resize(800,500)
-        self.setMinimumWidth(800)
-        self.setMinimumHeight(500)
+        self.setMinimumSize(800, 500)
         ###################################
         ##### Layouts
         ###################################
@@ -736,8 +754,7 @@ class ProjectileMotionWindow(QWidget):
         ### Object selection combo box
         objSelCB = QComboBox()
         objSelCB.setObjectName(objSelCBName)
-        objSelCB.setMinimumWidth(comboBoxMinWidth)
-        objSelCB.setMinimumHeight(comboBoxMinHeight)
+        objSelCB.setMinimumSize(comboBoxMinWidth, comboBoxMinHeight)
         objSelCB.addItems(cbItems)
         objSelCB.currentIndexChanged.connect(self.ObjectOnChange)
         objSelCB.currentIndexChanged.connect(self.CheckAllInputs)
@@ -745,8 +762,7 @@ class ProjectileMotionWindow(QWidget):
         ### Object selection mass line edit
         objSelMassLE = QLineEdit()
         objSelMassLE.setObjectName(objSelMassLEName)
-        objSelMassLE.setMinimumWidth(lineEditMinWidth)
-        objSelMassLE.setMinimumHeight(lineEditMinHeight)
+        objSelMassLE.setMinimumSize(lineEditMinWidth, lineEditMinHeight)
         objSelMassLE.setPlaceholderText("Enter mass of object in (Kg)")
         objSelMassLE.setDisabled(True)
         objSelMassLE.textChanged.connect(self.CheckAllInputs)
@@ -754,8 +770,7 @@ class ProjectileMotionWindow(QWidget):
         ### Object selection radius line edit
         objSelRadLE = QLineEdit()
         objSelRadLE.setObjectName(objSelRadLEName)
-        objSelRadLE.setMinimumWidth(lineEditMinWidth)
-        objSelRadLE.setMinimumHeight(lineEditMinHeight)
+        objSelRadLE.setMinimumSize(lineEditMinWidth, lineEditMinHeight)
         objSelRadLE.setPlaceholderText("Enter radius of object in (m)")
         objSelRadLE.setDisabled(True)
         objSelRadLE.textChanged.connect(self.CheckAllInputs)
@@ -763,8 +778,7 @@ class ProjectileMotionWindow(QWidget):
         ### Object selection name line edit
         objSelNameLE = QLineEdit()
         objSelNameLE.setObjectName(objSelName)
-        objSelNameLE.setMinimumWidth(lineEditMinWidth)
-        objSelNameLE.setMinimumHeight(lineEditMinHeight)
+        objSelNameLE.setMinimumSize(lineEditMinWidth, lineEditMinHeight)
         objSelNameLE.setPlaceholderText("Enter name of object")
         objSelNameLE.setDisabled(True)
         objSelNameLE.textChanged.connect(self.CheckAllInputs)
@@ -772,16 +786,14 @@ class ProjectileMotionWindow(QWidget):
         ### Object selection clear parameters button
         objSelClearBtn = QPushButton("Clear Parameters")
         objSelClearBtn.setObjectName(objSelClearBtnName)
-        objSelClearBtn.setMinimumWidth(buttonMinWidth)
-        objSelClearBtn.setMinimumHeight(buttonMinHeight)
+        objSelClearBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         objSelClearBtn.setDisabled(True)
         objSelClearBtn.clicked.connect(self.ClearObj)
         objSelLayout.addWidget(objSelClearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ### Object selection randomize parameters button
         objSelRandBtn = QPushButton("Random Object")
         objSelRandBtn.setObjectName(objSelRandBtnName)
-        objSelRandBtn.setMinimumWidth(buttonMinWidth)
-        objSelRandBtn.setMinimumHeight(buttonMinHeight)
+        objSelRandBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         objSelRandBtn.clicked.connect(self.RandomObj)
         objSelLayout.addWidget(objSelRandBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ###################################
@@ -793,8 +805,7 @@ class ProjectileMotionWindow(QWidget):
         ### Initial conditions initial position line edit
         icInitPosLE = QLineEdit()
         icInitPosLE.setObjectName(icInitPosName)
-        icInitPosLE.setMinimumWidth(lineEditMinWidth)
-        icInitPosLE.setMinimumHeight(lineEditMinHeight)
+        icInitPosLE.setMinimumSize(lineEditMinWidth, lineEditMinHeight)
         icInitPosLE.setPlaceholderText("Enter initial position in (m)")
         icInitPosLE.setDisabled(True)
         icInitPosLE.textChanged.connect(self.CheckAllInputs)
@@ -802,8 +813,7 @@ class ProjectileMotionWindow(QWidget):
         ### Initial conditions initial velocity line edit
         icInitVelLE = QLineEdit()
         icInitVelLE.setObjectName(icInitVelName)
-        icInitVelLE.setMinimumWidth(lineEditMinWidth)
-        icInitVelLE.setMinimumHeight(lineEditMinHeight)
+        icInitVelLE.setMinimumSize(lineEditMinWidth, lineEditMinHeight)
         icInitVelLE.setPlaceholderText("Enter initial velocity in (m/s)")
         icInitVelLE.setDisabled(True)
         icInitVelLE.textChanged.connect(self.CheckAllInputs)
@@ -811,8 +821,7 @@ class ProjectileMotionWindow(QWidget):
         ### Initial conditions time span line edit
         icTimeSpanLE = QLineEdit()
         icTimeSpanLE.setObjectName(icTimeSpanName)
-        icTimeSpanLE.setMinimumWidth(lineEditMinWidth)
-        icTimeSpanLE.setMinimumHeight(lineEditMinHeight)
+        icTimeSpanLE.setMinimumSize(lineEditMinWidth, lineEditMinHeight)
         icTimeSpanLE.setPlaceholderText("Enter time span of model in (s)")
         icTimeSpanLE.setDisabled(True)
         icTimeSpanLE.textChanged.connect(self.CheckAllInputs)
@@ -820,8 +829,7 @@ class ProjectileMotionWindow(QWidget):
         ### Initial conditions projectile name line edit
         icProjNameLE = QLineEdit()
         icProjNameLE.setObjectName(icProjName)
-        icProjNameLE.setMinimumWidth(lineEditMinWidth)
-        icProjNameLE.setMinimumHeight(lineEditMinHeight)
+        icProjNameLE.setMinimumSize(lineEditMinWidth, lineEditMinHeight)
         icProjNameLE.setPlaceholderText("Enter name of projectile")
         icProjNameLE.setDisabled(True)
         icProjNameLE.textChanged.connect(self.CheckAllInputs)
@@ -829,16 +837,14 @@ class ProjectileMotionWindow(QWidget):
         ### Initial conditions clear parameters button
         icClearBtn = QPushButton("Clear Parameters")
         icClearBtn.setObjectName(icClearBtnName)
-        icClearBtn.setMinimumWidth(buttonMinWidth)
-        icClearBtn.setMinimumHeight(buttonMinHeight)
+        icClearBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         icClearBtn.setDisabled(True)
         icClearBtn.clicked.connect(self.ClearIC)
         icLayout.addWidget(icClearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ### Initial conditions random parameters button
         icRandBtn = QPushButton("Random Initial Conditions")
         icRandBtn.setObjectName(icRandBtnName)
-        icRandBtn.setMinimumWidth(buttonMinWidth)
-        icRandBtn.setMinimumHeight(buttonMinHeight)
+        icRandBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         icRandBtn.clicked.connect(self.RandomIC)
         icLayout.addWidget(icRandBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Parameters layout layouts addition
@@ -878,24 +884,21 @@ class ProjectileMotionWindow(QWidget):
         ### Plot selection select all button
         plotSelSelAllBtn = QPushButton("Select All Plots")
         plotSelSelAllBtn.setObjectName(plotSelSelAllBtnName)
-        plotSelSelAllBtn.setMinimumWidth(buttonMinWidth)
-        plotSelSelAllBtn.setMinimumHeight(buttonMinHeight)
+        plotSelSelAllBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         plotSelSelAllBtn.setDisabled(True)
         plotSelSelAllBtn.clicked.connect(self.CheckAllCB)
         plotButtonLayout.addWidget(plotSelSelAllBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ### Plot selection randomize button
         plotSelRandBtn = QPushButton("Random Plots")
         plotSelRandBtn.setObjectName(plotSelRandBtnName)
-        plotSelRandBtn.setMinimumWidth(buttonMinWidth)
-        plotSelRandBtn.setMinimumHeight(buttonMinHeight)
+        plotSelRandBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         plotSelRandBtn.setDisabled(True)
         plotSelRandBtn.clicked.connect(self.RandomCB)
         plotButtonLayout.addWidget(plotSelRandBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ### Plot selection unselect all button
         plotSelUnselAllBtn = QPushButton("Unselect All Plots")
         plotSelUnselAllBtn.setObjectName(plotSelUnselAllBtnName)
-        plotSelUnselAllBtn.setMinimumWidth(buttonMinWidth)
-        plotSelUnselAllBtn.setMinimumHeight(buttonMinHeight)
+        plotSelUnselAllBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         plotSelUnselAllBtn.setDisabled(True)
         plotSelUnselAllBtn.clicked.connect(self.UnselectAllCB)
         plotButtonLayout.addWidget(plotSelUnselAllBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
@@ -911,30 +914,26 @@ class ProjectileMotionWindow(QWidget):
         ## Main buttons calculate button
         calculateBtn = QPushButton("Calculate")
         calculateBtn.setObjectName(calcBtnName)
-        calculateBtn.setMinimumWidth(buttonMinWidth - 50)
-        calculateBtn.setMinimumHeight(buttonMinHeight)
+        calculateBtn.setMinimumSize(buttonMinWidth - 50, buttonMinHeight)
         calculateBtn.setDisabled(True)
         calculateBtn.clicked.connect(self.Calculate)
         mainButtonsBtnLayout.addWidget(calculateBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Main buttons clear button
         clearBtn = QPushButton("Clear All")
         clearBtn.setObjectName(clearBtnName)
-        clearBtn.setMinimumWidth(buttonMinWidth - 50)
-        clearBtn.setMinimumHeight(buttonMinHeight)
+        clearBtn.setMinimumSize(buttonMinWidth - 50, buttonMinHeight)
         clearBtn.clicked.connect(self.ClearAll)
         mainButtonsBtnLayout.addWidget(clearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Main buttons random button
         randomBtn = QPushButton("Random All")
         randomBtn.setObjectName(randomBtnName)
-        randomBtn.setMinimumWidth(buttonMinWidth - 50)
-        randomBtn.setMinimumHeight(buttonMinHeight)
+        randomBtn.setMinimumSize(buttonMinWidth - 50, buttonMinHeight)
         randomBtn.clicked.connect(self.RandomAll)
         mainButtonsBtnLayout.addWidget(randomBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Main buttons home button
         homeBtn = QPushButton("Return Home")
         homeBtn.setObjectName(homeBtnName)
-        homeBtn.setMinimumWidth(buttonMinWidth - 50)
-        homeBtn.setMinimumHeight(buttonMinHeight)
+        homeBtn.setMinimumSize(buttonMinWidth - 50, buttonMinHeight)
         homeBtn.clicked.connect(self.ReturnHome)
         mainButtonsBtnLayout.addWidget(homeBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Main buttons layout layouts addition
@@ -951,6 +950,8 @@ class ProjectileMotionWindow(QWidget):
         mainLayout.addSpacerItem(spacer)
         # Set layout
         self.setLayout(mainLayout)
+        # Find the children once, every later GrabChildren call returns these arrays
+        self.GrabChildren()
 
     """ IsNum - Checks to see if an input is able to be converted to a number
         Input:
@@ -970,21 +971,6 @@ class ProjectileMotionWindow(QWidget):
         except ValueError:
             return False
 
-    """ IsPositive - Checks if a number is positive
-        Input:
-            value - Value that is being checked
-        Algorithm:
-            * If the value is non zero and positive, return True
-            * Otherwise, return False
-        Output:
-            This function returns a boolean value for if a number is positive
-    """
-    def IsPositive(self, value):
-        if (value > 0):
-            return True
-        else:
-            return False
-
     """ ObjectOnChange - Modifies input parameters based upon field values
         Input:
             This function does not have any unique input parameters
@@ -1052,7 +1038,7 @@ class ProjectileMotionWindow(QWidget):
         # Randomize checkboxes
         boolArr = []
         for widget in children[2][0:4]:
-            randInt = random.randint(1,100)
+            randInt = int(self.rng.integers(1, 101))
             if (randInt % 2 == 0):
                 widget.setChecked(True)
                 boolArr.append(True)
@@ -1061,7 +1047,7 @@ class ProjectileMotionWindow(QWidget):
                 boolArr.append(False)
         allFalse = all(vals == False for vals in boolArr)
         if (allFalse == True):
-            randInt = random.randint(0,3)
+            randInt = int(self.rng.integers(0, 4))
             children[2][randInt].setChecked(True)
 
     """ RandomIC - Randomizes initial conditions
@@ -1080,7 +1066,7 @@ class ProjectileMotionWindow(QWidget):
         children = self.GrabChildren()
         # Valid inputs
         comboBoxValid = children[0][0].currentIndex() != 0
-        objectSelValid = all(isinstance(widget, QLineEdit) and widget.text() != "" for widget in children[0][1:4])
+        objectSelValid = all(widget.text() != "" for widget in children[0][1:4])
         # Rename children
         initPos = children[1][0]
         initVel = children[1][1]
@@ -1088,9 +1074,9 @@ class ProjectileMotionWindow(QWidget):
         projName = children[1][3]
         # Randomize children values
         if (comboBoxValid == True and objectSelValid == True):
-            initPos.setText(str(round(random.uniform(random.uniform(-2000, 0), random.uniform(0, 2000)), 2)))
-            initVel.setText(str(round(random.uniform(random.uniform(-1000, 0), random.uniform(0, 1000)), 2)))
-            timeSpan.setText(str(random.randint(random.randint(5, 15), random.randint(15, 30))))
+            initPos.setText(str(round(float(self.rng.uniform(self.rng.uniform(-2000, 0), self.rng.uniform(0, 2000))), 2)))
+            initVel.setText(str(round(float(self.rng.uniform(self.rng.uniform(-1000, 0), self.rng.uniform(0, 1000))), 2)))
+            timeSpan.setText(str(int(self.rng.integers(self.rng.integers(5, 16), self.rng.integers(15, 31) + 1))))
             projName.setText(str("Projectile"))
             # Enable initial conditions
             for widget in children[1]:
@@ -1119,7 +1105,7 @@ class ProjectileMotionWindow(QWidget):
         radiusLE = children[0][2]
         objName = children[0][3]
         # Generate random integer
-        randVal = random.randint(0,1000000)
+        randVal = int(self.rng.integers(0, 1000001))
         # Generate random common parameters
         if (randVal % 2 == 0):
             for widget in children[0]:
@@ -1127,7 +1113,7 @@ class ProjectileMotionWindow(QWidget):
                     widget.setCurrentIndex(0)
                 elif isinstance(widget, QLineEdit):
                     widget.setText("")
-            cbIndex = random.randint(2, 12)
+            cbIndex = int(self.rng.integers(2, 13))
             comboBox.setCurrentIndex(cbIndex)
             massLE.setText(str(MASSESARR[cbIndex - 2]))
             radiusLE.setText(str(RADIUSARR[cbIndex - 2]))
@@ -1139,10 +1125,10 @@ class ProjectileMotionWindow(QWidget):
                     widget.setCurrentIndex(0)
                 elif isinstance(widget, QLineEdit):
                     widget.setText("")
-            cbIndex = random.randint(2, 12)
+            cbIndex = int(self.rng.integers(2, 13))
             comboBox.setCurrentIndex(1)
-            massLE.setText(str(round(random.uniform(random.uniform(0.01,0.99) * MASSESARR[cbIndex - 2], random.uniform(1.00, 10.0) * MASSESARR[cbIndex - 2]), 2)))
-            radiusLE.setText(str(round(random.uniform(random.uniform(0.01,0.99) * RADIUSARR[cbIndex - 2], random.uniform(1.00, 10.0) * RADIUSARR[cbIndex - 2]), 2)))
+            massLE.setText(str(round(float(self.rng.uniform(self.rng.uniform(0.01, 0.99) * MASSESARR[cbIndex - 2], self.rng.uniform(1.00, 10.0) * MASSESARR[cbIndex - 2])), 2)))
+            radiusLE.setText(str(round(float(self.rng.uniform(self.rng.uniform(0.01, 0.99) * RADIUSARR[cbIndex - 2], self.rng.uniform(1.00, 10.0) * RADIUSARR[cbIndex - 2])), 2)))
             objName.setText(str(comboBox.currentText()))
 
     """ ReturnHome - Returns home and closes the current window
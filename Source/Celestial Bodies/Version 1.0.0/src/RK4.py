@@ -1,6 +1,90 @@
 # Imports
 from Modules import *
 
+# Solver cache
+solverCache = {}
+SOLVERCACHESIZE = 32
+
+""" CachedSolve - Memoized Call To One Of The RK4 Solvers
+    Input:
+        solver - Solver function, one of the RK4 solvers below
+        ODE - Compiled differential equation passed through to the solver
+        params - Masses or object parameters passed through to the solver
+        ic - Initial conditions passed through to the solver
+        t0 - Initial time passed through to the solver
+        tn - Final time passed through to the solver
+        **kwargs - Keyword arguments passed through to the solver, such as the tolerances or method
+    Algorithm:
+        * Build a hashable key from the solver, model, flattened parameters, initial conditions, times, and keyword arguments
+        * If the key is not cached
+            * Call the solver
+            * Mark every returned array as read only so cached results cannot be changed by a caller
+            * Drop the oldest entry when the cache is full
+            * Store the result
+        * Return the cached result
+    Output:
+        Tuple of read only arrays returned by the solver
+"""
+def CachedSolve(solver, ODE, params, ic, t0, tn, **kwargs):
+    # Cache key
+    key = (solver.__name__, ODE.__name__, tuple(np.ravel(params).tolist()), tuple(np.ravel(ic).tolist()), float(t0), float(tn), tuple(sorted(kwargs.items())))
+    if (key not in solverCache):
+        # Solve
+        result = solver(ODE, params, ic, t0, tn, **kwargs)
+        for arr in result:
+            arr.flags.writeable = False
+        # Oldest entry out
+        if (len(solverCache) >= SOLVERCACHESIZE):
+            solverCache.pop(next(iter(solverCache)))
+        solverCache[key] = result
+    return solverCache[key]
+
+# Ahead of time kernels, built by BuildKernels.py, keyed by kernel and model name
+aotKernels = {}
+try:
+    import NBodyKernels
+    aotKernels[('RK4', 'ProjectileMotionModel')] = NBodyKernels.RK4ProjectileMotionAOT
+    aotKernels[('RK4', 'TwoCoupledBodiesModel')] = NBodyKernels.RK4TwoBodyAOT
+    aotKernels[('RK4', 'ThreeCoupledBodiesModel')] = NBodyKernels.RK4ThreeBodyAOT
+    aotKernels[('CashKarp', 'TwoCoupledBodiesModel')] = NBodyKernels.CashKarpTwoBodyAOT
+    aotKernels[('CashKarp', 'ThreeCoupledBodiesModel')] = NBodyKernels.CashKarpThreeBodyAOT
+except ImportError:
+    pass
+
+""" RunRK4Kernel - Runs RK4Kernel From The Ahead Of Time Module When It Was Built For This Model
+    Input:
+        ODE, params, state0, t0, h, n - Arguments of RK4Kernel
+    Algorithm:
+        * Look up the precompiled kernel for the model by name
+        * Call it without the model if found
+        * Otherwise call the njit kernel
+        * Both use the numpy error model, so two bodies that meet give NaN states rather than an exception
+    Output:
+        vals - Output of RK4Kernel
+"""
+def RunRK4Kernel(ODE, params, state0, t0, h, n):
+    kernel = aotKernels.get(('RK4', ODE.__name__))
+    if (kernel is not None):
+        return kernel(params, state0, t0, h, n)
+    return RK4Kernel(ODE, params, state0, t0, h, n)
+
+""" RunCashKarpKernel - Runs CashKarpKernel From The Ahead Of Time Module When It Was Built For This Model
+    Input:
+        ODE, params, state0, t0, tn, h, hmax, atol, rtol, maxSteps - Arguments of CashKarpKernel
+    Algorithm:
+        * Look up the precompiled kernel for the model by name
+        * Call it without the model if found
+        * Otherwise call the njit kernel
+        * Both use the numpy error model, so two bodies that meet give NaN states rather than an exception
+    Output:
+        timevals, vals - Output of CashKarpKernel
+"""
+def RunCashKarpKernel(ODE, params, state0, t0, tn, h, hmax, atol, rtol, maxSteps):
+    kernel = aotKernels.get(('CashKarp', ODE.__name__))
+    if (kernel is not None):
+        return kernel(params, state0, t0, tn, h, hmax, atol, rtol, maxSteps)
+    return CashKarpKernel(ODE, params, state0, t0, tn, h, hmax, atol, rtol, maxSteps)
+
 """ RK41st - Runge Kutta 4 ODE Solver (Of the form da / db) 
     Input:
         ODE - Ordinary Differential Equation that is being solved
@@ -32,6 +116,8 @@ def RK41st(ODE, a0, b0, bn, h):
     avalues[0] = a0
     # Initialize b
     bvalues = np.linspace(b0, bn, n + 1)
+    # Half step
+    h2 = 0.5 * h
     # Iterate over points
     for i in range(n):
         # Current state of values
@@ -39,11 +125,11 @@ def RK41st(ODE, a0, b0, bn, h):
         b = bvalues[i]
         # RK4 update
         k1 = h * ODE(a, b)
-        k2 = h * ODE(a + 0.5 * k1, b + 0.5 * h)
-        k3 = h * ODE(a + 0.5 * k2, b + 0.5 * h)
+        k2 = h * ODE(a + 0.5 * k1, b + h2)
+        k3 = h * ODE(a + 0.5 * k2, b + h2)
         k4 = h * ODE(a + k3, b + h)
         # Next state values
-        avalues[i + 1] = a + (1/6) * (k1 + 2 * k2 + 2 * k3 + k4)
+        avalues[i + 1] = a + (k1 + 2 * k2 + 2 * k3 + k4) / 6
     return avalues, bvalues
 
 """ RK42nd - Runge Kutta 4 ODE Solver For A Second Order ODE (Of the form d^2a / dc^2)
@@ -83,6 +169,8 @@ def RK42nd(ODE, a0, b0, c0, cn, h):
     bvalues[0] = b0
     # Initialize c list
     cvalues = np.linspace(c0, cn, n + 1)
+    # Half step
+    h2 = 0.5 * h
     # Iterate over points
     for i in range(n):
         # Current state of values
@@ -91,17 +179,280 @@ def RK42nd(ODE, a0, b0, c0, cn, h):
         c = cvalues[i]
         # RK4 update
         k1a, k1b = h * np.array(ODE(c, a, b))
-        k2a, k2b = h * np.array(ODE(c + 0.5 * h, a + 0.5 * k1a, b + 0.5 * k1b))
-        k3a, k3b = h * np.array(ODE(c + 0.5 * h, a + 0.5 * k2a, b + 0.5 * k2b))
+        k2a, k2b = h * np.array(ODE(c + h2, a + 0.5 * k1a, b + 0.5 * k1b))
+        k3a, k3b = h * np.array(ODE(c + h2, a + 0.5 * k2a, b + 0.5 * k2b))
         k4a, k4b = h * np.array(ODE(c + h, a + k3a, b + k3b))
         # Next state of values
-        avalues[i + 1] = a + (1/6) * (k1a + 2 * k2a + 2 * k3a + k4a)
-        bvalues[i + 1] = b + (1/6) * (k1b + 2 * k2b + 2 * k3b + k4b)
+        avalues[i + 1] = a + (k1a + 2 * k2a + 2 * k3a + k4a) / 6
+        bvalues[i + 1] = b + (k1b + 2 * k2b + 2 * k3b + k4b) / 6
     return avalues, bvalues, cvalues
 
+""" RK4Kernel - Compiled Runge Kutta 4 Loop Shared By The Projectile, Two Body, And Three Body Solvers
+    Input:
+        ODE - Compiled differential equation of the form ODE(t, params, y, dydt) that writes into dydt
+        params - Array of parameters passed through to the differential equation
+        state0 - Flat array holding the initial state of the system
+        t0 - Initial time of solution
+        h - Step size
+        n - Number of steps
+    Algorithm:
+        * Preallocate the output buffer with one row per state component and n + 1 columns
+        * Preallocate the current state, a single stage array, the stage sum, and the temporary stage state
+        * Initialize the current state and the first column of the buffer to the initial state
+        * Iterate over the total number of steps n
+            * Calculate k1, k2, k3, and k4 in turn into the same stage array
+            * Accumulate k1 + 2 * k2 + 2 * k3 into the stage sum as each stage is found
+            * Update the current state in place with h / 6 * (stage sum + k4)
+            * Write the current state into the next column of the buffer
+        * Return the buffer
+    Output:
+        vals - Array of shape (len(state0), n + 1) holding the state of the system at every step
+"""
+@njit(cache = True, error_model = 'numpy', fastmath = True)
+def RK4Kernel(ODE, params, state0, t0, h, n):
+    # Number of state components
+    m = state0.shape[0]
+    # Output buffer
+    vals = np.empty((m, n + 1))
+    # Current state, stage array, stage sum, and temporary stage state
+    y = np.empty(m)
+    k = np.empty(m)
+    ksum = np.empty(m)
+    temp = np.empty(m)
+    # Half and sixth steps
+    h2 = 0.5 * h
+    h6 = h / 6.0
+    # Initialize state
+    for j in range(m):
+        y[j] = state0[j]
+        vals[j, 0] = state0[j]
+    # Iterate over points
+    for i in range(n):
+        # Current time of state
+        t = t0 + i * h
+        # RK4 update, folding each stage into ksum as soon as it is known
+        ODE(t, params, y, k)
+        for j in range(m):
+            ksum[j] = k[j]
+            temp[j] = y[j] + h2 * k[j]
+        ODE(t + h2, params, temp, k)
+        for j in range(m):
+            ksum[j] += 2.0 * k[j]
+            temp[j] = y[j] + h2 * k[j]
+        ODE(t + h2, params, temp, k)
+        for j in range(m):
+            ksum[j] += 2.0 * k[j]
+            temp[j] = y[j] + h * k[j]
+        ODE(t + h, params, temp, k)
+        # Next state of system
+        for j in range(m):
+            y[j] += h6 * (ksum[j] + k[j])
+            vals[j, i + 1] = y[j]
+    return vals
+
+""" CashKarpKernel - Compiled Embedded Runge Kutta 4(5) Loop With The Cash Karp Coefficients
+    Input:
+        ODE - Compiled differential equation of the form ODE(t, params, y, dydt) that writes into dydt
+        params - Array of parameters passed through to the differential equation
+        state0 - Flat array holding the initial state of the system
+        t0 - Initial time of solution
+        tn - Final time of solution
+        h - Initial step size
+        hmax - Largest step size allowed, the time span when no cap is wanted
+        atol - Absolute error tolerance
+        rtol - Relative error tolerance
+        maxSteps - Largest number of attempted steps before the solver gives up
+    Algorithm:
+        * Preallocate the output buffers and the six stage arrays
+        * Initialize the first column of the buffer to the initial state
+        * Iterate until the final time is reached or the step guard is hit
+            * Clip the step so it does not pass the final time
+            * Calculate the six Cash Karp stages
+            * Build the fifth order and fourth order solutions
+            * Calculate the RMS of the error scaled by atol + rtol * |y5|
+            * If the error is within tolerance accept the step and store it, growing the buffers when full
+            * Rescale the step size with h * 0.9 * R^(-1/5), limited to [0.1, 5] times the old step
+        * Return the time and state buffers trimmed to the accepted steps
+    Output:
+        timevals - Array of accepted times
+        vals - Array of shape (len(state0), len(timevals)) holding the state of the system at every accepted time
+"""
+@njit(cache = True, error_model = 'numpy', fastmath = True)
+def CashKarpKernel(ODE, params, state0, t0, tn, h, hmax, atol, rtol, maxSteps):
+    # Number of state components
+    m = state0.shape[0]
+    # Output buffers
+    size = 1024
+    timevals = np.empty(size)
+    vals = np.empty((m, size))
+    # Current state, stage arrays, and trial solutions
+    y = np.empty(m)
+    k = np.empty((6, m))
+    temp = np.empty(m)
+    y5 = np.empty(m)
+    # Initialize state
+    for j in range(m):
+        y[j] = state0[j]
+        vals[j, 0] = state0[j]
+    timevals[0] = t0
+    t = t0
+    count = 1
+    steps = 0
+    # Iterate until final time
+    while (t < tn and steps < maxSteps):
+        steps += 1
+        # Do not step past final time
+        if (t + h > tn):
+            h = tn - t
+        # Cash Karp stages
+        ODE(t, params, y, k[0])
+        for j in range(m):
+            temp[j] = y[j] + h * (1.0 / 5.0) * k[0, j]
+        ODE(t + (1.0 / 5.0) * h, params, temp, k[1])
+        for j in range(m):
+            temp[j] = y[j] + h * ((3.0 / 40.0) * k[0, j] + (9.0 / 40.0) * k[1, j])
+        ODE(t + (3.0 / 10.0) * h, params, temp, k[2])
+        for j in range(m):
+            temp[j] = y[j] + h * ((3.0 / 10.0) * k[0, j] - (9.0 / 10.0) * k[1, j] + (6.0 / 5.0) * k[2, j])
+        ODE(t + (3.0 / 5.0) * h, params, temp, k[3])
+        for j in range(m):
+            temp[j] = y[j] + h * (- (11.0 / 54.0) * k[0, j] + (5.0 / 2.0) * k[1, j] - (70.0 / 27.0) * k[2, j] + (35.0 / 27.0) * k[3, j])
+        ODE(t + h, params, temp, k[4])
+        for j in range(m):
+            temp[j] = y[j] + h * ((1631.0 / 55296.0) * k[0, j] + (175.0 / 512.0) * k[1, j] + (575.0 / 13824.0) * k[2, j] + (44275.0 / 110592.0) * k[3, j] + (253.0 / 4096.0) * k[4, j])
+        ODE(t + (7.0 / 8.0) * h, params, temp, k[5])
+        # Fifth order solution and scaled error against the fourth order solution
+        R = 0.0
+        for j in range(m):
+            y5[j] = y[j] + h * ((37.0 / 378.0) * k[0, j] + (250.0 / 621.0) * k[2, j] + (125.0 / 594.0) * k[3, j] + (512.0 / 1771.0) * k[5, j])
+            y4 = y[j] + h * ((2825.0 / 27648.0) * k[0, j] + (18575.0 / 48384.0) * k[2, j] + (13525.0 / 55296.0) * k[3, j] + (277.0 / 14336.0) * k[4, j] + 0.25 * k[5, j])
+            err = abs(y5[j] - y4) / (atol + rtol * abs(y5[j]))
+            R += err * err
+        R = np.sqrt(R / m)
+        # Accept step
+        if (R <= 1.0):
+            t += h
+            for j in range(m):
+                y[j] = y5[j]
+            # Grow buffers
+            if (count == size):
+                size *= 2
+                newTimes = np.empty(size)
+                newVals = np.empty((m, size))
+                newTimes[:count] = timevals[:count]
+                newVals[:, :count] = vals[:, :count]
+                timevals = newTimes
+                vals = newVals
+            timevals[count] = t
+            for j in range(m):
+                vals[j, count] = y[j]
+            count += 1
+            # Grow step
+            if (R == 0.0):
+                h *= 5.0
+            else:
+                h *= min(5.0, 0.9 * R ** -0.2)
+        # Reject step
+        else:
+            h *= max(0.1, 0.9 * R ** -0.2)
+        # Largest step
+        if (h > hmax):
+            h = hmax
+    return timevals[:count], vals[:, :count]
+
+""" CoupledBodiesJacobian - Compiled Analytic Jacobian Of The Coupled Bodies Models
+    Input:
+        t - Time variable, not used directly in this model
+        massList - Array of masses in system
+        y - Current state of the system, all positions followed by all velocities
+        jac - Zeroed square array the Jacobian is written into
+    Algorithm:
+        * Set the derivative of each position with respect to its velocity to one
+        * Iterate over every pair of bodies
+            * Calculate the separation, its squared length, and 1 / r^3 and 1 / r^5
+            * Build the 3x3 tidal block G * (I / r^3 - 3 * d * d^T / r^5)
+            * Add the block, scaled by the other mass, to the off diagonal entries of both bodies
+            * Subtract it from the diagonal entries of both bodies
+    Output:
+        jac - Jacobian of the model with respect to the state
+"""
+@njit(cache = True, error_model = 'numpy', fastmath = True)
+def CoupledBodiesJacobian(t, massList, y, jac):
+    # Number of bodies and offset of the velocities
+    nBodies = massList.shape[0]
+    v = 3 * nBodies
+    # Position derivatives
+    for j in range(v):
+        jac[j, v + j] = 1.0
+    # Acceleration derivatives
+    for a in range(nBodies):
+        for b in range(a + 1, nBodies):
+            dx = y[3 * b] - y[3 * a]
+            dy = y[3 * b + 1] - y[3 * a + 1]
+            dz = y[3 * b + 2] - y[3 * a + 2]
+            r2 = dx * dx + dy * dy + dz * dz
+            invR = 1.0 / np.sqrt(r2)
+            invR3 = invR * invR * invR
+            invR5 = invR3 * invR * invR
+            d = (dx, dy, dz)
+            for p in range(3):
+                for q in range(3):
+                    block = - 3.0 * G * d[p] * d[q] * invR5
+                    if (p == q):
+                        block += G * invR3
+                    jac[v + 3 * a + p, 3 * b + q] += massList[b] * block
+                    jac[v + 3 * a + p, 3 * a + q] -= massList[b] * block
+                    jac[v + 3 * b + p, 3 * a + q] += massList[a] * block
+                    jac[v + 3 * b + p, 3 * b + q] -= massList[a] * block
+
+""" SciPySolve - Solves A Compiled Model With scipy.integrate.solve_ivp On A Uniform Time Grid
+    Input:
+        ODE - Compiled differential equation of the form ODE(t, params, y, dydt) that writes into dydt
+        params - Array of parameters passed through to the differential equation
+        state0 - Flat array holding the initial state of the system
+        t0 - Initial time of solution
+        tn - Final time of solution
+        method - Name of the solve_ivp method, 'scipy' is an alias for 'DOP853'
+        atol - Absolute error tolerance
+        rtol - Relative error tolerance
+    Algorithm:
+        * Wrap the compiled model and Jacobian in the f(t, y) form solve_ivp expects
+        * Only pass the Jacobian to the implicit methods that use it
+        * Solve with dense output
+        * Sample the dense output on the same 10001 point grid the fixed step solvers use
+        * Return the lists
+    Output:
+        timevals - Array of uniform times
+        vals - Array of shape (len(state0), len(timevals)) holding the state of the system at every time
+"""
+def SciPySolve(ODE, params, state0, t0, tn, method, atol, rtol):
+    # Number of state components
+    m = state0.shape[0]
+    # Right hand side
+    def rhs(t, y):
+        dydt = np.empty(m)
+        ODE(t, params, y, dydt)
+        return dydt
+    # Jacobian
+    def jac(t, y):
+        J = np.zeros((m, m))
+        CoupledBodiesJacobian(t, params, y, J)
+        return J
+    # Solve
+    if (method == 'scipy'):
+        method = 'DOP853'
+    options = {}
+    if (method in ('Radau', 'BDF', 'LSODA')):
+        options['jac'] = jac
+    sol = solve_ivp(rhs, (t0, tn), state0, method = method, atol = atol, rtol = rtol, dense_output = True, **options)
+    # Uniform grid
+    timevals = np.linspace(t0, tn, 10001)
+    vals = sol.sol(timevals)
+    return timevals, vals
+
 """ RK4ProjectileMotion - Runge Kutta 4 Solver For Projectile Motion
     Input:
-        ODE - Differential equation that is being used in solver
+        ODE - Compiled differential equation that is being used in solver
         obj - Object where the projectile motion is occurring
         ic - Initial conditions of projectile that is under projectile motion
             ic[0] - Initial position of projectile above objects surface
@@ -111,13 +462,10 @@ def RK42nd(ODE, a0, b0, c0, cn, h):
     Algorithm:
         * Calculate the step size for the model
         * Calculate the number of points in solution
-        * Create lists for position, velocity, and time
-        * Initialize values for position and velocity
-        * Iterate through the total number of points n
-            * Retrieve the current stat of the system
-            * Calculate the values for k1, k2, k3, and k4 respectively
-            * Calculate the next state of the system
-            * Update the current state of the system
+        * Pack the object parameters and initial conditions into flat arrays
+        * Run the compiled RK4 kernel
+        * Create the list for time
+        * Slice the kernel output into the position and velocity lists
         * Return the lists
     Output:
         posvals - List of position values of projectile
@@ -129,36 +477,21 @@ def RK4ProjectileMotion(ODE, obj, ic, t0, tn):
     h = (tn - t0) / 10000
     # Number of points
     n = int((tn - t0) / h)
-    # List for position values
-    posvals = np.zeros(n + 1)
-    # List for velocity values
-    velovals = np.zeros(n + 1)
-    # Initialize position
-    posvals[0] = ic[0]
-    # Initialize velocity
-    velovals[0] = ic[1]
+    # Flat parameter and state arrays
+    params = np.array(obj, dtype = np.float64)
+    state0 = np.array(ic, dtype = np.float64)
+    # Solve
+    vals = RunRK4Kernel(ODE, params, state0, float(t0), h, n)
     # Initialize time list
     timevals = np.linspace(t0, tn, n + 1)
-    # Iterate over points
-    for i in range(n):
-        # Current state of values
-        state = (posvals[i], velovals[i])
-        # Current time of state
-        t = timevals[i]
-        # RK4 update
-        k1 = np.array(ODE(t, obj, *state))
-        k2 = np.array(ODE(t + 0.5 * h, obj, *(np.add(state, 0.5 * h * k1))))
-        k3 = np.array(ODE(t + 0.5 * h, obj, *(np.add(state, 0.5 * h * k2))))
-        k4 = np.array(ODE(t + h, obj, *(np.add(state, h * k3))))
-        # Next state of system
-        next_state = np.add(state, (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4))
-        # Update next state of system
-        (posvals[i + 1], velovals[i + 1]) = next_state
+    # Position and velocity lists
+    posvals = vals[0]
+    velovals = vals[1]
     return posvals, velovals, timevals
     
 """ RK4TwoBody - RK4 Method That Solves The Force Attraction Between Two Bodies In Space
     Input:
-        ODE - Differential equation that represents the model that is to be solved
+        ODE - Compiled differential equation that represents the model that is to be solved
         massList - Array of masses in model
         ic - Initial conditions of bodies
         t0 - Initial time in model
@@ -166,21 +499,16 @@ def RK4ProjectileMotion(ODE, obj, ic, t0, tn):
     Algorithm:
         * Calculate the step size for the model
         * Calculate the number of points in solution
-        * Create empty lists for the parameters of each mass
-        * Create empty list for the time in the model
-        * Initialize lists to their initial conditions
-        * Iterate over the total number of points
-            * Generate the state of the current parameters
-            * Update the time to the current time in the step
-            * Update the state with the RK4 method
-            * Generate the next state of the system
-            * Update the next state of the system
+        * Pack the masses and initial conditions into flat arrays
+        * Run the compiled RK4 kernel
+        * Create the list for the time in the model
+        * Slice the kernel output into (3, n + 1) views for the parameters of each mass
         * Return the lists
     Output:
-        mass1Pos - List of mass 1 positions with respect to time
-        mass2Pos - List of mass 2 positions with respect to time
-        mass1Vel - List of mass 1 velocities with respect to time
-        mass2Vel - List of mass 2 velocities with respect to time
+        mass1Pos - Array of shape (3, n + 1) of mass 1 positions with respect to time
+        mass2Pos - Array of shape (3, n + 1) of mass 2 positions with respect to time
+        mass1Vel - Array of shape (3, n + 1) of mass 1 velocities with respect to time
+        mass2Vel - Array of shape (3, n + 1) of mass 2 velocities with respect to time
         timevals - List of times at current steps in model
 """
 def RK4TwoBody(ODE, massList, ic, t0, tn):
@@ -188,71 +516,23 @@ def RK4TwoBody(ODE, massList, ic, t0, tn):
     h = (tn - t0) / 10000
     # Number of points
     n = int((tn - t0) / h)
-    # Mass 1 position lists
-    m1xvals = np.zeros(n + 1)
-    m1yvals = np.zeros(n + 1)
-    m1zvals = np.zeros(n + 1)
-    # Mass 2 position lists
-    m2xvals = np.zeros(n + 1)
-    m2yvals = np.zeros(n + 1)
-    m2zvals = np.zeros(n + 1)
-    # Mass 1 velocity lists
-    m1vxvals = np.zeros(n + 1)
-    m1vyvals = np.zeros(n + 1)
-    m1vzvals = np.zeros(n + 1)
-    # Mass 2 velocity lists
-    m2vxvals = np.zeros(n + 1)
-    m2vyvals = np.zeros(n + 1)
-    m2vzvals = np.zeros(n + 1)
-    # Initializing mass 1 position lists
-    m1xvals[0] = ic[0][0]
-    m1yvals[0] = ic[0][1]
-    m1zvals[0] = ic[0][2]
-    # Initializing mass 2 position lists
-    m2xvals[0] = ic[1][0]
-    m2yvals[0] = ic[1][1]
-    m2zvals[0] = ic[1][2]
-    # Initializing mass 1 velocity lists
-    m1vxvals[0] = ic[2][0]
-    m1vyvals[0] = ic[2][1]
-    m1vzvals[0] = ic[2][2]
-    # Initializing mass 2 velocity lists
-    m2vxvals[0] = ic[3][0]
-    m2vyvals[0] = ic[3][1]
-    m2vzvals[0] = ic[3][2]
+    # Flat mass and state arrays
+    params = np.array(massList, dtype = np.float64)
+    state0 = np.array(ic, dtype = np.float64).ravel()
+    # Solve
+    vals = RunRK4Kernel(ODE, params, state0, float(t0), h, n)
     # Initialize time list
     timevals = np.linspace(t0, tn, n + 1)
-    # Iterate over points
-    for i in range(n):
-        # Current state of system
-        state = (m1xvals[i], m1yvals[i], m1zvals[i], 
-                m2xvals[i], m2yvals[i], m2zvals[i], 
-                m1vxvals[i], m1vyvals[i], m1vzvals[i], 
-                m2vxvals[i], m2vyvals[i], m2vzvals[i])
-        # Current time of state
-        t = timevals[i]
-        # RK4 update
-        k1 = np.array(ODE(t, massList, *state))
-        k2 = np.array(ODE(t + 0.5 * h, massList, *(np.add(state, 0.5 * h * k1))))
-        k3 = np.array(ODE(t + 0.5 * h, massList, *(np.add(state, 0.5 * h * k2))))
-        k4 = np.array(ODE(t + h, massList, *(np.add(state, h * k3))))
-        # Next state of system
-        next_state = np.add(state, (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4))
-        # Update next state of system
-        (m1xvals[i + 1], m1yvals[i + 1], m1zvals[i + 1],
-        m2xvals[i + 1], m2yvals[i + 1], m2zvals[i + 1],
-        m1vxvals[i + 1], m1vyvals[i + 1], m1vzvals[i + 1],
-        m2vxvals[i + 1], m2vyvals[i + 1], m2vzvals[i + 1]) = next_state
     # Parameter lists
-    mass1Pos = [m1xvals, m1yvals, m1zvals]
-    mass1Vel = [m1vxvals, m1vyvals, m1vzvals]
-    mass2Pos = [m2xvals, m2yvals, m2zvals]
-    mass2Vel = [m2vxvals, m2vyvals, m2vzvals]
+    mass1Pos = vals[0:3]
+    mass2Pos = vals[3:6]
+    mass1Vel = vals[6:9]
+    mass2Vel = vals[9:12]
     return mass1Pos, mass2Pos, mass1Vel, mass2Vel, timevals
 
 """ RK4ThreeBody - RK4 Method That Solves The Force Attraction Between Three Bodies In Space
     Input:
-        ODE - Differential equation that represents the model that is to be solved
+        ODE - Compiled differential equation that represents the model that is to be solved
         massList - Array of masses in model
         ic - Initial conditions of bodies
         t0 - Initial time in model
@@ -260,23 +540,18 @@ def RK4TwoBody(ODE, massList, ic, t0, tn):
     Algorithm:
         * Calculate the step size for the model
         * Calculate the number of points in solution
-        * Create empty lists for the parameters of each mass
-        * Create empty list for the time in the model
-        * Initialize lists to their initial conditions
-        * Iterate over the total number of points
-            * Generate the state of the current parameters
-            * Update the time to the current time in the step
-            * Update the state with the RK4 method
-            * Generate the next state of the system
-            * Update the next state of the system
+        * Pack the masses and initial conditions into flat arrays
+        * Run the compiled RK4 kernel
+        * Create the list for the time in the model
+        * Slice the kernel output into (3, n + 1) views for the parameters of each mass
         * Return the lists
     Output:
-        mass1Pos - List of mass 1 positions with respect to time
-        mass2Pos - List of mass 2 positions with respect to time
-        mass3Pos - List of mass 3 positions with respect to time
-        mass1Vel - List of mass 1 velocities with respect to time
-        mass2Vel - List of mass 2 velocities with respect to time
-        mass3Vel - List of mass 3 velocities with respect to time
+        mass1Pos - Array of shape (3, n + 1) of mass 1 positions with respect to time
+        mass2Pos - Array of shape (3, n + 1) of mass 2 positions with respect to time
+        mass3Pos - Array of shape (3, n + 1) of mass 3 positions with respect to time
+        mass1Vel - Array of shape (3, n + 1) of mass 1 velocities with respect to time
+        mass2Vel - Array of shape (3, n + 1) of mass 2 velocities with respect to time
+        mass3Vel - Array of shape (3, n + 1) of mass 3 velocities with respect to time
         timevals - List of times at current steps in model
 """
 def RK4ThreeBody(ODE, massList, ic, t0, tn):
@@ -284,86 +559,368 @@ def RK4ThreeBody(ODE, massList, ic, t0, tn):
     h = (tn - t0) / 10000
     # Number of points
     n = int((tn - t0) / h)
-    # Mass 1 position lists
-    m1xvals = np.zeros(n + 1)
-    m1yvals = np.zeros(n + 1)
-    m1zvals = np.zeros(n + 1)
-    # Mass 2 position lists
-    m2xvals = np.zeros(n + 1)
-    m2yvals = np.zeros(n + 1)
-    m2zvals = np.zeros(n + 1)
-    # Mass 3 position lists
-    m3xvals = np.zeros(n + 1)
-    m3yvals = np.zeros(n + 1)
-    m3zvals = np.zeros(n + 1)
-    # Mass 1 velocity lists
-    m1vxvals = np.zeros(n + 1)
-    m1vyvals = np.zeros(n + 1)
-    m1vzvals = np.zeros(n + 1)
-    # Mass 2 velocity lists
-    m2vxvals = np.zeros(n + 1)
-    m2vyvals = np.zeros(n + 1)
-    m2vzvals = np.zeros(n + 1)
-    # Mass 3 velocity lists
-    m3vxvals = np.zeros(n + 1)
-    m3vyvals = np.zeros(n + 1)
-    m3vzvals = np.zeros(n + 1)
-    # Initializing mass 1 position lists
-    m1xvals[0] = ic[0][0]
-    m1yvals[0] = ic[0][1]
-    m1zvals[0] = ic[0][2]
-    # Initializing mass 2 position lists
-    m2xvals[0] = ic[1][0]
-    m2yvals[0] = ic[1][1]
-    m2zvals[0] = ic[1][2]
-    # Initializing mass 3 position lists
-    m3xvals[0] = ic[2][0]
-    m3yvals[0] = ic[2][1]
-    m3zvals[0] = ic[2][2]
-    # Initializing mass 1 velocity lists
-    m1vxvals[0] = ic[3][0]
-    m1vyvals[0] = ic[3][1]
-    m1vzvals[0] = ic[3][2]
-    # Initializing mass 2 velocity lists
-    m2vxvals[0] = ic[4][0]
-    m2vyvals[0] = ic[4][1]
-    m2vzvals[0] = ic[4][2]
-    # Initializing mass 3 velocity lists
-    m3vxvals[0] = ic[5][0]
-    m3vyvals[0] = ic[5][1]
-    m3vzvals[0] = ic[5][2]
+    # Flat mass and state arrays
+    params = np.array(massList, dtype = np.float64)
+    state0 = np.array(ic, dtype = np.float64).ravel()
+    # Solve
+    vals = RunRK4Kernel(ODE, params, state0, float(t0), h, n)
     # Initialize time list
     timevals = np.linspace(t0, tn, n + 1)
-    # Iterate over points
-    for i in range(n):
-        # Current state of system
-        state = (m1xvals[i], m1yvals[i], m1zvals[i],
-                m2xvals[i], m2yvals[i], m2zvals[i],
-                m3xvals[i], m3yvals[i], m3zvals[i],
-                m1vxvals[i], m1vyvals[i], m1vzvals[i],
-                m2vxvals[i], m2vyvals[i], m2vzvals[i],
-                m3vxvals[i], m3vyvals[i], m3vzvals[i])
-        # Current time of state
-        t = timevals[i]
-        # RK4 update
-        k1 = np.array(ODE(t, massList, *state))
-        k2 = np.array(ODE(t + 0.5 * h, massList, *(np.add(state, 0.5 * h * k1))))
-        k3 = np.array(ODE(t + 0.5 * h, massList, *(np.add(state, 0.5 * h * k2))))
-        k4 = np.array(ODE(t + h, massList, *(np.add(state, h * k3))))
-        # Next state of system
-        next_state = np.add(state, (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4))
-        # Update next state of system
-        (m1xvals[i + 1], m1yvals[i + 1], m1zvals[i + 1],
-        m2xvals[i + 1], m2yvals[i + 1], m2zvals[i + 1],
-        m3xvals[i + 1], m3yvals[i + 1], m3zvals[i + 1],
-        m1vxvals[i + 1], m1vyvals[i + 1], m1vzvals[i + 1],
-        m2vxvals[i + 1], m2vyvals[i + 1], m2vzvals[i + 1],
-        m3vxvals[i + 1], m3vyvals[i + 1], m3vzvals[i + 1]) = next_state
     # Parameter lists
-    mass1Pos = [m1xvals, m1yvals, m1zvals]
-    mass1Vel = [m1vxvals, m1vyvals, m1vzvals]
-    mass2Pos = [m2xvals, m2yvals, m2zvals]
-    mass2Vel = [m2vxvals, m2vyvals, m2vzvals]
-    mass3Pos = [m3xvals, m3yvals, m3zvals]
-    mass3Vel = [m3vxvals, m3vyvals, m3vzvals]
-    return mass1Pos, mass2Pos, mass3Pos, mass1Vel, mass2Vel, mass3Vel, timevals
\ No newline at end of file
+    mass1Pos = vals[0:3]
+    mass2Pos = vals[3:6]
+    mass3Pos = vals[6:9]
+    mass1Vel = vals[9:12]
+    mass2Vel = vals[12:15]
+    mass3Vel = vals[15:18]
+    return mass1Pos, mass2Pos, mass3Pos, mass1Vel, mass2Vel, mass3Vel, timevals
+
+""" RK4TwoBodyAdaptive - Adaptive Cash Karp RK4(5) Method That Solves The Force Attraction Between Two Bodies In Space
+    Input:
+        ODE - Compiled differential equation that represents the model that is to be solved
+        massList - Array of masses in model
+        ic - Initial conditions of bodies
+        t0 - Initial time in model
+        tn - Final time in model
+        atol - Absolute error tolerance
+        rtol - Relative error tolerance
+        method - 'cashkarp' for the compiled Cash Karp kernel, or a solve_ivp method name ('scipy', 'DOP853', 'LSODA', ...)
+        hmax - Optional largest step size of the Cash Karp kernel, by default the tolerances alone set the number of steps
+    Algorithm:
+        * Use the fixed step size of RK4TwoBody as the initial step size
+        * Cap the step size at hmax when given, otherwise only the time span limits it
+        * Pack the masses and initial conditions into flat arrays
+        * Run the compiled Cash Karp kernel, or SciPySolve when a solve_ivp method is requested
+        * Slice the kernel output into (3, n) views for the parameters of each mass
+        * Return the lists
+    Output:
+        mass1Pos - Array of shape (3, n) of mass 1 positions with respect to time
+        mass2Pos - Array of shape (3, n) of mass 2 positions with respect to time
+        mass1Vel - Array of shape (3, n) of mass 1 velocities with respect to time
+        mass2Vel - Array of shape (3, n) of mass 2 velocities with respect to time
+        timevals - Array of the accepted, non uniform times in model, or uniform times for solve_ivp methods
+"""
+def RK4TwoBodyAdaptive(ODE, massList, ic, t0, tn, atol = 1e-9, rtol = 1e-12, method = 'cashkarp', hmax = None):
+    # Initial and largest step size
+    h = (tn - t0) / 10000
+    if (hmax is None):
+        hmax = tn - t0
+    # Flat mass and state arrays
+    params = np.array(massList, dtype = np.float64)
+    state0 = np.array(ic, dtype = np.float64).ravel()
+    # Solve
+    if (method == 'cashkarp'):
+        timevals, vals = RunCashKarpKernel(ODE, params, state0, float(t0), float(tn), h, hmax, atol, rtol, 1000000)
+    else:
+        timevals, vals = SciPySolve(ODE, params, state0, float(t0), float(tn), method, atol, rtol)
+    # Parameter lists
+    mass1Pos = vals[0:3]
+    mass2Pos = vals[3:6]
+    mass1Vel = vals[6:9]
+    mass2Vel = vals[9:12]
+    return mass1Pos, mass2Pos, mass1Vel, mass2Vel, timevals
+
+""" RK4ThreeBodyAdaptive - Adaptive Cash Karp RK4(5) Method That Solves The Force Attraction Between Three Bodies In Space
+    Input:
+        ODE - Compiled differential equation that represents the model that is to be solved
+        massList - Array of masses in model
+        ic - Initial conditions of bodies
+        t0 - Initial time in model
+        tn - Final time in model
+        atol - Absolute error tolerance
+        rtol - Relative error tolerance
+        method - 'cashkarp' for the compiled Cash Karp kernel, or a solve_ivp method name ('scipy', 'DOP853', 'LSODA', ...)
+        hmax - Optional largest step size of the Cash Karp kernel, by default the tolerances alone set the number of steps
+    Algorithm:
+        * Use the fixed step size of RK4ThreeBody as the initial step size
+        * Cap the step size at hmax when given, otherwise only the time span limits it
+        * Pack the masses and initial conditions into flat arrays
+        * Run the compiled Cash Karp kernel, or SciPySolve when a solve_ivp method is requested
+        * Slice the kernel output into (3, n) views for the parameters of each mass
+        * Return the lists
+    Output:
+        mass1Pos - Array of shape (3, n) of mass 1 positions with respect to time
+        mass2Pos - Array of shape (3, n) of mass 2 positions with respect to time
+        mass3Pos - Array of shape (3, n) of mass 3 positions with respect to time
+        mass1Vel - Array of shape (3, n) of mass 1 velocities with respect to time
+        mass2Vel - Array of shape (3, n) of mass 2 velocities with respect to time
+        mass3Vel - Array of shape (3, n) of mass 3 velocities with respect to time
+        timevals - Array of the accepted, non uniform times in model, or uniform times for solve_ivp methods
+"""
+def RK4ThreeBodyAdaptive(ODE, massList, ic, t0, tn, atol = 1e-9, rtol = 1e-12, method = 'cashkarp', hmax = None):
+    # Initial and largest step size
+    h = (tn - t0) / 10000
+    if (hmax is None):
+        hmax = tn - t0
+    # Flat mass and state arrays
+    params = np.array(massList, dtype = np.float64)
+    state0 = np.array(ic, dtype = np.float64).ravel()
+    # Solve
+    if (method == 'cashkarp'):
+        timevals, vals = RunCashKarpKernel(ODE, params, state0, float(t0), float(tn), h, hmax, atol, rtol, 1000000)
+    else:
+        timevals, vals = SciPySolve(ODE, params, state0, float(t0), float(tn), method, atol, rtol)
+    # Parameter lists
+    mass1Pos = vals[0:3]
+    mass2Pos = vals[3:6]
+    mass3Pos = vals[6:9]
+    mass1Vel = vals[9:12]
+    mass2Vel = vals[12:15]
+    mass3Vel = vals[15:18]
+    return mass1Pos, mass2Pos, mass3Pos, mass1Vel, mass2Vel, mass3Vel, timevals
+
+""" ResampleUniform - Resamples A Solver Output Onto Uniform Times
+    Input:
+        solution - Tuple of (3, n) parameter arrays followed by the n times, as returned by the two and three body solvers
+        n - Number of uniform times
+    Algorithm:
+        * Create n uniform times from the first to the last solver time
+        * Linearly interpolate every row of every parameter array at the uniform times
+        * Return the arrays in the same order as the solution
+    Output:
+        Tuple of (3, n) parameter arrays followed by the uniform times
+"""
+def ResampleUniform(solution, n):
+    # Uniform times
+    timevals = solution[-1]
+    uniform = np.linspace(timevals[0], timevals[-1], n)
+    # Interpolate parameters
+    params = [np.array([np.interp(uniform, timevals, row) for row in param]) for param in solution[:-1]]
+    return (*params, uniform)
+
+""" RK4NBody - RK4 Method That Solves The Force Attraction Between Any Number Of Bodies In Space
+    Input:
+        ODE - Compiled differential equation for N bodies, such as one made by CoupledBodiesModel(N)
+        massList - Array of N masses in model
+        ic - Initial conditions of bodies, N positions followed by N velocities
+        t0 - Initial time in model
+        tn - Final time in model
+    Algorithm:
+        * Calculate the step size for the model
+        * Calculate the number of points in solution
+        * Pack the masses and initial conditions into flat arrays
+        * Run the compiled RK4 kernel
+        * Create the list for the time in the model
+        * Reshape the kernel output into positions and velocities of each mass
+        * Return the arrays
+    Output:
+        massPos - Array of shape (N, 3, n + 1) of positions of each mass with respect to time
+        massVel - Array of shape (N, 3, n + 1) of velocities of each mass with respect to time
+        timevals - List of times at current steps in model
+"""
+def RK4NBody(ODE, massList, ic, t0, tn):
+    # Step size
+    h = (tn - t0) / 10000
+    # Number of points
+    n = int((tn - t0) / h)
+    # Flat mass and state arrays
+    params = np.array(massList, dtype = np.float64)
+    state0 = np.array(ic, dtype = np.float64).ravel()
+    N = params.shape[0]
+    # Solve
+    vals = RunRK4Kernel(ODE, params, state0, float(t0), h, n)
+    # Initialize time list
+    timevals = np.linspace(t0, tn, n + 1)
+    # Parameter arrays
+    massPos = vals[:3 * N].reshape(N, 3, n + 1)
+    massVel = vals[3 * N:].reshape(N, 3, n + 1)
+    return massPos, massVel, timevals
+
+""" ThreeBodyDevice - CUDA Device Copy Of ThreeCoupledBodiesModel
+    Input:
+        massList - Array of masses in system
+        y - Current state of the system, positions of masses 1, 2, 3 followed by their velocities
+        dydt - Array the derivatives are written into
+    Algorithm:
+        * Calculate the distances and 1 / r^3 for each of the three pairs
+        * Write the velocities and the accelerations of each mass into dydt
+    Output:
+        dydt - Velocities followed by accelerations of masses 1, 2, 3
+"""
+@cuda.jit(device = True)
+def ThreeBodyDevice(massList, y, dydt):
+    # Distances from mass 1 to mass 2
+    r12x = y[3] - y[0]
+    r12y = y[4] - y[1]
+    r12z = y[5] - y[2]
+    invR = 1.0 / math.sqrt(r12x * r12x + r12y * r12y + r12z * r12z)
+    invR12 = invR * invR * invR
+    # Distances from mass 1 to mass 3
+    r13x = y[6] - y[0]
+    r13y = y[7] - y[1]
+    r13z = y[8] - y[2]
+    invR = 1.0 / math.sqrt(r13x * r13x + r13y * r13y + r13z * r13z)
+    invR13 = invR * invR * invR
+    # Distances from mass 2 to mass 3
+    r23x = y[6] - y[3]
+    r23y = y[7] - y[4]
+    r23z = y[8] - y[5]
+    invR = 1.0 / math.sqrt(r23x * r23x + r23y * r23y + r23z * r23z)
+    invR23 = invR * invR * invR
+    # Velocities
+    for j in range(9):
+        dydt[j] = y[j + 9]
+    # Pair strengths
+    g1 = G * massList[0]
+    g2 = G * massList[1]
+    g3 = G * massList[2]
+    # Accelerations of mass 1
+    dydt[9] = g2 * r12x * invR12 + g3 * r13x * invR13
+    dydt[10] = g2 * r12y * invR12 + g3 * r13y * invR13
+    dydt[11] = g2 * r12z * invR12 + g3 * r13z * invR13
+    # Accelerations of mass 2
+    dydt[12] = - g1 * r12x * invR12 + g3 * r23x * invR23
+    dydt[13] = - g1 * r12y * invR12 + g3 * r23y * invR23
+    dydt[14] = - g1 * r12z * invR12 + g3 * r23z * invR23
+    # Accelerations of mass 3
+    dydt[15] = - g1 * r13x * invR13 - g2 * r23x * invR23
+    dydt[16] = - g1 * r13y * invR13 - g2 * r23y * invR23
+    dydt[17] = - g1 * r13z * invR13 - g2 * r23z * invR23
+
+""" RK4ThreeBodyCUDAKernel - CUDA Kernel That Integrates One Three Body Initial Condition Per Thread
+    Input:
+        massList - Array of masses in system
+        states0 - Array of shape (B, 18) of flat initial states
+        t0 - Initial time of solution, not used directly by the model
+        h - Step size
+        n - Number of steps
+        out - Array of shape (B, 18) the final states are written into
+    Algorithm:
+        * Find the initial condition handled by this thread
+        * Hold the state, stage, stage sum, and temporary stage state in thread local arrays
+        * Iterate over the total number of steps n with the fused RK4 update
+        * Write the final state into out
+    Output:
+        out - Final state of every initial condition
+"""
+@cuda.jit
+def RK4ThreeBodyCUDAKernel(massList, states0, t0, h, n, out):
+    # Initial condition of this thread
+    b = cuda.grid(1)
+    if (b < states0.shape[0]):
+        # Thread local state and stage arrays
+        y = cuda.local.array(18, np.float64)
+        k = cuda.local.array(18, np.float64)
+        ksum = cuda.local.array(18, np.float64)
+        temp = cuda.local.array(18, np.float64)
+        # Half and sixth steps
+        h2 = 0.5 * h
+        h6 = h / 6.0
+        for j in range(18):
+            y[j] = states0[b, j]
+        # Iterate over points
+        for i in range(n):
+            ThreeBodyDevice(massList, y, k)
+            for j in range(18):
+                ksum[j] = k[j]
+                temp[j] = y[j] + h2 * k[j]
+            ThreeBodyDevice(massList, temp, k)
+            for j in range(18):
+                ksum[j] += 2.0 * k[j]
+                temp[j] = y[j] + h2 * k[j]
+            ThreeBodyDevice(massList, temp, k)
+            for j in range(18):
+                ksum[j] += 2.0 * k[j]
+                temp[j] = y[j] + h * k[j]
+            ThreeBodyDevice(massList, temp, k)
+            for j in range(18):
+                y[j] += h6 * (ksum[j] + k[j])
+        # Final state
+        for j in range(18):
+            out[b, j] = y[j]
+
+""" RK4BatchKernel - Compiled CPU Fallback That Integrates A Batch Of Initial Conditions
+    Input:
+        ODE - Compiled differential equation of the form ODE(t, params, y, dydt) that writes into dydt
+        params - Array of parameters passed through to the differential equation
+        states0 - Array of shape (B, m) of flat initial states
+        t0 - Initial time of solution
+        h - Step size
+        n - Number of steps
+    Algorithm:
+        * Preallocate the final states and the stage arrays once for the whole batch
+        * Iterate over the initial conditions
+            * Iterate over the total number of steps n with the fused RK4 update
+            * Store the final state
+        * Return the final states
+    Output:
+        out - Array of shape (B, m) holding the final state of every initial condition
+"""
+@njit(cache = True, error_model = 'numpy', fastmath = True)
+def RK4BatchKernel(ODE, params, states0, t0, h, n):
+    # Batch size and number of state components
+    B, m = states0.shape
+    # Final states and stage arrays
+    out = np.empty((B, m))
+    y = np.empty(m)
+    k = np.empty(m)
+    ksum = np.empty(m)
+    temp = np.empty(m)
+    # Half and sixth steps
+    h2 = 0.5 * h
+    h6 = h / 6.0
+    # Iterate over initial conditions
+    for b in range(B):
+        for j in range(m):
+            y[j] = states0[b, j]
+        # Iterate over points
+        for i in range(n):
+            t = t0 + i * h
+            ODE(t, params, y, k)
+            for j in range(m):
+                ksum[j] = k[j]
+                temp[j] = y[j] + h2 * k[j]
+            ODE(t + h2, params, temp, k)
+            for j in range(m):
+                ksum[j] += 2.0 * k[j]
+                temp[j] = y[j] + h2 * k[j]
+            ODE(t + h2, params, temp, k)
+            for j in range(m):
+                ksum[j] += 2.0 * k[j]
+                temp[j] = y[j] + h * k[j]
+            ODE(t + h, params, temp, k)
+            for j in range(m):
+                y[j] += h6 * (ksum[j] + k[j])
+        # Final state
+        for j in range(m):
+            out[b, j] = y[j]
+    return out
+
+""" RK4ThreeBodyBatch - RK4 Method That Integrates Many Three Body Initial Conditions At Once
+    Input:
+        ODE - Compiled differential equation used by the CPU fallback
+        massList - Array of masses in model, shared by every initial condition
+        icBatch - Array of B initial conditions, each laid out like the ic of RK4ThreeBody
+        t0 - Initial time in model
+        tn - Final time in model
+    Algorithm:
+        * Calculate the step size and number of points the same way as RK4ThreeBody
+        * Pack the masses and initial conditions into flat arrays
+        * If a CUDA device is available launch one GPU thread per initial condition in blocks of 128
+        * Otherwise run the compiled CPU batch kernel
+        * Split the final states into positions and velocities
+        * Return the arrays
+    Output:
+        finalPos - Array of shape (B, 3, 3) of final positions, indexed by initial condition, mass, and axis
+        finalVel - Array of shape (B, 3, 3) of final velocities, indexed by initial condition, mass, and axis
+"""
+def RK4ThreeBodyBatch(ODE, massList, icBatch, t0, tn):
+    # Step size
+    h = (tn - t0) / 10000
+    # Number of points
+    n = int((tn - t0) / h)
+    # Flat mass and state arrays
+    params = np.array(massList, dtype = np.float64)
+    states0 = np.ascontiguousarray(np.array(icBatch, dtype = np.float64).reshape(-1, 18))
+    B = states0.shape[0]
+    # Solve
+    if (cuda.is_available()):
+        out = cuda.device_array_like(states0)
+        RK4ThreeBodyCUDAKernel[(B + 127) // 128, 128](cuda.to_device(params), cuda.to_device(states0), float(t0), h, n, out)
+        out = out.copy_to_host()
+    else:
+        out = RK4BatchKernel(ODE, params, states0, float(t0), h, n)
+    # Final positions and velocities
+    finalPos = out[:, 0:9].reshape(B, 3, 3)
+    finalVel = out[:, 9:18].reshape(B, 3, 3)
+    return finalPos, finalVel
\ No newline at end of file
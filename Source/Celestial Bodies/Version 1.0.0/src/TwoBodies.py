@@ -61,215 +61,88 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
                     3 - Time
             mass1Name - Name of mass 1
             mass2Name - Name of mass 2
+            nframes - Largest number of frames rendered in an animation, the trajectory is strided to fit
+            savePath - Optional video file the animation is written to with ffmpeg instead of being played on the canvas
+            precomputed - Optional solver output already found for these masses, initial conditions, and times
         Algorithm:
-            * Call the RK4 two body solver
+            * Use the precomputed solution if given, otherwise call the fixed step RK4 two body solver through the solver cache
+            * When ADAPTIVE is set, call the adaptive RK4(5) two body solver with the ADAPTIVEATOL and ADAPTIVERTOL tolerances instead
+            * For adaptive animations, resample the non uniform solver times onto ANIMSAMPLES uniform times so playback runs at a constant rate
+            * Stride the animation frames so at most nframes are rendered
+            * For animations, play them on the canvas or, when savePath is given, write every frame to the video file
             * Define the inner functions that perform repeat operations for each plot type
             * For the input parameter, plotType, produce the type of plot that is requested
         Output:
             This function does not return a value
     """
-    def Plot(self, plotType, masses, ic, t0, tn, i, j, k, mass1Name, mass2Name):
+    def Plot(self, plotType, masses, ic, t0, tn, i, j, k, mass1Name, mass2Name, nframes = ANIMFRAMES, savePath = None, precomputed = None):
         # Call solver
-        mass1Pos, mass2Pos, mass1Vel, mass2Vel, timeVals = RK4TwoBody(TwoCoupledBodiesModel, masses, ic, t0, tn)
-        # 2D Axis pos
-        def Axis2DPos(self, mass1Pos, mass2Pos, timeVals, i, j):
-            # Max pos
-            maxDistX, maxDistY, maxDistZ, maxTime = MaxVals(mass1Pos, mass2Pos, timeVals)
-            # Direction place holder
-            iDirection = ''
-            jDirection = ''
-            if (i == 0):
-                iDirection = "$x$"
-                self.axes.set_xlim(-maxDistX, maxDistX)
-            elif (i == 1):
-                iDirection = "$y$"
-                self.axes.set_xlim(-maxDistY, maxDistY)
-            elif (i == 2):
-                iDirection = "$z$"
-                self.axes.set_xlim(-maxDistZ, maxDistZ)
-            elif (i == 3):
-                iDirection = "Time"
-                self.axes.set_xlim(0, maxTime)
-            if (j == 0):
-                jDirection = "$x$"
-                self.axes.set_ylim(-maxDistX, maxDistX)
-            elif (j == 1):
-                jDirection = "$y$"
-                self.axes.set_ylim(-maxDistY, maxDistY)
-            elif (j == 2):
-                jDirection = "$z$"
-                self.axes.set_ylim(-maxDistZ, maxDistZ)
-            elif (j == 3):
-                jDirection = "Time"
-                self.axes.set_ylim(0, maxTime)
-            # Mass values
-            mass1Vals = [mass1Pos[0], mass1Pos[1], mass1Pos[2], timeVals]
-            mass2Vals = [mass2Pos[0], mass2Pos[1], mass2Pos[2], timeVals]
-            return iDirection, jDirection, mass1Vals, mass2Vals
-        # 3D Axis pos
-        def Axis3DPos(self, mass1Pos, mass2Pos, timeVals, i, j, k):
-            # Max pos
-            maxDistX, maxDistY, maxDistZ, maxTime = MaxVals(mass1Pos, mass2Pos, timeVals)
-            # Direction place holder
-            iDirection = ''
-            jDirection = ''
-            kDirection = ''
-            if (i == 0):
-                iDirection = "$x$"
-                self.axes.set_xlim(-maxDistX, maxDistX)
-            elif (i == 1):
-                iDirection = "$y$"
-                self.axes.set_xlim(-maxDistY, maxDistY)
-            elif (i == 2):
-                iDirection = "$z$"
-                self.axes.set_xlim(-maxDistZ, maxDistZ)
-            elif (i == 3):
-                iDirection = "Time"
-                self.axes.set_xlim(0, maxTime)
-            if (j == 0):
-                jDirection = "$x$"
-                self.axes.set_ylim(-maxDistX, maxDistX)
-            elif (j == 1):
-                jDirection = "$y$"
-                self.axes.set_ylim(-maxDistY, maxDistY)
-            elif (j == 2):
-                jDirection = "$z$"
-                self.axes.set_ylim(-maxDistZ, maxDistZ)
-            elif (j == 3):
-                jDirection = "Time"
-                self.axes.set_ylim(0, maxTime)
-            if (k == 0):
-                kDirection = "$x$"
-                self.axes.set_zlim(-maxDistX, maxDistX)
-            elif (k == 1):
-                kDirection = "$y$"
-                self.axes.set_zlim(-maxDistY, maxDistY)
-            elif (k == 2):
-                kDirection = "$z$"
-                self.axes.set_zlim(-maxDistZ, maxDistZ)
-            elif (k == 3):
-                kDirection = "Time"
-                self.axes.set_zlim(0, maxTime)
-            # Mass values
-            mass1Vals = [mass1Pos[0], mass1Pos[1], mass1Pos[2], timeVals]
-            mass2Vals = [mass2Pos[0], mass2Pos[1], mass2Pos[2], timeVals]
-            return iDirection, jDirection, kDirection, mass1Vals, mass2Vals
-        # 2D Axis vel
-        def Axis2DVel(self, mass1Vel, mass2Vel, timeVals, i, j):
-            # Max vel 
-            maxVelX, maxVelY, maxVelZ, maxTime = MaxVals(mass1Vel, mass2Vel, timeVals)
-            # Direction place holder
-            iDirection = ''
-            jDirection = ''
-            if (i == 0):
-                iDirection = "$v_{x}$"
-                self.axes.set_xlim(-maxVelX, maxVelX)
-            elif (i == 1):
-                iDirection = "$v_{y}$"
-                self.axes.set_xlim(-maxVelY, maxVelY)
-            elif (i == 2):
-                iDirection = "$v_{z}$"
-                self.axes.set_xlim(-maxVelZ, maxVelZ)
-            elif (i == 3):
-                iDirection = "Time"
-                self.axes.set_xlim(0, maxTime)
-            if (j == 0):
-                jDirection = "$v_{x}$"
-                self.axes.set_ylim(-maxVelX, maxVelX)
-            elif (j == 1):
-                jDirection = "$v_{y}$"
-                self.axes.set_ylim(-maxVelY, maxVelY)
-            elif (j == 2):
-                jDirection = "$v_{z}$"
-                self.axes.set_ylim(-maxVelZ, maxVelZ)
-            elif (j == 3):
-                jDirection = "Time"
-                self.axes.set_ylim(0, maxTime)
-            # Mass values
-            mass1Vals = [mass1Vel[0], mass1Vel[1], mass1Vel[2], timeVals]
-            mass2Vals = [mass2Vel[0], mass2Vel[1], mass2Vel[2], timeVals]
-            return iDirection, jDirection, mass1Vals, mass2Vals
-        # 3D Axis vel
-        def Axis3DVel(self, mass1Vel, mass2Vel, timeVals, i, j, k):
-            # Max vel 
-            maxVelX, maxVelY, maxVelZ, maxTime = MaxVals(mass1Vel, mass2Vel, timeVals)
-            # Direction place holder
-            iDirection = ''
-            jDirection = ''
+        if (precomputed is None and ADAPTIVE == True):
+            precomputed = CachedSolve(RK4TwoBodyAdaptive, TwoCoupledBodiesModel, masses, ic, t0, tn, atol = ADAPTIVEATOL, rtol = ADAPTIVERTOL)
+        elif (precomputed is None):
+            precomputed = CachedSolve(RK4TwoBody, TwoCoupledBodiesModel, masses, ic, t0, tn)
+        # Adaptive animations resampled onto uniform times, each frame and trail then covers the same stretch of time
+        if (ADAPTIVE == True and plotType in (1, 3, 5, 7)):
+            precomputed = ResampleUniform(precomputed, ANIMSAMPLES)
+        mass1Pos, mass2Pos, mass1Vel, mass2Vel, timeVals = precomputed
+        # Animation frames
+        frames = range(0, len(timeVals), max(1, len(timeVals) // nframes))
+        # Run an animation live on the canvas, or stream its frames to savePath without the GUI event loop
+        def RunAnimation(self, init, animate):
+            if (savePath):
+                writer = FFMpegWriter(fps = ANIMFPS, codec = 'libx264', bitrate = -1)
+                init()
+                with writer.saving(self.figure, savePath, ANIMDPI):
+                    for q in frames:
+                        animate(q)
+                        writer.grab_frame()
+            else:
+                self.ani = FuncAnimation(self.figure, animate, init_func = init, frames = frames, interval = ANIMINTERVAL, blit = True, repeat = True, cache_frame_data = False)
+            self.draw()
+        # Shared axis setup for the position and velocity plots and animations, k is None for 2D
+        def AxisSetup(self, param1, param2, timeVals, directions, i, j, k = None):
+            # Max vals
+            maxX, maxY, maxZ, maxTime = MaxVals(param1, param2, timeVals)
+            # Axis limits, indexed by the data type on each axis
+            limits = [(-maxX, maxX), (-maxY, maxY), (-maxZ, maxZ), (0, maxTime)]
+            self.axes.set_xlim(*limits[i])
+            self.axes.set_ylim(*limits[j])
+            if (k is not None):
+                self.axes.set_zlim(*limits[k])
+            # Axis directions
+            iDirection = directions[i]
+            jDirection = directions[j]
             kDirection = ''
-            if (i == 0):
-                iDirection = "$v_{x}$"
-                self.axes.set_xlim(-maxVelX, maxVelX)
-            elif (i == 1):
-                iDirection = "$v_{y}$"
-                self.axes.set_xlim(-maxVelY, maxVelY)
-            elif (i == 2):
-                iDirection = "$v_{z}$"
-                self.axes.set_xlim(-maxVelZ, maxVelZ)
-            elif (i == 3):
-                iDirection = "Time"
-                self.axes.set_xlim(0, maxTime)
-            if (j == 0):
-                jDirection = "$v_{x}$"
-                self.axes.set_ylim(-maxVelX, maxVelX)
-            elif (j == 1):
-                jDirection = "$v_{y}$"
-                self.axes.set_ylim(-maxVelY, maxVelY)
-            elif (j == 2):
-                jDirection = "$v_{z}$"
-                self.axes.set_ylim(-maxVelZ, maxVelZ)
-            elif (j == 3):
-                jDirection = "Time"
-                self.axes.set_ylim(0, maxTime)
-            if (k == 0):
-                kDirection = "$v_{x}$"
-                self.axes.set_zlim(-maxVelX, maxVelX)
-            elif (k == 1):
-                kDirection = "$v_{y}$"
-                self.axes.set_zlim(-maxVelY, maxVelY)
-            elif (k == 2):
-                kDirection = "$v_{z}$"
-                self.axes.set_zlim(-maxVelZ, maxVelZ)
-            elif (k == 3):
-                kDirection = "Time"
-                self.axes.set_zlim(0, maxTime)
+            if (k is not None):
+                kDirection = directions[k]
             # Mass values
-            mass1Vals = [mass1Vel[0], mass1Vel[1], mass1Vel[2], timeVals]
-            mass2Vals = [mass2Vel[0], mass2Vel[1], mass2Vel[2], timeVals]
+            mass1Vals = [param1[0], param1[1], param1[2], timeVals]
+            mass2Vals = [param2[0], param2[1], param2[2], timeVals]
             return iDirection, jDirection, kDirection, mass1Vals, mass2Vals
         # Max value
         def MaxVals(param1, param2, param3):
-            maxParamX = max(max([val[0] for val in param1]), max([val[0] for val in param2])) * 1.1
-            maxParamY = max(max([val[1] for val in param1]), max([val[1] for val in param2])) * 1.1
-            maxParamZ = max(max([val[2] for val in param1]), max([val[2] for val in param2])) * 1.1
-            max3 = max(param3)
+            maxParamX, maxParamY, maxParamZ = 1.1 * np.max(np.abs(np.stack((param1, param2))), axis = (0, 2))
+            max3 = np.max(param3)
             return maxParamX, maxParamY, maxParamZ, max3
+        # Figure notes, built once and placed by Notes2D or Notes3D
+        mass1Mass = f"{mass1Name}: {masses[0]:.2e} $(Kg)$ "
+        mass1InitXPos, mass1InitYPos, mass1InitZPos = f"$x_{0}$ = {ic[0][0]:.2e} $(m)$, ", f"$y_{0}$ = {ic[0][1]:.2e} $(m)$, ", f"$z_{0}$ = {ic[0][2]:.2e} $(m)$, "
+        mass1InitXVel, mass1InitYVel, mass1InitZVel = f"$v_{{x_{0}}}$ = {ic[2][0]:.2e} $(m/s)$, ", f"$v_{{y_{0}}}$ = {ic[2][1]:.2e} $(m/s)$, ", f"$v_{{z_{0}}}$ = {ic[2][2]:.2e} $(m/s)$"
+        mass1Notes = mass1Mass + mass1InitXPos + mass1InitXVel + mass1InitYPos + mass1InitYVel + mass1InitZPos + mass1InitZVel
+        mass2Mass = f"{mass2Name}: {masses[1]:.2e} $(Kg)$ "
+        mass2InitXPos, mass2InitYPos, mass2InitZPos = f"$x_{0}$ = {ic[1][0]:.2e} $(m)$, ", f"$y_{0}$ = {ic[1][1]:.2e} $(m)$, ", f"$z_{0}$ = {ic[1][2]:.2e} $(m)$, "
+        mass2InitXVel, mass2InitYVel, mass2InitZVel = f"$v_{{x_{0}}}$ = {ic[3][0]:.2e} $(m/s)$, ", f"$v_{{y_{0}}}$ = {ic[3][1]:.2e} $(m/s)$, ", f"$v_{{z_{0}}}$ = {ic[3][2]:.2e} $(m/s)$"
+        mass2Notes = mass2Mass + mass2InitXPos + mass2InitXVel + mass2InitYPos + mass2InitYVel + mass2InitZPos + mass2InitZVel
+        timeSpanNotes = f"Time Span: {round(float(tn / DY), 2)} Earth Years"
+        notes = mass1Notes + "\n" + mass2Notes + "\n" + timeSpanNotes
         # Figure 2D notes
-        def Notes2D(self, masses, ic, mass1Name, mass2Name):
+        def Notes2D(self):
             self.figure.subplots_adjust(bottom=0.30)
-            mass1Mass = f"{mass1Name}: {masses[0]:.2e} $(Kg)$ "
-            mass1InitXPos, mass1InitYPos, mass1InitZPos = f"$x_{0}$ = {ic[0][0]:.2e} $(m)$, ", f"$y_{0}$ = {ic[0][1]:.2e} $(m)$, ", f"$z_{0}$ = {ic[0][2]:.2e} $(m)$, "
-            mass1InitXVel, mass1InitYVel, mass1InitZVel = f"$v_{{x_{0}}}$ = {ic[2][0]:.2e} $(m/s)$, ", f"$v_{{y_{0}}}$ = {ic[2][1]:.2e} $(m/s)$, ", f"$v_{{z_{0}}}$ = {ic[2][2]:.2e} $(m/s)$"
-            mass1Notes = mass1Mass + mass1InitXPos + mass1InitXVel + mass1InitYPos + mass1InitYVel + mass1InitZPos + mass1InitZVel
-            mass2Mass = f"{mass2Name}: {masses[1]:.2e} $(Kg)$ "
-            mass2InitXPos, mass2InitYPos, mass2InitZPos = f"$x_{0}$ = {ic[1][0]:.2e} $(m)$, ", f"$y_{0}$ = {ic[1][1]:.2e} $(m)$, ", f"$z_{0}$ = {ic[1][2]:.2e} $(m)$, "
-            mass2InitXVel, mass2InitYVel, mass2InitZVel = f"$v_{{x_{0}}}$ = {ic[3][0]:.2e} $(m/s)$, ", f"$v_{{y_{0}}}$ = {ic[3][1]:.2e} $(m/s)$, ", f"$v_{{z_{0}}}$ = {ic[3][2]:.2e} $(m/s)$"
-            mass2Notes = mass2Mass + mass2InitXPos + mass2InitXVel + mass2InitYPos + mass2InitYVel + mass2InitZPos + mass2InitZVel
-            timeSpanNotes = f"Time Span: {round(float(tn / (365.25 * DS)), 2)} Earth Years"
-            self.figure.text(0.1, 0.05, mass1Notes + "\n" + mass2Notes + "\n" + timeSpanNotes, ha='left', va='bottom', fontsize=TWODNOTES)
+            self.figure.text(0.1, 0.05, notes, ha='left', va='bottom', fontsize=TWODNOTES)
         # Figure 3D notes
-        def Notes3D(self, masses, ic, mass1Name, mass2Name):
+        def Notes3D(self):
             self.figure.subplots_adjust(bottom=0.30)
-            mass1Mass = f"{mass1Name}: {masses[0]:.2e} $(Kg)$ "
-            mass1InitXPos, mass1InitYPos, mass1InitZPos = f"$x_{0}$ = {ic[0][0]:.2e} $(m)$, ", f"$y_{0}$ = {ic[0][1]:.2e} $(m)$, ", f"$z_{0}$ = {ic[0][2]:.2e} $(m)$, "
-            mass1InitXVel, mass1InitYVel, mass1InitZVel = f"$v_{{x_{0}}}$ = {ic[2][0]:.2e} $(m/s)$, ", f"$v_{{y_{0}}}$ = {ic[2][1]:.2e} $(m/s)$, ", f"$v_{{z_{0}}}$ = {ic[2][2]:.2e} $(m/s)$"
-            mass1Notes = mass1Mass + mass1InitXPos + mass1InitXVel + mass1InitYPos + mass1InitYVel + mass1InitZPos + mass1InitZVel
-            mass2Mass = f"{mass2Name}: {masses[1]:.2e} $(Kg)$ "
-            mass2InitXPos, mass2InitYPos, mass2InitZPos = f"$x_{0}$ = {ic[1][0]:.2e} $(m)$, ", f"$y_{0}$ = {ic[1][1]:.2e} $(m)$, ", f"$z_{0}$ = {ic[1][2]:.2e} $(m)$, "
-            mass2InitXVel, mass2InitYVel, mass2InitZVel = f"$v_{{x_{0}}}$ = {ic[3][0]:.2e} $(m/s)$, ", f"$v_{{y_{0}}}$ = {ic[3][1]:.2e} $(m/s)$, ", f"$v_{{z_{0}}}$ = {ic[3][2]:.2e} $(m/s)$"
-            mass2Notes = mass2Mass + mass2InitXPos + mass2InitXVel + mass2InitYPos + mass2InitYVel + mass2InitZPos + mass2InitZVel
-            timeSpanNotes = f"Time Span: {round(float(tn / (365.25 * DS)), 2)} Earth Years"
-            self.figure.text(0.5, 0.05, mass1Notes + "\n" + mass2Notes + "\n" + timeSpanNotes, ha='center', va='bottom', fontsize=TWODNOTES)
+            self.figure.text(0.5, 0.05, notes, ha='center', va='bottom', fontsize=TWODNOTES)
         # 2D Position labels
         def Pos2DLabels(self, axisParam, i, j, q):
             plotType = ""
@@ -351,14 +224,14 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
             # Clear axes
             self.axes.clear()
             # Max pos function
-            axisPos = Axis2DPos(self, mass1Pos, mass2Pos, timeVals, i, j)
+            axisPos = AxisSetup(self, mass1Pos, mass2Pos, timeVals, POSDIRECTIONS, i, j)
             # Plot
-            self.axes.plot(axisPos[2][i], axisPos[2][j], 'o', color = "green", markersize = 2, label = mass1Name)
-            self.axes.plot(axisPos[3][i], axisPos[3][j], 'o', color = "blue", markersize = 1, label = mass2Name)
+            self.axes.plot(axisPos[3][i], axisPos[3][j], '-', color = "green", linewidth = 1, label = mass1Name)
+            self.axes.plot(axisPos[4][i], axisPos[4][j], '-', color = "blue", linewidth = 1, label = mass2Name)
             # Title and labels
             Pos2DLabels(self, axisPos, i, j, 0)
             # Notes
-            Notes2D(self, masses, ic, mass1Name, mass2Name)
+            Notes2D(self)
             # Draw plot on canvas
             self.draw()
         # 2D Position animation
@@ -366,12 +239,15 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
             # Clear axes
             self.axes.clear()
             # Max pos function
-            axisPos = Axis2DPos(self, mass1Pos, mass2Pos, timeVals, i, j)
+            axisPos = AxisSetup(self, mass1Pos, mass2Pos, timeVals, POSDIRECTIONS, i, j)
             # Animation parameters
             mass1, = self.axes.plot([], [], 'o', color = 'green', markersize = 2, label = mass1Name)
             mass2, = self.axes.plot([], [], 'o', color = 'blue', markersize = 1, label = mass2Name)
             mass1Trail, = self.axes.plot([], [], '-', color = 'green', linewidth = 1, alpha = 0.5)
             mass2Trail, = self.axes.plot([], [], '-', color = 'blue', linewidth = 1, alpha = 0.5)
+            # Axis data of each mass, looked up once outside the animate function
+            mass1X, mass1Y = axisPos[3][i], axisPos[3][j]
+            mass2X, mass2Y = axisPos[4][i], axisPos[4][j]
             # Init function
             def init():
                 mass1.set_data([], [])
@@ -381,32 +257,31 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
                 return mass1, mass2, mass1Trail, mass2Trail
             # Animate function
             def animate(q):
-                mass1.set_data([axisPos[2][i][q]], [axisPos[2][j][q]])
-                mass2.set_data([axisPos[3][i][q]], [axisPos[3][j][q]])
-                mass1Trail.set_data(axisPos[2][i][:q+1], axisPos[2][j][:q+1])
-                mass2Trail.set_data(axisPos[3][i][:q+1], axisPos[3][j][:q+1])
+                p = max(0, q - ANIMTRAIL)
+                mass1.set_data(mass1X[q:q+1], mass1Y[q:q+1])
+                mass2.set_data(mass2X[q:q+1], mass2Y[q:q+1])
+                mass1Trail.set_data(mass1X[p:q+1], mass1Y[p:q+1])
+                mass2Trail.set_data(mass2X[p:q+1], mass2Y[p:q+1])
                 return mass1, mass2, mass1Trail, mass2Trail
-            # Animation
-            self.ani = FuncAnimation(self.figure, animate, init_func = init, frames = len(axisPos[2][3]), interval = 1e-5, blit = True, repeat = True)
             # Title and labels
             Pos2DLabels(self, axisPos, i, j, 1)
             # Notes
-            Notes2D(self, masses, ic, mass1Name, mass2Name)
-            # Draw
-            self.draw()
+            Notes2D(self)
+            # Animation
+            RunAnimation(self, init, animate)
         # 2D Velocity plot
         elif (plotType == 2):
             # Clear axes
             self.axes.clear()
             # Max vel function
-            axisVel = Axis2DVel(self, mass1Vel, mass2Vel, timeVals, i, j)
+            axisVel = AxisSetup(self, mass1Vel, mass2Vel, timeVals, VELDIRECTIONS, i, j)
             # Plot
-            self.axes.plot(axisVel[2][i], axisVel[2][j], 'o', color = "green", markersize = 2, label = mass1Name)
-            self.axes.plot(axisVel[3][i], axisVel[3][j], 'o', color = "blue", markersize = 1, label = mass2Name)
+            self.axes.plot(axisVel[3][i], axisVel[3][j], '-', color = "green", linewidth = 1, label = mass1Name)
+            self.axes.plot(axisVel[4][i], axisVel[4][j], '-', color = "blue", linewidth = 1, label = mass2Name)
             # Title and labels
             Vel2DLabels(self, axisVel, i, j, 0)
             # Notes
-            Notes2D(self, masses, ic, mass1Name, mass2Name)
+            Notes2D(self)
             # Draw
             self.draw()
         # 2D Velocity animation
@@ -414,12 +289,15 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
             # Clear axes
             self.axes.clear()
             # Max vel function
-            axisVel = Axis2DVel(self, mass1Vel, mass2Vel, timeVals, i, j)
+            axisVel = AxisSetup(self, mass1Vel, mass2Vel, timeVals, VELDIRECTIONS, i, j)
             # Animation parameters
             mass1, = self.axes.plot([], [], 'o', color = 'green', markersize = 2, label = mass1Name)
             mass2, = self.axes.plot([], [], 'o', color = 'blue', markersize = 1, label = mass2Name)
             mass1Trail, = self.axes.plot([], [], '-', color = 'green', linewidth = 1, alpha = 0.5)
             mass2Trail, = self.axes.plot([], [], '-', color = 'blue', linewidth = 1, alpha = 0.5)
+            # Axis data of each mass, looked up once outside the animate function
+            mass1X, mass1Y = axisVel[3][i], axisVel[3][j]
+            mass2X, mass2Y = axisVel[4][i], axisVel[4][j]
             # Init function
             def init():
                 mass1.set_data([], [])
@@ -429,32 +307,31 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
                 return mass1, mass2, mass1Trail, mass2Trail
             # Animate function
             def animate(q):
-                mass1.set_data([axisVel[2][i][q]], [axisVel[2][j][q]])
-                mass2.set_data([axisVel[3][i][q]], [axisVel[3][j][q]])
-                mass1Trail.set_data(axisVel[2][i][:q+1], axisVel[2][j][:q+1])
-                mass2Trail.set_data(axisVel[3][i][:q+1], axisVel[3][j][:q+1])
+                p = max(0, q - ANIMTRAIL)
+                mass1.set_data(mass1X[q:q+1], mass1Y[q:q+1])
+                mass2.set_data(mass2X[q:q+1], mass2Y[q:q+1])
+                mass1Trail.set_data(mass1X[p:q+1], mass1Y[p:q+1])
+                mass2Trail.set_data(mass2X[p:q+1], mass2Y[p:q+1])
                 return mass1, mass2, mass1Trail, mass2Trail
-            # Animation
-            self.ani = FuncAnimation(self.figure, animate, init_func = init, frames = len(axisVel[2][3]), interval = 1e-5, blit = True, repeat = True)
             # Title and labels
             Vel2DLabels(self, axisVel, i, j, 1)
             # Notes
-            Notes2D(self, masses, ic, mass1Name, mass2Name)
-            # Draw
-            self.draw()
+            Notes2D(self)
+            # Animation
+            RunAnimation(self, init, animate)
         # 3D position plot
         elif (plotType == 4):
             # Clear axes
             self.axes.clear()
             # Max pos function
-            axisPos = Axis3DPos(self, mass1Pos, mass2Pos, timeVals, i, j, k)
+            axisPos = AxisSetup(self, mass1Pos, mass2Pos, timeVals, POSDIRECTIONS, i, j, k)
             # Plot
-            self.axes.plot(axisPos[3][i], axisPos[3][j], axisPos[3][k], 'o', color = "green", markersize = 2, label = mass1Name)
-            self.axes.plot(axisPos[4][i], axisPos[4][j], axisPos[4][k], 'o', color = "blue", markersize = 1, label = mass2Name)
+            self.axes.plot(axisPos[3][i], axisPos[3][j], axisPos[3][k], '-', color = "green", linewidth = 1, label = mass1Name)
+            self.axes.plot(axisPos[4][i], axisPos[4][j], axisPos[4][k], '-', color = "blue", linewidth = 1, label = mass2Name)
             # Title and labels
             Pos3DLabels(self, axisPos, i, j, k, 0)
             # Notes
-            Notes3D(self, masses, ic, mass1Name, mass2Name)
+            Notes3D(self)
             # Draw
             self.draw()
         # 3D position animation
@@ -462,12 +339,15 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
             # Clear axes
             self.axes.clear()
             # Max pos function
-            axisPos = Axis3DPos(self, mass1Pos, mass2Pos, timeVals, i, j, k)
+            axisPos = AxisSetup(self, mass1Pos, mass2Pos, timeVals, POSDIRECTIONS, i, j, k)
             # Animation parameters
             mass1, = self.axes.plot([], [], [], 'o', color = 'green', markersize = 2, label = mass1Name)
             mass2, = self.axes.plot([], [], [], 'o', color = 'blue', markersize = 1, label = mass2Name)
             mass1Trail, = self.axes.plot([], [], [], '-', color = 'green', linewidth = 1, alpha = 0.5)
             mass2Trail, = self.axes.plot([], [], [], '-', color = 'blue', linewidth = 1, alpha = 0.5)
+            # Axis data of each mass, looked up once outside the animate function
+            mass1X, mass1Y, mass1Z = axisPos[3][i], axisPos[3][j], axisPos[3][k]
+            mass2X, mass2Y, mass2Z = axisPos[4][i], axisPos[4][j], axisPos[4][k]
             # Init function
             def init():
                 mass1.set_data([], [])
@@ -475,40 +355,41 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
                 mass2.set_data([], [])
                 mass2.set_3d_properties([])
                 mass1Trail.set_data([], [])
+                mass1Trail.set_3d_properties([])
                 mass2Trail.set_data([], [])
+                mass2Trail.set_3d_properties([])
                 return mass1, mass2, mass1Trail, mass2Trail
             # Animate function
             def animate(q):
-                mass1.set_data([axisPos[3][i][q]], [axisPos[3][j][q]])
-                mass1.set_3d_properties([axisPos[3][k][q]])
-                mass2.set_data([axisPos[4][i][q]], [axisPos[4][j][q]])
-                mass2.set_3d_properties([axisPos[4][k][q]])
-                mass1Trail.set_data(axisPos[3][i][:q+1], axisPos[3][j][:q+1])
-                mass1Trail.set_3d_properties(axisPos[3][k][:q+1])
-                mass2Trail.set_data(axisPos[4][i][:q+1], axisPos[4][j][:q+1])
-                mass2Trail.set_3d_properties(axisPos[4][k][:q+1])
+                p = max(0, q - ANIMTRAIL)
+                mass1.set_data(mass1X[q:q+1], mass1Y[q:q+1])
+                mass1.set_3d_properties(mass1Z[q:q+1])
+                mass2.set_data(mass2X[q:q+1], mass2Y[q:q+1])
+                mass2.set_3d_properties(mass2Z[q:q+1])
+                mass1Trail.set_data(mass1X[p:q+1], mass1Y[p:q+1])
+                mass1Trail.set_3d_properties(mass1Z[p:q+1])
+                mass2Trail.set_data(mass2X[p:q+1], mass2Y[p:q+1])
+                mass2Trail.set_3d_properties(mass2Z[p:q+1])
                 return mass1, mass2, mass1Trail, mass2Trail
-            # Animation
-            self.ani = FuncAnimation(self.figure, animate, init_func = init, frames = len(axisPos[3][3]), interval = 1e-5, blit = True, repeat = True)
             # Title and labels
             Pos3DLabels(self, axisPos, i, j, k, 1)
             # Notes
-            Notes3D(self, masses, ic, mass1Name, mass2Name)
-            # Draw
-            self.draw()
+            Notes3D(self)
+            # Animation
+            RunAnimation(self, init, animate)
         # 3D velocity plot
         elif (plotType == 6):
             # Clear axes
             self.axes.clear()
             # Max vel function
-            axisVel = Axis3DVel(self, mass1Vel, mass2Vel, timeVals, i, j, k)
+            axisVel = AxisSetup(self, mass1Vel, mass2Vel, timeVals, VELDIRECTIONS, i, j, k)
             # Plot
-            self.axes.plot(axisVel[3][i], axisVel[3][j], axisVel[3][k], 'o', color = "green", markersize = 2, label = mass1Name)
-            self.axes.plot(axisVel[4][i], axisVel[4][j], axisVel[4][k], 'o', color = "blue", markersize = 1, label = mass2Name)
+            self.axes.plot(axisVel[3][i], axisVel[3][j], axisVel[3][k], '-', color = "green", linewidth = 1, label = mass1Name)
+            self.axes.plot(axisVel[4][i], axisVel[4][j], axisVel[4][k], '-', color = "blue", linewidth = 1, label = mass2Name)
             # Title and labels
             Vel3DLabels(self, axisVel, i, j, k, 0)
             # Notes
-            Notes3D(self, masses, ic, mass1Name, mass2Name)
+            Notes3D(self)
             # Draw
             self.draw()
         # 3D velocity animation
@@ -516,12 +397,15 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
             # Clear axes
             self.axes.clear()
             # Max vel function
-            axisVel = Axis3DPos(self, mass1Vel, mass2Vel, timeVals, i, j, k)
+            axisVel = AxisSetup(self, mass1Vel, mass2Vel, timeVals, VELDIRECTIONS, i, j, k)
             # Animation parameters
             mass1, = self.axes.plot([], [], [], 'o', color = 'green', markersize = 2, label = mass1Name)
             mass2, = self.axes.plot([], [], [], 'o', color = 'blue', markersize = 1, label = mass2Name)
             mass1Trail, = self.axes.plot([], [], [], '-', color = 'green', linewidth = 1, alpha = 0.5)
             mass2Trail, = self.axes.plot([], [], [], '-', color = 'blue', linewidth = 1, alpha = 0.5)
+            # Axis data of each mass, looked up once outside the animate function
+            mass1X, mass1Y, mass1Z = axisVel[3][i], axisVel[3][j], axisVel[3][k]
+            mass2X, mass2Y, mass2Z = axisVel[4][i], axisVel[4][j], axisVel[4][k]
             # Init function
             def init():
                 mass1.set_data([], [])
@@ -529,27 +413,28 @@ class TwoBodyCanvas(FigureCanvasQTAgg):
                 mass2.set_data([], [])
                 mass2.set_3d_properties([])
                 mass1Trail.set_data([], [])
+                mass1Trail.set_3d_properties([])
                 mass2Trail.set_data([], [])
+                mass2Trail.set_3d_properties([])
                 return mass1, mass2, mass1Trail, mass2Trail
             # Animate function
             def animate(q):
-                mass1.set_data([axisVel[3][i][q]], [axisVel[3][j][q]])
-                mass1.set_3d_properties([axisVel[3][k][q]])
-                mass2.set_data([axisVel[4][i][q]], [axisVel[4][j][q]])
-                mass2.set_3d_properties([axisVel[4][k][q]])
-                mass1Trail.set_data(axisVel[3][i][:q+1], axisVel[3][j][:q+1])
-                mass1Trail.set_3d_properties(axisVel[3][k][:q+1])
-                mass2Trail.set_data(axisVel[4][i][:q+1], axisVel[4][j][:q+1])
-                mass2Trail.set_3d_properties(axisVel[4][k][:q+1])
+                p = max(0, q - ANIMTRAIL)
+                mass1.set_data(mass1X[q:q+1], mass1Y[q:q+1])
+                mass1.set_3d_properties(mass1Z[q:q+1])
+                mass2.set_data(mass2X[q:q+1], mass2Y[q:q+1])
+                mass2.set_3d_properties(mass2Z[q:q+1])
+                mass1Trail.set_data(mass1X[p:q+1], mass1Y[p:q+1])
+                mass1Trail.set_3d_properties(mass1Z[p:q+1])
+                mass2Trail.set_data(mass2X[p:q+1], mass2Y[p:q+1])
+                mass2Trail.set_3d_properties(mass2Z[p:q+1])
                 return mass1, mass2, mass1Trail, mass2Trail
-            # Animation
-            self.ani = FuncAnimation(self.figure, animate, init_func = init, frames = len(axisVel[3][3]), interval = 1e-5, blit = True, repeat = True)
             # Title and labels
-            Pos3DLabels(self, axisVel, i, j, k, 1)
+            Vel3DLabels(self, axisVel, i, j, k, 1)
             # Notes
-            Notes3D(self, masses, ic, mass1Name, mass2Name)
-            # Draw
-            self.draw()
+            Notes3D(self)
+            # Animation
+            RunAnimation(self, init, animate)
 
 """ TwoBodyPlotWindow - Class for two body motion plot windows
     Member Functions:
@@ -587,6 +472,7 @@ class TwoBodyPlotWindow(QWidget):
             mass1Name - Name of mass 1
             mass2Name - Name of mass 2
             windowTitle - Title of window that is being created
+            precomputed - Optional solver output shared by every plot window of a calculation
         Algorithm:
             * Set the window title
             * Set the size of the window
@@ -598,14 +484,13 @@ class TwoBodyPlotWindow(QWidget):
         Output:
             This function does not return any values
     """
-    def __init__(self, plotType, masses, ic, t0, tn, i, j, k, mass1Name, mass2Name, windowTitle):
+    def __init__(self, plotType, masses, ic, t0, tn, i, j, k, mass1Name, mass2Name, windowTitle, precomputed = None):
         super().__init__()
         # Window title
         self.setWindowTitle(windowTitle)
         # Window sizes
         self.resize(800,500)
-        self.setMinimumWidth(800)
-        self.setMinimumHeight(500)
+        self.setMinimumSize(800, 500)
         # Layout
         self.layout = QVBoxLayout()
         # Canvas for plot
@@ -613,7 +498,7 @@ class TwoBodyPlotWindow(QWidget):
             self.plotCanvas = TwoBodyCanvas(self, width=3, height=2, dpi=100, plotType='2d')
         else:
             self.plotCanvas = TwoBodyCanvas(self, width=3, height=2, dpi=100, plotType='3d')
-        self.plotCanvas.Plot(plotType, masses, ic, t0, tn, i, j, k, mass1Name, mass2Name)
+        self.plotCanvas.Plot(plotType, masses, ic, t0, tn, i, j, k, mass1Name, mass2Name, precomputed = precomputed)
         # Tool bar
         self.toolBar = NavigationToolbar(self.plotCanvas, self)
         # Widget layout addition
@@ -649,21 +534,23 @@ class TwoBodyPlotWindow(QWidget):
         ClearMass1Params - Clears the mass 1 parameters children
         ClearMass2Params - Clears the mass 2 parameters children
         ClearTime - Clears the time value line edit
+        closeEvent - Stops pending window updates when the window is closed
         ConnectSignals - Connects the signals member functions to applicable widgets
         DefaultState - Default state for widgets
         DisableFields - Disables fields based upon input parameter
         EnableFields - Enables fields based upon input parameter
+        FieldWidgets - Table of the widgets in each field used by DefaultState, DisableFields, and EnableFields
         GrabChildren - Grabs all the children from the fields
         InitUI - Initializes the user interface for the window
-        IsNum - Checks to see if an input is able to be converted to a number
-        IsPositive - Checks if a number is positive
-        OnMass1CBChange - Event handler for when mass 1's checkbox is changed
-        OnMass2CBChange - Event handler for when mass 2's checkbox is changed
+        NewLineEdit - Creates a named line edit for the parameter fields
+        OnMassCBChange - Event handler for when a mass's combo box is changed
         RandomAll - Randomizes all input fields
-        RandomMass1 - Randomizes the mass 1 parameters
-        RandomMass2 - Randomizes the mass 2 parameters
+        RandomMass - Randomizes the parameters of a mass
         RandomPlots - Randomizes the checkboxes that get selected
         RandomTime - Randomizes the time span
+        SetChecked - Checks or unchecks checkboxes with their signals blocked
+        SetFieldsEnabled - Enables or disables the widgets of a field, shared by DefaultState, DisableFields, and EnableFields
+        SetText - Sets the text of line edits with their signals blocked
         Signals - Checks for specific conditions of line edits and combo boxes
         ReturnHome - Returns home and closes the current window
         SelectAllPlots - Selects all plot checkboxes
@@ -724,12 +611,30 @@ clearBtnName = "Clear All"
 randomBtnName = "Randomize All"
 homeBtnName = "Home"
 
+# Object names of the children in each field, in the order GrabChildren returns them
+childNames = (
+    # Mass 1 parameters
+    (mass1CBName, mass1MassNameLEName, mass1MassLEName, mass1InitPosXLEName, mass1InitPosYLEName, mass1InitPosZLEName, mass1InitVelXLEName, mass1InitVelYLEName, mass1InitVelZLEName, mass1ClearBtnName, mass1RandBtnName),
+    # Mass 2 parameters
+    (mass2CBName, mass2MassNameLEName, mass2MassLEName, mass2InitPosXLEName, mass2InitPosYLEName, mass2InitPosZLEName, mass2InitVelXLEName, mass2InitVelYLEName, mass2InitVelZLEName, mass2ClearBtnName, mass2RandBtnName),
+    # Time span parameters
+    (timeValLEName, timeValClearBtnName, timeValRandBtnName),
+    # Plot check box parameters
+    (pos2DPlotCBName, pos2DAniCBName, vel2DPlotCBName, vel2DAniCBName, pos3DPlotCBName, pos3DAniCBName, vel3DPlotCBName, vel3DAniCBName, plotSelAllBtnName, plotSelRandBtnName, plotSelUnsBtnName),
+    # Axis check box parameters
+    (xAxisXCBName, xAxisYCBName, xAxisZCBName, xAxisTCBName, yAxisXCBName, yAxisYCBName, yAxisZCBName, yAxisTCBName, zAxisXCBName, zAxisYCBName, zAxisZCBName, zAxisTCBName),
+    # Main buttons parameters
+    (calculateBtnName, clearBtnName, randomBtnName, homeBtnName),
+)
+
 # Widget sizes
 headerSize = 20
 comboBoxMinWidth = 200
 comboBoxMinHeight = 25
 lineEditMinWidth = 200
 lineEditMinHeight = 25
+lineEditHalfWidth = lineEditMinWidth // 2
+lineEditHalfHeight = lineEditMinHeight // 2
 buttonMinWidth = 225
 buttonMinHeight = 35
 
@@ -748,6 +653,8 @@ uraCB = "Uranus"
 nepCB = "Neptune"
 pluCB = "Pluto"
 cbItems = [selectObjectCB, arbitraryObjectCB, sunCB, mercCB, venCB, earCB, moonCB, marsCB, jupCB, satCB, uraCB, nepCB, pluCB]
+# Mass, position, and velocity text of each object in the combo boxes after the arbitrary object
+cbParams = [tuple(str(value) for value in [MASSESARR[i]] + list(POSMATRIX[i]) + list(VELMATRIX[i])) for i in range(len(MASSESARR))]
 
 class TwoBodyWindow(QWidget):
     """ Constructor - Constructs window with widgets and layouts of widgets
@@ -762,6 +669,10 @@ class TwoBodyWindow(QWidget):
     def __init__(self, mainWindow):
         super().__init__()
         self.mainWindow = mainWindow
+        self.childWidgets = None
+        self.fieldWidgets = None
+        self.signalsTimer = None
+        self.rng = np.random.default_rng()
         self.InitUI()
 
     """ Calculate - Generates the plot(s) for specific conditions
@@ -771,6 +682,7 @@ class TwoBodyWindow(QWidget):
             * Grab the children from the window
             * Create empty arrays for the values in the window
             * Define the inner functions that will perform repeat operations in the function
+            * Parse the numeric line edits of each field once
             * Check to make sure that the inputs are valid
                 * If they are not, create a dialog box for the type of error
                 * If they are, continue the next chain of reasoning
@@ -816,71 +728,70 @@ class TwoBodyWindow(QWidget):
             layout.addWidget(warningLabel)
             dialogBox.setLayout(layout)
             dialogBox.exec()
+        # Parse a field's line edits in one pass, None if any of them is not a number
+        def ParseField(widgets):
+            try:
+                return np.array([float(widget.text()) for widget in widgets])
+            except ValueError:
+                return None
         # Grab values
-        def GrabValues(children):
-            mass1 = float(children[0][2].text())
+        def GrabValues(children, fields):
             mass1Name = str(children[0][1].text())
-            mass1InitPos = [float(str(children[0][3].text())), float(str(children[0][4].text())), float(str(children[0][5].text()))]
-            mass1InitVel = [float(str(children[0][6].text())), float(str(children[0][7].text())), float(str(children[0][8].text()))]
-            mass2 = float(children[1][2].text())
             mass2Name = str(children[1][1].text())
-            mass2InitPos = [float(str(children[1][3].text())), float(str(children[1][4].text())), float(str(children[1][5].text()))]
-            mass2InitVel = [float(str(children[1][6].text())), float(str(children[1][7].text())), float(str(children[1][8].text()))]
-            timeSpan = float(float(children[2][0].text()) * 365.25 * DS)
-            masses = [mass1, mass2]
-            ic = [mass1InitPos, mass2InitPos, mass1InitVel, mass2InitVel]
+            timeSpan = float(fields[-1][0] * DY)
+            masses = [fields[0][0], fields[1][0]]
+            ic = np.array([fields[0][1:4], fields[1][1:4], fields[0][4:7], fields[1][4:7]])
             return masses, ic, timeSpan, mass1Name, mass2Name
         # Input fields entered check
-        mass1IsNum = all(isinstance(widget, QLineEdit) and self.IsNum(str(widget.text())) == True for widget in children[0][2:9])
-        if (mass1IsNum == True):
-            mass1IsPos = self.IsPositive(float(str(children[0][2].text()))) == True
-        else:
-            mass1IsPos = False
-        mass2IsNum = all(isinstance(widget, QLineEdit) and self.IsNum(str(widget.text())) == True for widget in children[1][2:9])
-        if (mass2IsNum == True):
-            mass2IsPos = self.IsPositive(float(str(children[1][2].text()))) == True
-        else:
-            mass2IsPos = False
-        timeIsNum = self.IsNum(str(children[2][0].text())) == True
-        if (timeIsNum == True):
-            timeIsPos = self.IsPositive(float(str(children[2][0].text()))) == True
-        else:
-            timeIsPos = False
+        fields = [ParseField(children[0][2:9]), ParseField(children[1][2:9]), ParseField(children[2][0:1])]
+        mass1IsNum = fields[0] is not None
+        mass1IsPos = mass1IsNum == True and fields[0][0] > 0
+        mass2IsNum = fields[1] is not None
+        mass2IsPos = mass2IsNum == True and fields[1][0] > 0
+        timeIsNum = fields[-1] is not None
+        timeIsPos = timeIsNum == True and fields[-1][0] > 0
         if (mass1IsNum == True and mass2IsNum == True and timeIsNum == True):
             if (mass1IsPos == True and mass2IsPos == True and timeIsPos == True):
-                values = GrabValues(children)
+                values = GrabValues(children, fields)
                 axis = AxisIndices(children)
+                # Solve once for every selected plot
+                solution = None
+                if (any(widget.isChecked() for widget in children[3][0:8])):
+                    if (ADAPTIVE == True):
+                        solution = CachedSolve(RK4TwoBodyAdaptive, TwoCoupledBodiesModel, values[0], values[1], 0, values[2], atol = ADAPTIVEATOL, rtol = ADAPTIVERTOL)
+                    else:
+                        solution = CachedSolve(RK4TwoBody, TwoCoupledBodiesModel, values[0], values[1], 0, values[2])
                 # 2D Position Plot
                 if (children[3][0].isChecked() == True):
-                    self.TwoDPosPlot = TwoBodyPlotWindow(0, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Position Plot")
+                    self.TwoDPosPlot = TwoBodyPlotWindow(0, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Position Plot", precomputed = solution)
                     self.TwoDPosPlot.show()
                 # 2D Position Animation
                 if (children[3][1].isChecked() == True):
-                    self.TwoDPosAni = TwoBodyPlotWindow(1, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Position Animation")
+                    self.TwoDPosAni = TwoBodyPlotWindow(1, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Position Animation", precomputed = solution)
                     self.TwoDPosAni.show()
                 # 2D Velocity Plot
                 if (children[3][2].isChecked() == True):
-                    self.TwoDVelPlot = TwoBodyPlotWindow(2, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Velocity Plot")
+                    self.TwoDVelPlot = TwoBodyPlotWindow(2, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Velocity Plot", precomputed = solution)
                     self.TwoDVelPlot.show()
                 # 2D Velocity Animation
                 if (children[3][3].isChecked() == True):
-                    self.TwoDVelAni = TwoBodyPlotWindow(3, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Velocity Animation")
+                    self.TwoDVelAni = TwoBodyPlotWindow(3, values[0], values[1], 0, values[2], axis[0], axis[1], None, values[3], values[4], "2D Two Body Velocity Animation", precomputed = solution)
                     self.TwoDVelAni.show()
                 # 3D Position Plot
                 if (children[3][4].isChecked() == True):
-                    self.ThreeDPosPlot = TwoBodyPlotWindow(4, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Position Plot")
+                    self.ThreeDPosPlot = TwoBodyPlotWindow(4, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Position Plot", precomputed = solution)
                     self.ThreeDPosPlot.show()
                 # 3D Position Animation
                 if (children[3][5].isChecked() == True):
-                    self.ThreeDPosAni = TwoBodyPlotWindow(5, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Position Animation")
+                    self.ThreeDPosAni = TwoBodyPlotWindow(5, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Position Animation", precomputed = solution)
                     self.ThreeDPosAni.show()
                 # 3D Velocity Plot
                 if (children[3][6].isChecked() == True):
-                    self.ThreeDVelPlot = TwoBodyPlotWindow(6, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Velocity Plot")
+                    self.ThreeDVelPlot = TwoBodyPlotWindow(6, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Velocity Plot", precomputed = solution)
                     self.ThreeDVelPlot.show()
                 # 3D Velocity Animation
                 if (children[3][7].isChecked() == True):
-                    self.ThreeDVelAni = TwoBodyPlotWindow(7, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Velocity Animation")
+                    self.ThreeDVelAni = TwoBodyPlotWindow(7, values[0], values[1], 0, values[2], axis[0], axis[1], axis[2], values[3], values[4], "3D Two Body Velocity Animation", precomputed = solution)
                     self.ThreeDVelAni.show()
             else:
                 if (mass1IsPos != True):
@@ -924,69 +835,113 @@ class TwoBodyWindow(QWidget):
             This function does not have any unique input parameters
         Algorithm:
             * Grab the children from the window
-            * Clear all the line edits in the field
+            * Clear all the line edits in the field with their signals blocked
+            * If any line edit was cleared, update the window once
         Output:
             This function does not return a value
     """
     def ClearMass1Params(self):
         # Grab children
         children = self.GrabChildren()
-        # Clear children
+        # Clear children with their signals blocked, then update the window once
+        cleared = False
         for widget in children[0][1:9]:
-            widget.setText("")
+            cleared = cleared or widget.text() != ""
+            with QSignalBlocker(widget):
+                widget.clear()
+        if (cleared == True):
+            self.Signals()
 
     """ ClearMass2Params - Clears the mass 2 parameters children
         Input:
             This function does not have any unique input parameters
         Algorithm:
             * Grab the children from the window
-            * Clear all the line edits in the field
+            * Clear all the line edits in the field with their signals blocked
+            * If any line edit was cleared, update the window once
         Output:
             This function does not return a value
     """
     def ClearMass2Params(self):
         # Grab children
         children = self.GrabChildren()
-        # Clear children
+        # Clear children with their signals blocked, then update the window once
+        cleared = False
         for widget in children[1][1:9]:
-            widget.setText("")
+            cleared = cleared or widget.text() != ""
+            with QSignalBlocker(widget):
+                widget.clear()
+        if (cleared == True):
+            self.Signals()
 
     """ ClearTime - Clears the time value line edit
         Input:
             This function does not have any unique input parameters
         Algorithm:
             * Grab children from window
-            * Clear the line edit
+            * Clear the line edit with its signals blocked
+            * If it was cleared, update the window once
         Output:
             This function does not return a value
     """
     def ClearTime(self):
         # Grab children
         children = self.GrabChildren()
-        # Clear field
-        children[2][0].setText("")
+        # Clear field with its signals blocked, then update the window once
+        if (children[2][0].text() != ""):
+            with QSignalBlocker(children[2][0]):
+                children[2][0].clear()
+            self.Signals()
+
+    """ closeEvent - Stops pending window updates when the window is closed
+        Input:
+            event - Object for the close event
+        Algorithm:
+            * Stop the debounce timer if the signals were connected, so a pending update does not run on a closed window
+            * Call the close event method
+        Output:
+            This function does not return a value
+    """
+    def closeEvent(self, event):
+        if (self.signalsTimer is not None):
+            self.signalsTimer.stop()
+        super().closeEvent(event)
 
     """ ConnectSignals - Connects the signals member functions to applicable widgets
         Input:
             This function does not have any unique input parameters
         Algorithm:
+            * If the signals were connected before, return
             * Grab children from window
-            * Connect widgets to the signals member function
+            * Create a single shot timer that runs the signals member function
+            * Iterate over the children of every field in one pass
+                * Look up the value changed signal of the widget type
+                * Connect line edits to restart the timer, so typing is handled once it pauses
+                * Connect other widgets to the signals member function
         Output:
             This function does not return a value
     """
     def ConnectSignals(self):
+        # Signals are connected only once, a second call would run Signals twice per change
+        if (self.signalsTimer is not None):
+            return
         # Grab children
         children = self.GrabChildren()
+        # Debounce timer, a burst of typing runs the signals member function once
+        self.signalsTimer = QTimer(self)
+        self.signalsTimer.setSingleShot(True)
+        self.signalsTimer.setInterval(SIGNALDELAY)
+        self.signalsTimer.timeout.connect(self.Signals)
         # Connect widgets
-        for widgets in children:
-            for widget in widgets:
-                if isinstance(widget, QComboBox):
-                    widget.currentIndexChanged.connect(self.Signals)
-                if isinstance(widget, QLineEdit):
-                    widget.textChanged.connect(self.Signals)
-                if isinstance(widget, QCheckBox):
-                    widget.stateChanged.connect(self.Signals)
+        for row in children:
+            for widget in row:
+                signal = SIGNALNAMES.get(type(widget))
+                if (signal is not None):
+                    # Typing restarts the timer, discrete changes update straight away
+                    if (type(widget) is QLineEdit):
+                        getattr(widget, signal).connect(lambda text: self.signalsTimer.start())
+                    else:
+                        getattr(widget, signal).connect(self.Signals)
 
     """ DefaultState - Default state for widgets
         Input:
@@ -1002,83 +957,28 @@ class TwoBodyWindow(QWidget):
                 8 - Default 0-7
         Algorithm:
             * Grab children from window
-            * Define disable mass 1 function
-            * Define disable time function
-            * Define disable mass 2 function
-            * Define disable plot selection checkboxes function
-            * Define axis selection checkboxes function
-            * Define disable calculate function
-            * Define disable all function
-            * Set the field(s) to default based upon the input parameter
+            * Look up the widgets of the field in the field table
+            * Uncheck the axis selection checkboxes among them with their signals blocked
+            * Disable the field
+            * If any checkbox was unchecked, run the signals member function once
         Output:
             This function does not return a value
     """
     def DefaultState(self, field):
         # Grab children
         children = self.GrabChildren()
-        # Default mass 1 parameters children function
-        def DefaultMass1():
-            for widget in children[0][2:10]:
-                widget.setDisabled(True)
-        # Default time values children function
-        def DefaultTime():
-            for widget in children[2]:
-                widget.setDisabled(True)
-        # Default mass 2 parameters children function
-        def DefaultMass2():
-            for widget in children[1][2:10]:
-                widget.setDisabled(True)
-        # Default plot selection checkboxes children function
-        def DefaultPlotSelCB():
-            for widget in children[3]:
-                widget.setDisabled(True)
-        # Default x axis selection checkboxes children function
-        def DefaultXAxisCB():
-            for widget in children[4][0:4]:
-                widget.setChecked(False)
-                widget.setDisabled(True)
-        # Default y axis selection checkboxes children function
-        def DefaultYAxisCB():
-            for widget in children[4][4:8]:
-                widget.setChecked(False)
-                widget.setDisabled(True)
-        # Default z axis selection checkboxes children function
-        def DefaultZAxisCB():
-            for widget in children[4][8:12]:
-                widget.setChecked(False)
-                widget.setDisabled(True)
-        # Default calculate button function
-        def DefaultCalcBtn():
-            children[5][0].setDisabled(True)
-        # Default all function
-        def DefaultAll():
-            DefaultMass1()
-            DefaultTime()
-            DefaultMass2()
-            DefaultPlotSelCB()
-            DefaultXAxisCB()
-            DefaultYAxisCB()
-            DefaultZAxisCB()
-            DefaultCalcBtn()
-        # Set fields to default state
-        if (field == 0):
-            DefaultMass1()
-        elif (field == 1):
-            DefaultTime()
-        elif (field == 2):
-            DefaultMass2()
-        elif (field == 3):
-            DefaultPlotSelCB()
-        elif (field == 4):
-            DefaultXAxisCB()
-        elif (field == 5):
-            DefaultYAxisCB()
-        elif (field == 6):
-            DefaultZAxisCB()
-        elif (field == 7):
-            DefaultCalcBtn()
-        elif (field == 8):
-            DefaultAll()
+        # Uncheck axis checkboxes with their signals blocked
+        unchecked = False
+        for widget in self.FieldWidgets()[field]:
+            if (widget in children[4]):
+                unchecked = unchecked or widget.isChecked()
+                with QSignalBlocker(widget):
+                    widget.setChecked(False)
+        # Disable fields
+        self.SetFieldsEnabled(field, False)
+        # Update the window once for every unchecked checkbox
+        if (unchecked == True):
+            self.Signals()
 
     """ DisableFields - Disables fields based upon input parameter
         Input:
@@ -1093,81 +993,13 @@ class TwoBodyWindow(QWidget):
                 7 - Disable main buttons
                 8 - Disable 0-7
         Algorithm:
-            * Grab the children from the window
-            * Define mass 1 parameters function
-            * Define time values function
-            * Define mass 2 parameters function
-            * Define plot selection checkbox parameters function
-            * Define axis selection checkbox parameters function
-            * Define main buttons function
-            * Define all functions function
-            * Disable field based off input parameter value
+            * Disable the widgets of the field
         Output:
             This function does not return a value
     """
     def DisableFields(self, field):
-        # Grab children
-        children = self.GrabChildren()
-        # Disable mass 1 parameters children function
-        def DisableMass1():
-            for widget in children[0][2:10]:
-                widget.setDisabled(True)
-        # Disable time values children function
-        def DisableTime():
-            for widget in children[2]:
-                widget.setDisabled(True)
-        # Disable mass 2 parameters children function
-        def DisableMass2():
-            for widget in children[1][2:10]:
-                widget.setDisabled(True)
-        # Disable plot selection checkboxes children function
-        def DisablePlotSelCB():
-            for widget in children[3]:
-                widget.setDisabled(True)
-        # Disable x axis selection checkboxes children function
-        def DisableXAxisCB():
-            for widget in children[4][0:4]:
-                widget.setDisabled(True)
-        # Disable y axis selection checkboxes children function
-        def DisableYAxisCB():
-            for widget in children[4][4:8]:
-                widget.setDisabled(True)
-        # Disable z axis selection checkboxes children function
-        def DisableZAxisCB():
-            for widget in children[4][8:12]:
-                widget.setDisabled(True)
-        # Disable calculate button function
-        def DisableCalcBtn():
-            children[5][0].setDisabled(True)
-        # Disable all function
-        def DisableAll():
-            DisableMass1()
-            DisableTime()
-            DisableMass2()
-            DisablePlotSelCB()
-            DisableXAxisCB()
-            DisableYAxisCB()
-            DisableZAxisCB()
-            DisableCalcBtn()
-        # Set fields to default state
-        if (field == 0):
-            DisableMass1()
-        elif (field == 1):
-            DisableTime()
-        elif (field == 2):
-            DisableMass2()
-        elif (field == 3):
-            DisablePlotSelCB()
-        elif (field == 4):
-            DisableXAxisCB()
-        elif (field == 5):
-            DisableYAxisCB()
-        elif (field == 6):
-            DisableZAxisCB()
-        elif (field == 7):
-            DisableCalcBtn()
-        elif (field == 8):
-            DisableAll()
+        # Disable fields
+        self.SetFieldsEnabled(field, False)
 
     """ EnableFields - Enables fields based upon input parameter
         Input:
@@ -1182,91 +1014,50 @@ class TwoBodyWindow(QWidget):
                 7 - Enable main buttons
                 8 - Enable 0-7
         Algorithm:
-            * Grab the children from the window
-            * Define mass 1 parameters function
-            * Define time values function
-            * Define mass 2 parameters function
-            * Define checkbox parameters function
-            * Define calculate button function
-            * Define all functions function
-            * Enable field based off input parameter value
+            * Enable the widgets of the field
         Output:
             This function does not return a value
     """
     def EnableFields(self, field):
-        # Grab children
-        children = self.GrabChildren()
-        # Enable mass 1 parameters children function
-        def EnableMass1():
-            for widget in children[0][2:10]:
-                widget.setEnabled(True)
-        # Enable time values children function
-        def EnableTime():
-            for widget in children[2]:
-                widget.setEnabled(True)
-        # Enable mass 2 parameters children function
-        def EnableMass2():
-            for widget in children[1][2:10]:
-                widget.setEnabled(True)
-        # Enable plot selection checkboxes children function
-        def EnablePlotSelCB():
-            for widget in children[3]:
-                widget.setEnabled(True)
-        # Enable x axis selection checkboxes children function
-        def EnableXAxisCB():
-            for widget in children[4][0:4]:
-                widget.setEnabled(True)
-        # Enable y axis selection checkboxes children function
-        def EnableYAxisCB():
-            for widget in children[4][4:8]:
-                widget.setEnabled(True)
-        # Enable z axis selection checkboxes children function
-        def EnableZAxisCB():
-            for widget in children[4][8:12]:
-                widget.setEnabled(True)
-        # Enable calculate button function
-        def EnableCalcBtn():
-            children[5][0].setEnabled(True)
-        # Enable all function
-        def EnableAll():
-            EnableMass1()
-            EnableTime()
-            EnableMass2()
-            EnablePlotSelCB()
-            EnableXAxisCB()
-            EnableYAxisCB()
-            EnableZAxisCB()
-            EnableCalcBtn()
-        # Set fields to default state
-        if (field == 0):
-            EnableMass1()
-        elif (field == 1):
-            EnableTime()
-        elif (field == 2):
-            EnableMass2()
-        elif (field == 3):
-            EnablePlotSelCB()
-        elif (field == 4):
-            EnableXAxisCB()
-        elif (field == 5):
-            EnableYAxisCB()
-        elif (field == 6):
-            EnableZAxisCB()
-        elif (field == 7):
-            EnableCalcBtn()
-        elif (field == 8):
-            EnableAll()
+        # Enable fields
+        self.SetFieldsEnabled(field, True)
+
+    """ FieldWidgets - Table of the widgets in each field used by DefaultState, DisableFields, and EnableFields
+        Input:
+            This function does not have any unique input parameters
+        Algorithm:
+            * If the table was built before, return it
+            * Grab the children from the window
+            * Slice the widgets of each field out of the children, in the order of the field numbers
+                * The mass parameter fields are the containers holding their mass, initial condition, and clear widgets
+            * Add the widgets of every field as the last entry
+            * Store and return the table
+        Output:
+            fieldWidgets - Tuple of widget lists indexed by field number, entry 8 holds all of them
+    """
+    def FieldWidgets(self):
+        # Widgets never change after InitUI, build the table only on the first call
+        if (self.fieldWidgets is None):
+            # Grab children
+            children = self.GrabChildren()
+            # Widgets of each field
+            fields = [[self.mass1Inputs], children[2], [self.mass2Inputs], children[3], children[4][0:4], children[4][4:8], children[4][8:12], children[5][0:1]]
+            self.fieldWidgets = tuple(fields) + ([widget for field in fields for widget in field],)
+        return self.fieldWidgets
 
     """ GrabChildren - Grabs all the children from the fields
         Input:
             This function does not have any unique input parameters
         Algorithm:
+            * If the children were grabbed before, return the stored arrays
+            * Find every child widget in one sweep and index them by object name
             * Grab the children from the mass 1 parameters field, add them to their own array
             * Grab the children from the mass 2 parameters field, add them to their own array
             * Grab the children from the time values field, add them to their own array
             * Grab the children from the plot selection checkbox parameters field, add them to their own array
             * Grab the children from the axis selection checkbox parameters field, add them to their own array
             * Grab the children from the main buttons field, add them to their own array
+            * Store the arrays so later calls skip the search
         Output:
             mass1Arr - Array of mass 1 children
                 mass1Arr[0] - Mass 1 combo box
@@ -1328,72 +1119,14 @@ class TwoBodyWindow(QWidget):
                 mainBtnsArr[3] - Home button
     """
     def GrabChildren(self):
-        # Mass 1 parameters
-        mass1CB = self.findChild(QComboBox, mass1CBName)
-        mass1MassNameLE = self.findChild(QLineEdit, mass1MassNameLEName)
-        mass1MassLE = self.findChild(QLineEdit, mass1MassLEName)
-        mass1InitPosXLE = self.findChild(QLineEdit, mass1InitPosXLEName)
-        mass1InitPosYLE = self.findChild(QLineEdit, mass1InitPosYLEName)
-        mass1InitPosZLE = self.findChild(QLineEdit, mass1InitPosZLEName)
-        mass1InitVelXLE = self.findChild(QLineEdit, mass1InitVelXLEName)
-        mass1InitVelYLE = self.findChild(QLineEdit, mass1InitVelYLEName)
-        mass1InitVelZLE = self.findChild(QLineEdit, mass1InitVelZLEName)
-        mass1ClearBtn = self.findChild(QPushButton, mass1ClearBtnName)
-        mass1RandBtn = self.findChild(QPushButton, mass1RandBtnName)
-        mass1Arr = [mass1CB, mass1MassNameLE, mass1MassLE, mass1InitPosXLE, mass1InitPosYLE, mass1InitPosZLE, mass1InitVelXLE, mass1InitVelYLE, mass1InitVelZLE, mass1ClearBtn, mass1RandBtn]
-        # Mass 2 parameters
-        mass2CB = self.findChild(QComboBox, mass2CBName)
-        mass2MassNameLE = self.findChild(QLineEdit, mass2MassNameLEName)
-        mass2MassLE = self.findChild(QLineEdit, mass2MassLEName)
-        mass2InitPosXLE = self.findChild(QLineEdit, mass2InitPosXLEName)
-        mass2InitPosYLE = self.findChild(QLineEdit, mass2InitPosYLEName)
-        mass2InitPosZLE = self.findChild(QLineEdit, mass2InitPosZLEName)
-        mass2InitVelXLE = self.findChild(QLineEdit, mass2InitVelXLEName)
-        mass2InitVelYLE = self.findChild(QLineEdit, mass2InitVelYLEName)
-        mass2InitVelZLE = self.findChild(QLineEdit, mass2InitVelZLEName)
-        mass2ClearBtn = self.findChild(QPushButton, mass2ClearBtnName)
-        mass2RandBtn = self.findChild(QPushButton, mass2RandBtnName)
-        mass2Arr = [mass2CB, mass2MassNameLE, mass2MassLE, mass2InitPosXLE, mass2InitPosYLE, mass2InitPosZLE, mass2InitVelXLE, mass2InitVelYLE, mass2InitVelZLE, mass2ClearBtn, mass2RandBtn]
-        # Time span parameters
-        timeValLE = self.findChild(QLineEdit, timeValLEName)
-        timeValClearBtn = self.findChild(QPushButton, timeValClearBtnName)
-        timeValRandBtn = self.findChild(QPushButton, timeValRandBtnName)
-        timeValArr = [timeValLE, timeValClearBtn, timeValRandBtn]
-        # Plot check box parameters
-        pos2DPlotCB = self.findChild(QCheckBox, pos2DPlotCBName)
-        pos2DAniCB = self.findChild(QCheckBox, pos2DAniCBName)
-        vel2DPlotCB = self.findChild(QCheckBox, vel2DPlotCBName)
-        vel2DAniCB = self.findChild(QCheckBox, vel2DAniCBName)
-        pos3DPlotCB = self.findChild(QCheckBox, pos3DPlotCBName)
-        pos3DAniCB = self.findChild(QCheckBox, pos3DAniCBName)
-        vel3DPlotCB = self.findChild(QCheckBox, vel3DPlotCBName)
-        vel3DAniCB = self.findChild(QCheckBox, vel3DAniCBName)
-        plotSelAllBtn = self.findChild(QPushButton, plotSelAllBtnName)
-        plotSelRandBtn = self.findChild(QPushButton, plotSelRandBtnName)
-        plotSelUnsBtn = self.findChild(QPushButton, plotSelUnsBtnName)
-        plotSelArr = [pos2DPlotCB, pos2DAniCB, vel2DPlotCB, vel2DAniCB, pos3DPlotCB, pos3DAniCB, vel3DPlotCB, vel3DAniCB, plotSelAllBtn, plotSelRandBtn, plotSelUnsBtn]
-        # Axis check box parameters
-        xAxisXCB = self.findChild(QCheckBox, xAxisXCBName)
-        xAxisYCB = self.findChild(QCheckBox, xAxisYCBName)
-        xAxisZCB = self.findChild(QCheckBox, xAxisZCBName)
-        xAxisTCB = self.findChild(QCheckBox, xAxisTCBName)
-        yAxisXCB = self.findChild(QCheckBox, yAxisXCBName)
-        yAxisYCB = self.findChild(QCheckBox, yAxisYCBName)
-        yAxisZCB = self.findChild(QCheckBox, yAxisZCBName)
-        yAxisTCB = self.findChild(QCheckBox, yAxisTCBName)
-        zAxisXCB = self.findChild(QCheckBox, zAxisXCBName)
-        zAxisYCB = self.findChild(QCheckBox, zAxisYCBName)
-        zAxisZCB = self.findChild(QCheckBox, zAxisZCBName)
-        zAxisTCB = self.findChild(QCheckBox, zAxisTCBName)
-        axisSelArr = [xAxisXCB, xAxisYCB, xAxisZCB, xAxisTCB, yAxisXCB, yAxisYCB, yAxisZCB, yAxisTCB, zAxisXCB, zAxisYCB, zAxisZCB, zAxisTCB]
-        # Main buttons parameters
-        calculateBtn = self.findChild(QPushButton, calculateBtnName)
-        clearBtn = self.findChild(QPushButton, clearBtnName)
-        randomBtn = self.findChild(QPushButton, randomBtnName)
-        homeBtn = self.findChild(QPushButton, homeBtnName)
-        mainBtnsArr = [calculateBtn, clearBtn, randomBtn, homeBtn]
+        # The widgets never change after InitUI, find them only on the first call
+        if (self.childWidgets is None):
+            # Every named widget from a single sweep of the window
+            byName = {widget.objectName(): widget for widget in self.findChildren(QWidget) if widget.objectName() != ""}
+            # Children of each field, in the order of their object names
+            self.childWidgets = tuple([byName[name] for name in names] for names in childNames)
         # Return arrays
-        return mass1Arr, mass2Arr, timeValArr, plotSelArr, axisSelArr, mainBtnsArr
+        return self.childWidgets
 
     """ InitUI - Initializes the user interface for the window
         Input:
@@ -1403,6 +1136,7 @@ class TwoBodyWindow(QWidget):
             * Add widgets to layouts
             * Add layouts to main layout
             * Set main layout
+            * Grab the children once so later calls reuse them
         Output:
             This function does not return a value
     """
@@ -1411,8 +1145,7 @@ class TwoBodyWindow(QWidget):
         self.setWindowTitle("Two Body Simulation")
         # Height and width of window
         self.resize(800, 500)
-        self.setMinimumWidth(800)
-        self.setMinimumHeight(500)
+        self.setMinimumSize(800, 500)
         ###################################
         ##### Layouts
         ###################################
@@ -1440,6 +1173,10 @@ class TwoBodyWindow(QWidget):
         mass1ZValsLayout = QHBoxLayout()
         mass1ZValsLayout.setContentsMargins(0,0,0,0)
         mass1ZValsLayout.setSpacing(5)
+        ## Mass 1 inputs sub layout
+        mass1InputsLayout = QVBoxLayout()
+        mass1InputsLayout.setContentsMargins(0,0,0,0)
+        mass1InputsLayout.setSpacing(5)
         # Time values layout
         timeValLayout = QVBoxLayout()
         timeValLayout.setContentsMargins(0,0,0,0)
@@ -1460,6 +1197,10 @@ class TwoBodyWindow(QWidget):
         mass2ZValsLayout = QHBoxLayout()
         mass2ZValsLayout.setContentsMargins(0,0,0,0)
         mass2ZValsLayout.setSpacing(5)
+        ## Mass 2 inputs sub layout
+        mass2InputsLayout = QVBoxLayout()
+        mass2InputsLayout.setContentsMargins(0,0,0,0)
+        mass2InputsLayout.setSpacing(5)
         # Plot selection layout
         plotSelLayout = QVBoxLayout()
         plotSelLayout.setContentsMargins(0,0,0,0)
@@ -1521,84 +1262,45 @@ class TwoBodyWindow(QWidget):
         # Mass 1 combo box
         mass1ComboBox = QComboBox()
         mass1ComboBox.setObjectName(mass1CBName)
-        mass1ComboBox.setMinimumWidth(comboBoxMinWidth)
-        mass1ComboBox.setMinimumHeight(comboBoxMinHeight)
+        mass1ComboBox.setMinimumSize(comboBoxMinWidth, comboBoxMinHeight)
         mass1ComboBox.addItems(cbItems)
-        mass1ComboBox.currentIndexChanged.connect(self.OnMass1CBChange)
+        mass1ComboBox.currentIndexChanged.connect(lambda index: self.OnMassCBChange(0))
         mass1ParamLayout.addWidget(mass1ComboBox, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Mass 1 name line edit
-        mass1NameLE = QLineEdit()
-        mass1NameLE.setObjectName(mass1MassNameLEName)
-        mass1NameLE.setMinimumWidth(lineEditMinWidth)
-        mass1NameLE.setMinimumHeight(lineEditMinHeight)
-        mass1NameLE.setPlaceholderText("Mass 1 Name")
-        mass1ParamLayout.addWidget(mass1NameLE)
+        mass1ParamLayout.addWidget(self.NewLineEdit(mass1MassNameLEName, "Mass 1 Name", lineEditMinWidth, lineEditMinHeight))
         # Mass 1 mass line edit
-        mass1MassLE = QLineEdit()
-        mass1MassLE.setObjectName(mass1MassLEName)
-        mass1MassLE.setMinimumWidth(lineEditMinWidth)
-        mass1MassLE.setMinimumHeight(lineEditMinHeight)
-        mass1MassLE.setPlaceholderText("Mass 1 In (Kg)")
-        mass1ParamLayout.addWidget(mass1MassLE)
+        mass1InputsLayout.addWidget(self.NewLineEdit(mass1MassLEName, "Mass 1 In (Kg)", lineEditMinWidth, lineEditMinHeight))
         ## Mass 1 initial x position line edit
-        mass1XPosLE = QLineEdit()
-        mass1XPosLE.setObjectName(mass1InitPosXLEName)
-        mass1XPosLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass1XPosLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass1XPosLE.setPlaceholderText("Initial X Position In (m)")
-        mass1XValsLayout.addWidget(mass1XPosLE)
+        mass1XValsLayout.addWidget(self.NewLineEdit(mass1InitPosXLEName, "Initial X Position In (m)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 1 initial x velocity line edit
-        mass1XVelLE = QLineEdit()
-        mass1XVelLE.setObjectName(mass1InitVelXLEName)
-        mass1XVelLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass1XVelLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass1XVelLE.setPlaceholderText("Initial X Velocity In (m/s)")
-        mass1XValsLayout.addWidget(mass1XVelLE)
+        mass1XValsLayout.addWidget(self.NewLineEdit(mass1InitVelXLEName, "Initial X Velocity In (m/s)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 1 initial y position line edit
-        mass1YPosLE = QLineEdit()
-        mass1YPosLE.setObjectName(mass1InitPosYLEName)
-        mass1YPosLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass1YPosLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass1YPosLE.setPlaceholderText("Initial Y Position In (m)")
-        mass1YValsLayout.addWidget(mass1YPosLE)
+        mass1YValsLayout.addWidget(self.NewLineEdit(mass1InitPosYLEName, "Initial Y Position In (m)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 1 initial y velocity line edit
-        mass1YVelLE = QLineEdit()
-        mass1YVelLE.setObjectName(mass1InitVelYLEName)
-        mass1YVelLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass1YVelLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass1YVelLE.setPlaceholderText("Initial Y Velocity In (m/s)")
-        mass1YValsLayout.addWidget(mass1YVelLE)
+        mass1YValsLayout.addWidget(self.NewLineEdit(mass1InitVelYLEName, "Initial Y Velocity In (m/s)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 1 initial z position line edit
-        mass1ZPosLE = QLineEdit()
-        mass1ZPosLE.setObjectName(mass1InitPosZLEName)
-        mass1ZPosLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass1ZPosLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass1ZPosLE.setPlaceholderText("Initial Z Position In (m)")
-        mass1ZValsLayout.addWidget(mass1ZPosLE)
+        mass1ZValsLayout.addWidget(self.NewLineEdit(mass1InitPosZLEName, "Initial Z Position In (m)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 1 initial z velocity line edit
-        mass1ZVelLE = QLineEdit()
-        mass1ZVelLE.setObjectName(mass1InitVelZLEName)
-        mass1ZVelLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass1ZVelLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass1ZVelLE.setPlaceholderText("Initial Z Velocity In (m/s)")
-        mass1ZValsLayout.addWidget(mass1ZVelLE)
+        mass1ZValsLayout.addWidget(self.NewLineEdit(mass1InitVelZLEName, "Initial Z Velocity In (m/s)", lineEditHalfWidth, lineEditHalfHeight))
         ## Add layouts to parent
-        mass1ParamLayout.addLayout(mass1XValsLayout)
-        mass1ParamLayout.addLayout(mass1YValsLayout)
-        mass1ParamLayout.addLayout(mass1ZValsLayout)
+        mass1InputsLayout.addLayout(mass1XValsLayout)
+        mass1InputsLayout.addLayout(mass1YValsLayout)
+        mass1InputsLayout.addLayout(mass1ZValsLayout)
         # Clear mass 1 parameters button
         mass1ClearBtn = QPushButton("Clear Mass 1 Parameters")
         mass1ClearBtn.setObjectName(mass1ClearBtnName)
-        mass1ClearBtn.setMinimumWidth(buttonMinWidth)
-        mass1ClearBtn.setMinimumHeight(buttonMinHeight)
+        mass1ClearBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         mass1ClearBtn.clicked.connect(self.ClearMass1Params)
-        mass1ParamLayout.addWidget(mass1ClearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
+        mass1InputsLayout.addWidget(mass1ClearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
+        # Mass 1 inputs container, DefaultState, DisableFields, and EnableFields switch it as one widget
+        self.mass1Inputs = QWidget()
+        self.mass1Inputs.setLayout(mass1InputsLayout)
+        mass1ParamLayout.addWidget(self.mass1Inputs)
         # Randomize mass 1 parameters button
         mass1RandBtn = QPushButton("Random Mass 1 Parameters")
         mass1RandBtn.setObjectName(mass1RandBtnName)
-        mass1RandBtn.setMinimumWidth(buttonMinWidth)
-        mass1RandBtn.setMinimumHeight(buttonMinHeight)
-        mass1RandBtn.clicked.connect(self.RandomMass1)
+        mass1RandBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
+        mass1RandBtn.clicked.connect(lambda: self.RandomMass(0))
         mass1ParamLayout.addWidget(mass1RandBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Mass 1 parameters spacer
         mass1Spacer = QSpacerItem(0, 10, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -1610,24 +1312,17 @@ class TwoBodyWindow(QWidget):
         timeValHeader = QLabel("Time Values")
         timeValLayout.addWidget(timeValHeader, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Time span line edit
-        timeSpanLE = QLineEdit()
-        timeSpanLE.setObjectName(timeValLEName)
-        timeSpanLE.setMinimumWidth(lineEditMinWidth)
-        timeSpanLE.setMinimumHeight(lineEditMinHeight)
-        timeSpanLE.setPlaceholderText("Time Span In Earth Years")
-        timeValLayout.addWidget(timeSpanLE)
+        timeValLayout.addWidget(self.NewLineEdit(timeValLEName, "Time Span In Earth Years", lineEditMinWidth, lineEditMinHeight))
         # Clear time span buttons
         timeSpanClearBtn = QPushButton("Clear Time Span")
         timeSpanClearBtn.setObjectName(timeValClearBtnName)
-        timeSpanClearBtn.setMinimumWidth(buttonMinWidth)
-        timeSpanClearBtn.setMinimumHeight(buttonMinHeight)
+        timeSpanClearBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         timeSpanClearBtn.clicked.connect(self.ClearTime)
         timeValLayout.addWidget(timeSpanClearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Randomize time span buttons
         timeSpanRandBtn = QPushButton("Random Time Span")
         timeSpanRandBtn.setObjectName(timeValRandBtnName)
-        timeSpanRandBtn.setMinimumWidth(buttonMinWidth)
-        timeSpanRandBtn.setMinimumHeight(buttonMinHeight)
+        timeSpanRandBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         timeSpanRandBtn.clicked.connect(self.RandomTime)
         timeValLayout.addWidget(timeSpanRandBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Time values spacer
@@ -1642,84 +1337,45 @@ class TwoBodyWindow(QWidget):
         # Mass 2 combo box
         mass2ComboBox = QComboBox()
         mass2ComboBox.setObjectName(mass2CBName)
-        mass2ComboBox.setMinimumWidth(comboBoxMinWidth)
-        mass2ComboBox.setMinimumHeight(comboBoxMinHeight)
+        mass2ComboBox.setMinimumSize(comboBoxMinWidth, comboBoxMinHeight)
         mass2ComboBox.addItems(cbItems)
-        mass2ComboBox.currentIndexChanged.connect(self.OnMass2CBChange)
+        mass2ComboBox.currentIndexChanged.connect(lambda index: self.OnMassCBChange(1))
         mass2ParamLayout.addWidget(mass2ComboBox, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Mass 2 name line edit
-        mass2NameLE = QLineEdit()
-        mass2NameLE.setObjectName(mass2MassNameLEName)
-        mass2NameLE.setMinimumWidth(lineEditMinWidth)
-        mass2NameLE.setMinimumHeight(lineEditMinHeight)
-        mass2NameLE.setPlaceholderText("Mass 2 Name")
-        mass2ParamLayout.addWidget(mass2NameLE)
+        mass2ParamLayout.addWidget(self.NewLineEdit(mass2MassNameLEName, "Mass 2 Name", lineEditMinWidth, lineEditMinHeight))
         # Mass 2 mass line edit
-        mass2MassLE = QLineEdit()
-        mass2MassLE.setObjectName(mass2MassLEName)
-        mass2MassLE.setMinimumWidth(lineEditMinWidth)
-        mass2MassLE.setMinimumHeight(lineEditMinHeight)
-        mass2MassLE.setPlaceholderText("Mass 2 In (Kg)")
-        mass2ParamLayout.addWidget(mass2MassLE)
+        mass2InputsLayout.addWidget(self.NewLineEdit(mass2MassLEName, "Mass 2 In (Kg)", lineEditMinWidth, lineEditMinHeight))
         ## Mass 2 initial x position line edit
-        mass2XPosLE = QLineEdit()
-        mass2XPosLE.setObjectName(mass2InitPosXLEName)
-        mass2XPosLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass2XPosLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass2XPosLE.setPlaceholderText("Initial X Position In (m)")
-        mass2XValsLayout.addWidget(mass2XPosLE)
+        mass2XValsLayout.addWidget(self.NewLineEdit(mass2InitPosXLEName, "Initial X Position In (m)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 2 initial x velocity line edit
-        mass2XVelLE = QLineEdit()
-        mass2XVelLE.setObjectName(mass2InitVelXLEName)
-        mass2XVelLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass2XVelLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass2XVelLE.setPlaceholderText("Initial X Velocity In (m/s)")
-        mass2XValsLayout.addWidget(mass2XVelLE)
+        mass2XValsLayout.addWidget(self.NewLineEdit(mass2InitVelXLEName, "Initial X Velocity In (m/s)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 2 initial y position line edit
-        mass2YPosLE = QLineEdit()
-        mass2YPosLE.setObjectName(mass2InitPosYLEName)
-        mass2YPosLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass2YPosLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass2YPosLE.setPlaceholderText("Initial Y Position In (m)")
-        mass2YValsLayout.addWidget(mass2YPosLE)
+        mass2YValsLayout.addWidget(self.NewLineEdit(mass2InitPosYLEName, "Initial Y Position In (m)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 2 initial y velocity line edit
-        mass2YVelLE = QLineEdit()
-        mass2YVelLE.setObjectName(mass2InitVelYLEName)
-        mass2YVelLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass2YVelLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass2YVelLE.setPlaceholderText("Initial Y Velocity In (m/s)")
-        mass2YValsLayout.addWidget(mass2YVelLE)
+        mass2YValsLayout.addWidget(self.NewLineEdit(mass2InitVelYLEName, "Initial Y Velocity In (m/s)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 2 initial z position line edit
-        mass2ZPosLE = QLineEdit()
-        mass2ZPosLE.setObjectName(mass2InitPosZLEName)
-        mass2ZPosLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass2ZPosLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass2ZPosLE.setPlaceholderText("Initial Z Position In (m)")
-        mass2ZValsLayout.addWidget(mass2ZPosLE)
+        mass2ZValsLayout.addWidget(self.NewLineEdit(mass2InitPosZLEName, "Initial Z Position In (m)", lineEditHalfWidth, lineEditHalfHeight))
         ## Mass 2 initial z velocity line edit
-        mass2ZVelLE = QLineEdit()
-        mass2ZVelLE.setObjectName(mass2InitVelZLEName)
-        mass2ZVelLE.setMinimumWidth(int(lineEditMinWidth / 2))
-        mass2ZVelLE.setMinimumHeight(int(lineEditMinHeight / 2))
-        mass2ZVelLE.setPlaceholderText("Initial Z Velocity In (m/s)")
-        mass2ZValsLayout.addWidget(mass2ZVelLE)
+        mass2ZValsLayout.addWidget(self.NewLineEdit(mass2InitVelZLEName, "Initial Z Velocity In (m/s)", lineEditHalfWidth, lineEditHalfHeight))
         ## Add layouts to parent
-        mass2ParamLayout.addLayout(mass2XValsLayout)
-        mass2ParamLayout.addLayout(mass2YValsLayout)
-        mass2ParamLayout.addLayout(mass2ZValsLayout)
+        mass2InputsLayout.addLayout(mass2XValsLayout)
+        mass2InputsLayout.addLayout(mass2YValsLayout)
+        mass2InputsLayout.addLayout(mass2ZValsLayout)
         # Clear Mass 2 parameters button
         mass2ClearBtn = QPushButton("Clear Mass 2 Parameters")
         mass2ClearBtn.setObjectName(mass2ClearBtnName)
-        mass2ClearBtn.setMinimumWidth(buttonMinWidth)
-        mass2ClearBtn.setMinimumHeight(buttonMinHeight)
+        mass2ClearBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         mass2ClearBtn.clicked.connect(self.ClearMass2Params)
-        mass2ParamLayout.addWidget(mass2ClearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
+        mass2InputsLayout.addWidget(mass2ClearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
+        # Mass 2 inputs container, DefaultState, DisableFields, and EnableFields switch it as one widget
+        self.mass2Inputs = QWidget()
+        self.mass2Inputs.setLayout(mass2InputsLayout)
+        mass2ParamLayout.addWidget(self.mass2Inputs)
         # Randomize Mass 2 parameters button
         mass2RandBtn = QPushButton("Random Mass 2 Parameters")
         mass2RandBtn.setObjectName(mass2RandBtnName)
-        mass2RandBtn.setMinimumWidth(buttonMinWidth)
-        mass2RandBtn.setMinimumHeight(buttonMinHeight)
-        mass2RandBtn.clicked.connect(self.RandomMass2)
+        mass2RandBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
+        mass2RandBtn.clicked.connect(lambda: self.RandomMass(1))
         mass2ParamLayout.addWidget(mass2RandBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Mass 2 parameters spacer
         mass2Spacer = QSpacerItem(0, 10, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -1734,38 +1390,19 @@ class TwoBodyWindow(QWidget):
         # Plot selection header
         plotSelHeader = QLabel("Select Plot(s)")
         plotSelLayout.addWidget(plotSelHeader, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 2D Position plot checkbox
-        plotSelPosPlot2DCB = QCheckBox("2D Position Plot")
-        plotSelPosPlot2DCB.setObjectName(pos2DPlotCBName)
-        plotSel2DCBLayout.addWidget(plotSelPosPlot2DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 2D Position animation checkbox
-        plotSelPosAni2DCB = QCheckBox("2D Position Animation")
-        plotSelPosAni2DCB.setObjectName(pos2DAniCBName)
-        plotSel2DCBLayout.addWidget(plotSelPosAni2DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 2D Velocity plot checkbox
-        plotSelPosVel2DCB = QCheckBox("2D Velocity Plot")
-        plotSelPosVel2DCB.setObjectName(vel2DPlotCBName)
-        plotSel2DCBLayout.addWidget(plotSelPosVel2DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 2D Velocity animation checkbox
-        plotSelVelAni2DCB = QCheckBox("2D Velocity Animation")
-        plotSelVelAni2DCB.setObjectName(vel2DAniCBName)
-        plotSel2DCBLayout.addWidget(plotSelVelAni2DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 3D Position plot checkbox
-        plotSelPosPlot3DCB = QCheckBox("3D Position Plot")
-        plotSelPosPlot3DCB.setObjectName(pos3DPlotCBName)
-        plotSel3DCBLayout.addWidget(plotSelPosPlot3DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 3D Position animation checkbox
-        plotSelPosAni3DCB = QCheckBox("3D Position Animation")
-        plotSelPosAni3DCB.setObjectName(pos3DAniCBName)
-        plotSel3DCBLayout.addWidget(plotSelPosAni3DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 3D Velocity plot checkbox
-        plotSelPosVel3DCB = QCheckBox("3D Velocity Plot")
-        plotSelPosVel3DCB.setObjectName(vel3DPlotCBName)
-        plotSel3DCBLayout.addWidget(plotSelPosVel3DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## 3D Velocity animation checkbox
-        plotSelVelAni3DCB = QCheckBox("3D Velocity Animation")
-        plotSelVelAni3DCB.setObjectName(vel3DAniCBName)
-        plotSel3DCBLayout.addWidget(plotSelVelAni3DCB, alignment = Qt.AlignmentFlag.AlignHCenter)
+        ## Plot checkboxes, each with its label, name, and layout
+        plotSelCBs = [("2D Position Plot", pos2DPlotCBName, plotSel2DCBLayout),
+                      ("2D Position Animation", pos2DAniCBName, plotSel2DCBLayout),
+                      ("2D Velocity Plot", vel2DPlotCBName, plotSel2DCBLayout),
+                      ("2D Velocity Animation", vel2DAniCBName, plotSel2DCBLayout),
+                      ("3D Position Plot", pos3DPlotCBName, plotSel3DCBLayout),
+                      ("3D Position Animation", pos3DAniCBName, plotSel3DCBLayout),
+                      ("3D Velocity Plot", vel3DPlotCBName, plotSel3DCBLayout),
+                      ("3D Velocity Animation", vel3DAniCBName, plotSel3DCBLayout)]
+        for label, name, layout in plotSelCBs:
+            plotSelCB = QCheckBox(label)
+            plotSelCB.setObjectName(name)
+            layout.addWidget(plotSelCB, alignment = Qt.AlignmentFlag.AlignHCenter)
         ###################################
         ##### Plot selection axis
         ###################################
@@ -1842,22 +1479,19 @@ class TwoBodyWindow(QWidget):
         ## Select all checkboxes button
         plotSelAllBtn = QPushButton("Select All Plots")
         plotSelAllBtn.setObjectName(plotSelAllBtnName)
-        plotSelAllBtn.setMinimumWidth(buttonMinWidth)
-        plotSelAllBtn.setMinimumHeight(buttonMinHeight)
+        plotSelAllBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         plotSelAllBtn.clicked.connect(self.SelectAllPlots)
         plotSelBtnLayout.addWidget(plotSelAllBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Random all checkboxes button
         plotSelRandBtn = QPushButton("Random Plots")
         plotSelRandBtn.setObjectName(plotSelRandBtnName)
-        plotSelRandBtn.setMinimumWidth(buttonMinWidth)
-        plotSelRandBtn.setMinimumHeight(buttonMinHeight)
+        plotSelRandBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         plotSelRandBtn.clicked.connect(self.RandomPlots)
         plotSelBtnLayout.addWidget(plotSelRandBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Unselect all checkboxes button
         plotSelUnsBtn = QPushButton("Unselect All Plots")
         plotSelUnsBtn.setObjectName(plotSelUnsBtnName)
-        plotSelUnsBtn.setMinimumWidth(buttonMinWidth)
-        plotSelUnsBtn.setMinimumHeight(buttonMinHeight)
+        plotSelUnsBtn.setMinimumSize(buttonMinWidth, buttonMinHeight)
         plotSelUnsBtn.clicked.connect(self.UnselectAllPlots)
         plotSelBtnLayout.addWidget(plotSelUnsBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Add layouts to parent
@@ -1874,34 +1508,17 @@ class TwoBodyWindow(QWidget):
         # Main buttons header
         mainButtonsHeader = QLabel("Calculate / Clear All / Randomize All / Return Home")
         mainButtonsLayout.addWidget(mainButtonsHeader, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## Calculate button
-        calcBtn = QPushButton("Calculate")
-        calcBtn.setObjectName(calculateBtnName)
-        calcBtn.setMinimumWidth(buttonMinWidth - 50)
-        calcBtn.setMinimumHeight(buttonMinHeight)
-        calcBtn.clicked.connect(self.Calculate)
-        mainBtnLayout.addWidget(calcBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## Clear button
-        clearBtn = QPushButton("Clear All")
-        clearBtn.setObjectName(clearBtnName)
-        clearBtn.setMinimumWidth(buttonMinWidth - 50)
-        clearBtn.setMinimumHeight(buttonMinHeight)
-        clearBtn.clicked.connect(self.ClearAll)
-        mainBtnLayout.addWidget(clearBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## Random button
-        randomBtn = QPushButton("Random All")
-        randomBtn.setObjectName(randomBtnName)
-        randomBtn.setMinimumWidth(buttonMinWidth - 50)
-        randomBtn.setMinimumHeight(buttonMinHeight)
-        randomBtn.clicked.connect(self.RandomAll)
-        mainBtnLayout.addWidget(randomBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
-        ## Home button
-        homeBtn = QPushButton("Return Home")
-        homeBtn.setObjectName(homeBtnName)
-        homeBtn.setMinimumWidth(buttonMinWidth - 50)
-        homeBtn.setMinimumHeight(buttonMinHeight)
-        homeBtn.clicked.connect(self.ReturnHome)
-        mainBtnLayout.addWidget(homeBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
+        ## Main buttons, each with its label, name, and slot
+        mainBtns = [("Calculate", calculateBtnName, self.Calculate),
+                    ("Clear All", clearBtnName, self.ClearAll),
+                    ("Random All", randomBtnName, self.RandomAll),
+                    ("Return Home", homeBtnName, self.ReturnHome)]
+        for label, name, slot in mainBtns:
+            mainBtn = QPushButton(label)
+            mainBtn.setObjectName(name)
+            mainBtn.setMinimumSize(buttonMinWidth - 50, buttonMinHeight)
+            mainBtn.clicked.connect(slot)
+            mainBtnLayout.addWidget(mainBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Add layouts to parent
         mainButtonsLayout.addLayout(mainBtnLayout)
         # Main buttons spacer
@@ -1919,50 +1536,37 @@ class TwoBodyWindow(QWidget):
         mainLayout.addSpacerItem(mainSpacer)
         # Set layout
         self.setLayout(mainLayout)
+        # Find the children once, every later GrabChildren call returns these arrays
+        self.GrabChildren()
         # Default state
         self.DefaultState(8)
         # Connect signals function
         self.ConnectSignals()
 
-    """ IsNum - Checks to see if an input is able to be converted to a number
+    """ NewLineEdit - Creates a named line edit for the parameter fields
         Input:
-            string - String value that is trying to be converted to a float
+            name - Object name of the line edit, used by GrabChildren
+            placeholder - Placeholder text of the line edit
+            width - Minimum width of the line edit
+            height - Minimum height of the line edit
         Algorithm:
-            * Try the conversion, if it succeeds, return true
-            * Otherwise, return false
+            * Create the line edit
+            * Set its object name, minimum size, and placeholder text
         Output:
-            This function returns a boolean value for if a value has been successfully converted
+            lineEdit - The created line edit
     """
-    def IsNum(self, string):
-        # Attempt conversion
-        try:
-            float(string)
-            return True
-        except ValueError:
-            return False
+    def NewLineEdit(self, name, placeholder, width, height):
+        lineEdit = QLineEdit()
+        lineEdit.setObjectName(name)
+        lineEdit.setMinimumSize(width, height)
+        lineEdit.setPlaceholderText(placeholder)
+        return lineEdit
 
-    """ IsPositive - Checks if a number is positive
+    """ OnMassCBChange - Event handler for when a mass's combo box is changed
         Input:
-            value - Value that is being checked
+            mass - Index of the mass whose combo box changed, starting at 0
         Algorithm:
-            * If the value is non zero and positive, return True
-            * Otherwise, return False
-        Output:
-            This function returns a boolean value for if a number is positive
-    """
-    def IsPositive(self, value):
-        # Greater than zero
-        if (value > 0):
-            return True
-        # Less than or equal to zero
-        else:
-            return False
-
-    """ OnMass1CBChange - Event handler for when mass 1's checkbox is changed
-        Input:
-            This function does not have any unique input parameters
-        Algorithm:
-            * Grab the children from the window
+            * Grab the children of the mass from the window
             * Grab the current index of the combo box
             * If the combo box is set to 0
                 * Clear the parameters
@@ -1972,209 +1576,120 @@ class TwoBodyWindow(QWidget):
                     * Populate the fields with parameters for that object
                 * Otherwise
                     * Clear the line edits of the field
+                * Line edits are set with their signals blocked, skipping those that already hold the text
         Output:
             This function does not return a value
     """
-    def OnMass1CBChange(self):
-        # Grab children
-        children = self.GrabChildren()
+    def OnMassCBChange(self, mass):
+        # Grab children of the mass and its field, each mass field is followed by its coordinate field
+        children = self.GrabChildren()[mass]
+        field = 2 * mass
         # Current index
-        currentIndex = children[0][0].currentIndex()
+        currentIndex = children[0].currentIndex()
         # Combo box set to 0
         if (currentIndex == 0):
-            self.ClearMass1Params()
-            self.DefaultState(0)
+            (self.ClearMass1Params, self.ClearMass2Params)[mass]()
+            self.DefaultState(field)
         # Otherwise 
         else:
-            self.EnableFields(0)
-            children[0][1].setText(str(cbItems[currentIndex]))
+            self.EnableFields(field)
+            # Populate the line edits with their signals blocked, the combo box runs the signals member function
+            self.SetText(children[1:2], [cbItems[currentIndex]])
             if (currentIndex != 1):
-                children[0][2].setText(str(MASSESARR[currentIndex - 2]))
-                children[0][3].setText(str(POSMATRIX[currentIndex - 2][0]))
-                children[0][4].setText(str(POSMATRIX[currentIndex - 2][1]))
-                children[0][5].setText(str(POSMATRIX[currentIndex - 2][2]))
-                children[0][6].setText(str(VELMATRIX[currentIndex - 2][0]))
-                children[0][7].setText(str(VELMATRIX[currentIndex - 2][1]))
-                children[0][8].setText(str(VELMATRIX[currentIndex - 2][2]))
+                self.SetText(children[2:9], cbParams[currentIndex - 2])
             else:
-                for widget in children[0][2:9]:
-                    widget.setText("")
-
-    """ OnMass2CBChange - Event handler for when mass 2's checkbox is changed
-        Input:
-            This function does not have any unique input parameters
-        Algorithm:
-            * Grab the children from the window
-            * Grab the current index of the combo box
-            * If the combo box is set to 0
-                * Clear the parameters
-                * Return the field to its default state
-            * Otherwise
-                * If the combo box is set to anything but 1
-                    * Populate the fields with parameters for that object
-                * Otherwise
-                    * Clear the line edits of the field
-        Output:
-            This function does not return a value
-    """
-    def OnMass2CBChange(self):
-        # Grab children
-        children = self.GrabChildren()
-        # Current index
-        currentIndex = children[1][0].currentIndex()
-        # Combo box set to 0
-        if (currentIndex == 0):
-            self.ClearMass2Params()
-            self.DefaultState(2)
-        # Otherwise 
-        else:
-            self.EnableFields(2)
-            children[1][1].setText(str(cbItems[currentIndex]))
-            if (currentIndex != 1):
-                children[1][2].setText(str(MASSESARR[currentIndex - 2]))
-                children[1][3].setText(str(POSMATRIX[currentIndex - 2][0]))
-                children[1][4].setText(str(POSMATRIX[currentIndex - 2][1]))
-                children[1][5].setText(str(POSMATRIX[currentIndex - 2][2]))
-                children[1][6].setText(str(VELMATRIX[currentIndex - 2][0]))
-                children[1][7].setText(str(VELMATRIX[currentIndex - 2][1]))
-                children[1][8].setText(str(VELMATRIX[currentIndex - 2][2]))
-            else:
-                for widget in children[1][2:9]:
-                    widget.setText("")
+                self.SetText(children[2:9], [""] * 7)
 
     """ RandomAll - Randomizes all input fields
         Input:
             This function does not have any unique input parameters
         Algorithm:
-            * Call member functions
+            * Call member functions, each starts the signals timer so the signals member function runs once
         Output:
             This function does not return a value
     """
     def RandomAll(self):
         # Member functions
-        self.RandomMass1()
-        self.RandomMass2()
+        self.RandomMass(0)
+        self.RandomMass(1)
         self.RandomTime()
         self.RandomPlots()
 
-    """ RandomMass1 - Randomizes the mass 1 parameters
-        Input:
-            This function does not have any unique input parameters
-        Algorithm:
-            * Grab children from the window
-            * Generate a random index for the combo box
-            * If the object is not the arbitrary object
-                * Set the combo box to the random index
-            * Otherwise
-                * Randomize values for arbitrary object
-        Output:
-            This function does not return a value
-    """
-    def RandomMass1(self):
-        # Grab children
-        children = self.GrabChildren()
-        # Generate random number
-        randIndex = random.randint(1,12)
-        # Not arbitrary object
-        if (randIndex != 1):
-            children[0][0].setCurrentIndex(randIndex)
-        # Arbitrary object
-        elif (randIndex == 1):
-            children[0][0].setCurrentIndex(randIndex)
-            randomMass = round(random.uniform(0.01 * MPLUTO, random.uniform(1, 1e10) * random.choice(MASSESARR)),2)
-            randomXPos = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(POSMATRIX[1:][1])),2)
-            randomYPos = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(POSMATRIX[1:][1])),2)
-            randomZPos = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(POSMATRIX[1:][1])),2)
-            randomXVel = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(VELMATRIX[1:][1])),2)
-            randomYVel = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(VELMATRIX[1:][1])),2)
-            randomZVel = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(VELMATRIX[1:][1])),2)
-            randomArr = [randomMass, randomXPos, randomYPos, randomZPos, randomXVel, randomYVel, randomZVel]
-            for i in range(len(randomArr)):
-                children[0][i + 2].setText(str(randomArr[i]))
-
-    """ RandomMass2 - Randomizes the mass 2 parameters
+    """ RandomMass - Randomizes the parameters of a mass
         Input:
-            This function does not have any unique input parameters
+            mass - Index of the mass to randomize, starting at 0
         Algorithm:
-            * Grab children from the window
+            * Grab children of the mass from the window
             * Generate a random index for the combo box
-            * If the object is not the arbitrary object
-                * Set the combo box to the random index
-            * Otherwise
+            * Set the combo box to the random index with its signals blocked and run its event handler
+            * If the object is the arbitrary object
                 * Randomize values for arbitrary object
+            * Start the signals timer, running the signals member function once
         Output:
             This function does not return a value
     """
-    def RandomMass2(self):
-        # Grab children
-        children = self.GrabChildren()
+    def RandomMass(self, mass):
+        # Grab children of the mass
+        children = self.GrabChildren()[mass]
         # Generate random number
-        randIndex = random.randint(1,12)
-        # Not arbitrary object
-        if (randIndex != 1):
-            children[1][0].setCurrentIndex(randIndex)
+        randIndex = int(self.rng.integers(1, 13))
+        # Set the combo box with its signals blocked and populate the field directly
+        with QSignalBlocker(children[0]):
+            children[0].setCurrentIndex(randIndex)
+        self.OnMassCBChange(mass)
         # Arbitrary object
-        elif (randIndex == 1):
-            children[1][0].setCurrentIndex(randIndex)
-            randomMass = round(random.uniform(0.01 * MPLUTO, random.uniform(1, 1e10) * random.choice(MASSESARR)),2)
-            randomXPos = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(POSMATRIX[1:][1])),2)
-            randomYPos = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(POSMATRIX[1:][1])),2)
-            randomZPos = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(POSMATRIX[1:][1])),2)
-            randomXVel = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(VELMATRIX[1:][1])),2)
-            randomYVel = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(VELMATRIX[1:][1])),2)
-            randomZVel = round(random.uniform(0, random.choice([-1,1]) * random.randint(1,20) * random.choice(VELMATRIX[1:][1])),2)
-            randomArr = [randomMass, randomXPos, randomYPos, randomZPos, randomXVel, randomYVel, randomZVel]
-            for i in range(len(randomArr)):
-                children[1][i + 2].setText(str(randomArr[i]))
+        if (randIndex == 1):
+            randomMass = round(float(self.rng.uniform(0.01 * MPLUTO, self.rng.uniform(1, 1e10) * self.rng.choice(MASSESARR))), 2)
+            # Random position and velocity, one draw per direction, scaled from the orbit of Venus
+            randomPos = np.round(self.rng.random(3) * self.rng.choice([-1, 1], 3) * self.rng.integers(1, 21, 3) * self.rng.choice(VENUSPOS, 3), 2)
+            randomVel = np.round(self.rng.random(3) * self.rng.choice([-1, 1], 3) * self.rng.integers(1, 21, 3) * self.rng.choice(VENUSVEL, 3), 2)
+            randomArr = [randomMass] + randomPos.tolist() + randomVel.tolist()
+            self.SetText(children[2:9], [str(value) for value in randomArr])
+        # Update the window once through the signals timer
+        self.signalsTimer.start()
 
     """ RandomPlots - Randomizes the checkboxes that get selected
         Input:
             This function does not have any unique input parameters
         Algorithm:
             * Grab children from window
-            * Generate random integers and append them to an array
-            * Check boxes based upon the modulo of a given random integer being zero
-            * Check if no boxes where checked
-                * If no boxes were checked, set a random checkbox to be checked
+            * Generate an array of random integers
+            * Mark boxes based upon the modulo of a given random integer being zero
+            * Check if no boxes where marked
+                * If no boxes were marked, mark a random checkbox
+            * Check the marked boxes
+            * Check random axis checkboxes
+            * Every checkbox is set with its signals blocked, start the signals timer once at the end
         Output:
             This function does not return a value
     """
     def RandomPlots(self):
         # Grab children
         children = self.GrabChildren()
-        # Random integers
-        randInts = []
-        for i in range(2,10):
-            randInts.append(random.randint(1,1000))
-        # Check boxes
-        self.UnselectAllPlots()
-        index = 0
-        boolArr = []
-        for widget in children[3][0:8]:
-            if (randInts[index] % (index + 2) == 0):
-                widget.setChecked(True)
-                boolArr.append(True)
-            else:
-                boolArr.append(False)
-            index += 1
+        # Random integers, plot i is checked when its integer is divisible by i + 2
+        randChecks = self.rng.integers(1, 1001, 8) % np.arange(2, 10) == 0
         # Check if all are false
-        allFalse = all(vals == False for vals in boolArr)
-        if (allFalse == True):
-            randIndex = random.randint(0,8)
-            children[3][randIndex].setChecked(True)
+        if (randChecks.any() == False):
+            randChecks[self.rng.integers(0, 8)] = True
+        # Check boxes with their signals blocked
+        self.SetChecked(children[3][0:8] + children[4], False)
+        for widget, randCheck in zip(children[3][0:8], randChecks):
+            if (randCheck == True):
+                with QSignalBlocker(widget):
+                    widget.setChecked(True)
         # Axis selection
-        no3DCB = all(isinstance(widget, QCheckBox) and widget.isChecked() == False for widget in children[3][4:8])
-        possibleIndices = [0,1,2,3]
-        randXIndex = random.choice(possibleIndices)
-        children[4][0 + randXIndex].setChecked(True)
-        possibleIndices.remove(randXIndex)
-        randYIndex = random.choice(possibleIndices)
-        possibleIndices.remove(randYIndex)
-        children[4][4 + randYIndex].setChecked(True)
+        no3DCB = not any(widget.isChecked() for widget in children[3][4:8])
+        # Three different directions in one draw
+        randXIndex, randYIndex, randZIndex = self.rng.permutation(4)[0:3].tolist()
+        with QSignalBlocker(children[4][0 + randXIndex]):
+            children[4][0 + randXIndex].setChecked(True)
+        with QSignalBlocker(children[4][4 + randYIndex]):
+            children[4][4 + randYIndex].setChecked(True)
         if (no3DCB == False):
-            randZIndex = random.choice(possibleIndices)
-            possibleIndices.remove(randZIndex)
-            children[4][8 + randZIndex].setChecked(True)
+            with QSignalBlocker(children[4][8 + randZIndex]):
+                children[4][8 + randZIndex].setChecked(True)
+        # Update the window once through the signals timer
+        self.signalsTimer.start()
 
     """ RandomTime - Randomizes the time span
         Input:
@@ -2188,7 +1703,7 @@ class TwoBodyWindow(QWidget):
         # Grab children
         children = self.GrabChildren()
         # Generate random value
-        randTime = round(random.uniform(0, 1000), 2)
+        randTime = round(float(self.rng.uniform(0, 1000)), 2)
         # Set random time
         children[2][0].setText(str(randTime))
 
@@ -2210,16 +1725,86 @@ class TwoBodyWindow(QWidget):
             This function does not have any unique input parameters
         Algorithm:
             * Grab children from window
-            * Set all checkboxes to checked
+            * Set all checkboxes to checked with their signals blocked
+            * If any checkbox changed, run the signals member function once
         Output:
             This function does not return a value
     """
     def SelectAllPlots(self):
         # Grab children
         children = self.GrabChildren()
-        # Select all plots
-        for widget in children[3][0:8]:
-            widget.setChecked(True)
+        # Select all plots with their signals blocked, then update the window once
+        if (self.SetChecked(children[3][0:8], True) == True):
+            self.Signals()
+
+    """ SetChecked - Checks or unchecks checkboxes with their signals blocked
+        Input:
+            widgets - Checkboxes to set
+            checked - True to check the checkboxes, False to uncheck them
+        Algorithm:
+            * Turn off window updates
+            * Iterate over the checkboxes whose state differs
+                * Set the state with the signals of the checkbox blocked
+            * Restore window updates, repainting once
+        Output:
+            changed - True if any checkbox changed state, the caller then runs the signals member function once
+    """
+    def SetChecked(self, widgets, checked):
+        # Hold repaints until every checkbox is set, keeping the state of an outer call
+        updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        # Set checkboxes
+        changed = False
+        for widget in widgets:
+            if (widget.isChecked() != checked):
+                changed = True
+                with QSignalBlocker(widget):
+                    widget.setChecked(checked)
+        # Repaint once
+        self.setUpdatesEnabled(updates)
+        return changed
+
+    """ SetFieldsEnabled - Enables or disables the widgets of a field, shared by DefaultState, DisableFields, and EnableFields
+        Input:
+            field - Field number, as in FieldWidgets
+            enabled - True to enable the widgets, False to disable them
+        Algorithm:
+            * Turn off window updates
+            * Look up the widgets of the field in the field table
+            * Set every widget enabled or disabled
+            * Restore window updates, repainting once
+        Output:
+            This function does not return a value
+    """
+    def SetFieldsEnabled(self, field, enabled):
+        # Hold repaints until every widget is set, keeping the state of an outer call
+        updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        # Set fields
+        for widget in self.FieldWidgets()[field]:
+            widget.setEnabled(enabled)
+        # Repaint once
+        self.setUpdatesEnabled(updates)
+
+    """ SetText - Sets the text of line edits with their signals blocked
+        Input:
+            widgets - Line edits to set
+            texts - Text for each line edit
+        Algorithm:
+            * Iterate over the line edits whose text differs
+                * Set the text with the signals of the line edit blocked
+        Output:
+            changed - True if any line edit changed text
+    """
+    def SetText(self, widgets, texts):
+        # Set line edits
+        changed = False
+        for widget, text in zip(widgets, texts):
+            if (widget.text() != text):
+                changed = True
+                with QSignalBlocker(widget):
+                    widget.setText(text)
+        return changed
 
     """ Signals - Checks for specific conditions of line edits and combo boxes
         Input:
@@ -2239,14 +1824,14 @@ class TwoBodyWindow(QWidget):
         # Check for combo boxes
         mass1ComboBox = children[0][0].currentIndex() != 0
         mass2ComboBox = children[1][0].currentIndex() != 0
-        mass1Params = all(isinstance(widget, QLineEdit) and widget.text() != "" for widget in children[0][1:9])
-        mass2Params = all(isinstance(widget, QLineEdit) and widget.text() != "" for widget in children[1][1:9])
+        mass1Params = all(widget.text() != "" for widget in children[0][1:9])
+        mass2Params = all(widget.text() != "" for widget in children[1][1:9])
         timeVals = children[2][0].text() != ""
-        plotSelectionCB = any(isinstance(widget, QCheckBox) and widget.isChecked() == True for widget in children[3][0:8])
-        no3DCB = all(isinstance(widget, QCheckBox) and widget.isChecked() == False for widget in children[3][4:8])
-        xAxisCB = any(isinstance(widget, QCheckBox) and widget.isChecked() == True for widget in children[4][0:4])
-        yAxisCB = any(isinstance(widget, QCheckBox) and widget.isChecked() == True for widget in children[4][4:8])
-        zAxisCB = any(isinstance(widget, QCheckBox) and widget.isChecked() == True for widget in children[4][8:12])
+        plotSelectionCB = any(widget.isChecked() for widget in children[3][0:8])
+        no3DCB = not any(widget.isChecked() for widget in children[3][4:8])
+        xAxisCB = any(widget.isChecked() for widget in children[4][0:4])
+        yAxisCB = any(widget.isChecked() for widget in children[4][4:8])
+        zAxisCB = any(widget.isChecked() for widget in children[4][8:12])
         # Enable time values
         if (mass1ComboBox == True or mass2ComboBox == True):
             self.EnableFields(1)
@@ -2330,16 +1915,14 @@ class TwoBodyWindow(QWidget):
             This function does not have any unique input parameters
         Algorithm:
             * Grab children from window
-            * Clear all checkboxes
+            * Clear all checkboxes with their signals blocked
+            * If any checkbox changed, run the signals member function once
         Output:
             This function does not return a value
     """
     def UnselectAllPlots(self):
         # Grab children
         children = self.GrabChildren()
-        # Unselect all plots
-        for widget in children[3][0:8]:
-            widget.setChecked(False)
-        # Unselect all axis
-        for widget in children[4]:
-            widget.setChecked(False)
\ No newline at end of file
+        # Unselect all plots and axis with their signals blocked, then update the window once
+        if (self.SetChecked(children[3][0:8] + children[4], False) == True):
+            self.Signals()
@@ -30,8 +30,7 @@ class MainWindow(QMainWindow):
         # Title of window
         self.setWindowTitle("Celestial Bodies")
         # Height and width of window
-        self.setMinimumWidth(800)
-        self.setMinimumHeight(500)
+        self.setMinimumSize(800, 500)
         self.projWindow = None
         self.twoBWindow = None
         self.threeBWindow = None
@@ -49,22 +48,19 @@ class MainWindow(QMainWindow):
         ## Projectile motion button
         pmBtn = QPushButton("Projectile Motion")
         pmBtn.setObjectName(pmButtonName)
-        pmBtn.setMinimumWidth(minBtnWidth)
-        pmBtn.setMinimumHeight(minBtnHeight)
+        pmBtn.setMinimumSize(minBtnWidth, minBtnHeight)
         pmBtn.clicked.connect(self.OpenProjectileMotionWindow)
         mainLayout.addWidget(pmBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Two body button
         twoBtn = QPushButton("Two Body")
         twoBtn.setObjectName(twoButtonName)
-        twoBtn.setMinimumWidth(minBtnWidth)
-        twoBtn.setMinimumHeight(minBtnHeight)
+        twoBtn.setMinimumSize(minBtnWidth, minBtnHeight)
         twoBtn.clicked.connect(self.OpenTwoBodyWindow)
         mainLayout.addWidget(twoBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         ## Three body button
         threeBtn = QPushButton("Three Body")
         threeBtn.setObjectName(threeButtonName)
-        threeBtn.setMinimumWidth(minBtnWidth)
-        threeBtn.setMinimumHeight(minBtnHeight)
+        threeBtn.setMinimumSize(minBtnWidth, minBtnHeight)
         threeBtn.clicked.connect(self.OpenThreeBodyWindow)
         mainLayout.addWidget(threeBtn, alignment = Qt.AlignmentFlag.AlignHCenter)
         # Spacer after the button